@@ -1,7 +1,6 @@
 import sys
 import time
 import random
-import re
 import threading
 import subprocess
 import os
@@ -30,6 +29,13 @@ from selenium.common.exceptions import (
 )
 from selenium.webdriver.common.action_chains import ActionChains
 
+# 소스 트리에서는 서이추 리뉴얼/naver_core.py, 앱 번들에서는 같은 폴더(Resources)에 복사된 naver_core.py를 쓴다
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "서이추 리뉴얼"))
+from naver_core import (
+    BLOG_ID_BLACKLIST, BLOG_LINKS_JS, Outcome, classify_popup, extract_ids, is_candidate_id, is_day_limit_page,
+    is_error_page, is_logged_in_page,
+)
+
 # =============================================================================
 # [Logic] 서이추 봇 핵심 로직 (seoichu_BackGround.py 통합)
 # =============================================================================
@@ -250,7 +256,7 @@ class NaverBotLogic:
             if "nidlogin" in current_url or "login" in current_url.lower():
                 return False
             
-            if "글쓰기" in page_source or "write" in page_source.lower():
+            if is_logged_in_page(page_source):
                 return True
             
             cookies = self.driver.get_cookies()
@@ -359,7 +365,6 @@ class NaverBotLogic:
     def collect_blog_ids(self, processed_ids):
         """블로그 ID 수집"""
         queue = []
-        blacklist = {"myblog", "postlist", "buddyaddform", "likeit", "nvisitor", "blog", "domainid", "admin", "search"}
         my_id_clean = self.my_blog_id.strip().lower()
         
         scroll_attempts = 0
@@ -371,33 +376,15 @@ class NaverBotLogic:
             
             new_count = 0
             try:
-                all_links = self.driver.find_elements(By.TAG_NAME, "a")
+                all_links = self.driver.execute_script(BLOG_LINKS_JS) or []
                 
-                for link in all_links:
-                    try:
-                        href = link.get_attribute("href")
-                        if not href or "blog.naver.com" not in href:
-                            continue
-                        
-                        match = re.search(r'blog\.naver\.com\/([a-zA-Z0-9_-]+)', href)
-                        if not match:
-                            continue
-                        
-                        bid = match.group(1)
-                        bid_lower = bid.lower()
-                        
-                        if bid_lower in blacklist or bid_lower == my_id_clean:
-                            continue
-                        if bid in processed_ids or len(bid) <= 3:
-                            continue
-                        if bid in queue or bid.isdigit():
-                            continue
-                        
-                        queue.append(bid)
-                        processed_ids.add(bid)
-                        new_count += 1
-                    except:
+                for bid in extract_ids(all_links):
+                    # 대기열에 넣은 ID는 processed_ids에도 들어가므로 queue는 다시 찾지 않는다
+                    if bid in processed_ids or bid.lower() == my_id_clean or not is_candidate_id(bid):
                         continue
+                    queue.append(bid)
+                    processed_ids.add(bid)
+                    new_count += 1
             except:
                 pass
             
@@ -448,7 +435,7 @@ class NaverBotLogic:
             self.safe_sleep(0.3)  # 1.0 -> 0.3으로 단축
 
             src_after = driver.page_source
-            if "하루에 신청 가능한 이웃수" in src_after and "초과" in src_after:
+            if is_day_limit_page(src_after):
                 try:
                     close_btn = driver.find_element(By.XPATH, "//button[contains(text(), '닫기')]")
                     self.safe_click(driver, close_btn)
@@ -478,15 +465,16 @@ class NaverBotLogic:
             """)
             
             if layer_popup:
-                if "하루" in layer_popup and "초과" in layer_popup:
+                popup = classify_popup(layer_popup)
+                if popup == Outcome.DAY_LIMIT:
                     return "DONE_DAY_LIMIT", "🎉 일일 한도 달성!"
-                if "선택 그룹" in layer_popup:
+                if popup == Outcome.GROUP_FULL:
                     return "STOP_GROUP_FULL", layer_popup
                 try:
                     driver.execute_script("document.getElementById('_alertLayerClose').click();")
                 except:
                     pass
-                if "5,000" in layer_popup or "5000" in layer_popup:
+                if popup == Outcome.FULL:
                     return False, "스킵(상대 5000명)"
                 return False, f"스킵({layer_popup[:20]})"
 
@@ -558,15 +546,16 @@ class NaverBotLogic:
             """)
             
             if final_popup:
-                if "하루" in final_popup and "초과" in final_popup:
+                popup = classify_popup(final_popup)
+                if popup == Outcome.DAY_LIMIT:
                     return "DONE_DAY_LIMIT", "🎉 일일 한도 달성!"
-                if "선택 그룹" in final_popup:
+                if popup == Outcome.GROUP_FULL:
                     return "STOP_GROUP_FULL", final_popup
                 try:
                     driver.execute_script("document.getElementById('_alertLayerClose').click();")
                 except:
                     pass
-                if "5,000" in final_popup or "5000" in final_popup:
+                if popup == Outcome.FULL:
                     return False, "스킵(상대 5000명)"
                 return False, f"실패({final_popup[:20]})"
 
@@ -576,11 +565,12 @@ class NaverBotLogic:
                 txt = alert.text
                 alert.accept()
                 
-                if "하루" in txt and "초과" in txt:
+                popup = classify_popup(txt)
+                if popup == Outcome.DAY_LIMIT:
                     return "DONE_DAY_LIMIT", txt
-                if "선택 그룹" in txt:
+                if popup == Outcome.GROUP_FULL:
                     return "STOP_GROUP_FULL", txt
-                if "5,000" in txt or "5000" in txt:
+                if popup == Outcome.FULL:
                     return False, "스킵(상대 5000명)"
                 if "신청" in txt or "완료" in txt:
                     return True, "신청 완료"
@@ -764,8 +754,7 @@ class NaverBotLogic:
                 self.log(f"   ✅ {len(queue)}명 수집 완료!")
 
             blog_id = queue.pop(0)
-            blacklist = {"myblog", "postlist", "buddyaddform", "likeit", "nvisitor", "blog", "domainid", "admin", "search"}
-            if blog_id.lower() == self.my_blog_id.lower() or blog_id.lower() in blacklist:
+            if blog_id.lower() == self.my_blog_id.lower() or blog_id.lower() in BLOG_ID_BLACKLIST:
                 continue
 
             self.log(f"\n▶️ [{self.current_count+1}/{self.target_count}] '{blog_id}' 작업 시작")
@@ -802,7 +791,7 @@ class NaverBotLogic:
             current_url = self.driver.current_url
             page_source = self.driver.page_source
             
-            if "MobileErrorView" in current_url or "일시적인 오류" in page_source:
+            if is_error_page(current_url, page_source):
                 self.log(f"   ❌ 접근 불가 블로그 (Skip)")
                 try:
                     if len(self.driver.window_handles) > 1:
@@ -17,6 +17,8 @@ mkdir -p "$RESOURCES_DIR"
 
 # Python 스크립트 복사
 cp NaverNeighborPro_GUI.py "$RESOURCES_DIR/"
+# 공유 규칙 모듈: 번들 안에서는 스크립트와 같은 Resources 폴더에서 import된다
+cp "서이추 리뉴얼/naver_core.py" "$RESOURCES_DIR/"
 
 # Launcher 스크립트 생성
 cat > "$MACOS_DIR/${APP_NAME}" << 'EOF'
@@ -1,6 +1,5 @@
 import time
 import random
-import re
 import subprocess
 import os
 import platform
@@ -16,11 +15,16 @@ from selenium.common.exceptions import (
     TimeoutException, 
     UnexpectedAlertPresentException,
     NoSuchElementException,
-    StaleElementReferenceException,
     WebDriverException
 )
 from selenium.webdriver.common.action_chains import ActionChains
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "서이추 리뉴얼"))
+from naver_core import (
+    BLOG_ID_BLACKLIST, BLOG_LINKS_JS, Outcome, classify_popup, extract_ids, is_candidate_id, is_day_limit_page,
+    is_error_page, is_logged_in_page,
+)
+
 # ==========================================
 # [사용자 설정]
 # ==========================================
@@ -296,7 +300,7 @@ def check_login_status(driver):
             return False
         
         # 3. "글쓰기" 버튼이 보이면 로그인 상태 (내 블로그에서만 보임)
-        if "글쓰기" in page_source or "write" in page_source.lower():
+        if is_logged_in_page(page_source):
             log("   └ 내 블로그에서 글쓰기 버튼 확인됨")
             return True
         
@@ -401,7 +405,7 @@ def process_neighbor(driver, blog_id):
         src_after = driver.page_source
         
         # 일일 한도 초과
-        if "하루에 신청 가능한 이웃수" in src_after and "초과" in src_after:
+        if is_day_limit_page(src_after):
             try:
                 close_btn = driver.find_element(By.XPATH, "//button[contains(text(), '닫기')]")
                 safe_click(driver, close_btn)
@@ -433,9 +437,10 @@ def process_neighbor(driver, blog_id):
         """)
         
         if layer_popup:
-            if "하루" in layer_popup and "초과" in layer_popup:
+            popup = classify_popup(layer_popup)
+            if popup == Outcome.DAY_LIMIT:
                 return "DONE_DAY_LIMIT", "🎉 일일 한도 달성!"
-            if "선택 그룹" in layer_popup:
+            if popup == Outcome.GROUP_FULL:
                 return "STOP_GROUP_FULL", layer_popup
             
             try:
@@ -443,7 +448,7 @@ def process_neighbor(driver, blog_id):
             except:
                 pass
             
-            if "5,000" in layer_popup or "5000" in layer_popup:
+            if popup == Outcome.FULL:
                 return False, "스킵(상대 5000명)"
             return False, f"스킵({layer_popup[:20]})"
 
@@ -538,9 +543,10 @@ def process_neighbor(driver, blog_id):
         """)
         
         if final_popup:
-            if "하루" in final_popup and "초과" in final_popup:
+            popup = classify_popup(final_popup)
+            if popup == Outcome.DAY_LIMIT:
                 return "DONE_DAY_LIMIT", "🎉 일일 한도 달성!"
-            if "선택 그룹" in final_popup:
+            if popup == Outcome.GROUP_FULL:
                 return "STOP_GROUP_FULL", final_popup
             
             try:
@@ -548,7 +554,7 @@ def process_neighbor(driver, blog_id):
             except:
                 pass
             
-            if "5,000" in final_popup or "5000" in final_popup:
+            if popup == Outcome.FULL:
                 return False, "스킵(상대 5000명)"
             return False, f"실패({final_popup[:20]})"
 
@@ -559,11 +565,12 @@ def process_neighbor(driver, blog_id):
             txt = alert.text
             alert.accept()
             
-            if "하루" in txt and "초과" in txt:
+            popup = classify_popup(txt)
+            if popup == Outcome.DAY_LIMIT:
                 return "DONE_DAY_LIMIT", txt
-            if "선택 그룹" in txt:
+            if popup == Outcome.GROUP_FULL:
                 return "STOP_GROUP_FULL", txt
-            if "5,000" in txt or "5000" in txt:
+            if popup == Outcome.FULL:
                 return False, "스킵(상대 5000명)"
             if "신청" in txt or "완료" in txt:
                 return True, "신청 완료"
@@ -704,7 +711,7 @@ def process_comment(driver, blog_id):
 # ==========================================
 # ID 수집 로직 (블로그 탭 클릭 추가)
 # ==========================================
-def collect_blog_ids(driver, processed_ids, my_id_clean, blacklist, search_url):
+def collect_blog_ids(driver, processed_ids, my_id_clean, search_url):
     """검색 결과에서 블로그 ID 수집 - 블로그 탭 클릭 후 수집"""
     queue = []
     
@@ -770,48 +777,17 @@ def collect_blog_ids(driver, processed_ids, my_id_clean, blacklist, search_url):
         # 🔧 [핵심 수정] 모든 a 태그에서 링크 수집 (원본 방식)
         new_count = 0
         try:
-            # 방법 1: 모든 a 태그 검색 (가장 포괄적)
-            all_links = driver.find_elements(By.TAG_NAME, "a")
+            # 모든 a 태그를 페이지 안에서 한 번에 검사 (가장 포괄적)
+            all_links = driver.execute_script(BLOG_LINKS_JS) or []
             
-            for link in all_links:
-                try:
-                    href = link.get_attribute("href")
-                    if not href:
-                        continue
-                    
-                    # blog.naver.com 링크만 필터링
-                    if "blog.naver.com" not in href:
-                        continue
-                    
-                    # 블로그 ID 추출 (여러 패턴 지원)
-                    match = re.search(r'blog\.naver\.com\/([a-zA-Z0-9_-]+)', href)
-                    if not match:
-                        continue
-                    
-                    bid = match.group(1)
-                    bid_lower = bid.lower()
-                    
-                    # 필터링: 시스템 경로 제외
-                    if bid_lower in blacklist or bid_lower == my_id_clean:
-                        continue
-                    if bid in processed_ids:
-                        continue
-                    if len(bid) <= 3:  # 너무 짧은 ID 제외
-                        continue
-                    if bid in queue:  # 이미 큐에 있으면 스킵
-                        continue
-                    # 숫자로만 된 것 제외 (포스트 번호일 수 있음)
-                    if bid.isdigit():
-                        continue
-                    
-                    queue.append(bid)
-                    processed_ids.add(bid)
-                    new_count += 1
-                    
-                except StaleElementReferenceException:
-                    continue
-                except:
+            for bid in extract_ids(all_links):
+                # 필터링: 처리한 ID(큐에 넣은 ID 포함), 내 블로그, 시스템 경로/숫자/짧은 ID 제외
+                if bid in processed_ids or bid.lower() == my_id_clean or not is_candidate_id(bid):
                     continue
+                
+                queue.append(bid)
+                processed_ids.add(bid)
+                new_count += 1
         except Exception as e:
             log(f"   ⚠️ 링크 수집 오류: {str(e)[:30]}")
         
@@ -887,7 +863,6 @@ def main():
     
     # 설정 확인
     my_id_clean = MY_BLOG_ID.strip().lower()
-    blacklist = {"myblog", "postlist", "buddyaddform", "likeit", "nvisitor", "blog", "domainid", "admin", "search"}
     search_url = f"https://search.naver.com/search.naver?where=blog&query={SEARCH_KEYWORD}"
     
     log(f"📋 설정: 목표 {TARGET_COUNT}명 / 키워드 '{SEARCH_KEYWORD}' / 제외 '{MY_BLOG_ID}'")
@@ -920,7 +895,7 @@ def main():
                 log("❌ 메인 탭 접근 불가")
                 return
             
-            queue = collect_blog_ids(driver, processed_ids, my_id_clean, blacklist, search_url)
+            queue = collect_blog_ids(driver, processed_ids, my_id_clean, search_url)
             
             if not queue:
                 log("⚠️ 더 이상 수집할 블로그가 없습니다.")
@@ -928,7 +903,7 @@ def main():
                 log("   ↪ 페이지 새로고침 후 재시도...")
                 safe_get(driver, search_url)
                 safe_sleep(SLOW_WAIT)
-                queue = collect_blog_ids(driver, processed_ids, my_id_clean, blacklist, search_url)
+                queue = collect_blog_ids(driver, processed_ids, my_id_clean, search_url)
                 
                 if not queue:
                     log("⚠️ 최종 종료: 수집 가능한 블로그 없음")
@@ -940,7 +915,7 @@ def main():
         blog_id = queue.pop(0)
         
         # 필터링
-        if blog_id.lower() == my_id_clean or blog_id.lower() in blacklist:
+        if blog_id.lower() == my_id_clean or blog_id.lower() in BLOG_ID_BLACKLIST:
             continue
 
         log(f"\n▶️ [{success_cnt+1}/{TARGET_COUNT}] '{blog_id}' 작업 시작")
@@ -970,7 +945,7 @@ def main():
         current_url = driver.current_url
         page_source = driver.page_source
         
-        if "MobileErrorView" in current_url or "일시적인 오류" in page_source or "존재하지 않는" in page_source:
+        if is_error_page(current_url, page_source) or "존재하지 않는" in page_source:
             log(f"   ❌ 접근 불가/없는 블로그 (Skip)")
             close_current_tab_safely(driver, main_window)
             continue
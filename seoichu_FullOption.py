@@ -1,6 +1,7 @@
+import os
+import sys
 import time
 import random
-import re
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
@@ -11,6 +12,11 @@ from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.keys import Keys
 from selenium.common.exceptions import UnexpectedAlertPresentException
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "서이추 리뉴얼"))
+from naver_core import (
+    BLOG_ID_BLACKLIST, Outcome, classify_popup, extract_id, is_candidate_id, is_day_limit_page, is_error_page
+)
+
 # ==========================================
 # [사용자 설정]
 # ==========================================
@@ -79,7 +85,7 @@ def process_neighbor(driver, blog_id):
         src_after_click = driver.page_source
         
         # 스크린샷 텍스트: "하루에 신청 가능한 이웃수가 초과되어"
-        if "하루에 신청 가능한 이웃수" in src_after_click and "초과" in src_after_click:
+        if is_day_limit_page(src_after_click):
             # 깔끔한 종료를 위해 '닫기' 버튼 눌러주기 (선택사항)
             try:
                 close_btn = driver.find_element(By.XPATH, "//button[contains(text(), '닫기')]")
@@ -111,14 +117,15 @@ def process_neighbor(driver, blog_id):
         
         if layer_popup:
             # 구형 팝업에서도 하루 한도 초과가 뜰 수 있음
-            if "하루" in layer_popup and "초과" in layer_popup:
+            popup = classify_popup(layer_popup)
+            if popup == Outcome.DAY_LIMIT:
                  return "DONE_DAY_LIMIT", "🎉 일일 신청 한도(100명) 달성!"
             
-            if "선택 그룹" in layer_popup: 
+            if popup == Outcome.GROUP_FULL:
                 return "STOP_GROUP_FULL", layer_popup
             
             driver.execute_script("document.getElementById('_alertLayerClose').click();")
-            if "5,000" in layer_popup or "5000" in layer_popup:
+            if popup == Outcome.FULL:
                 return False, "스킵(상대방 5000명 초과)"
             
             return False, f"스킵({layer_popup})"
@@ -181,13 +188,14 @@ def process_neighbor(driver, blog_id):
             """)
             
             if final_layer_check:
-                if "하루" in final_layer_check and "초과" in final_layer_check:
+                popup = classify_popup(final_layer_check)
+                if popup == Outcome.DAY_LIMIT:
                     return "DONE_DAY_LIMIT", "🎉 일일 신청 한도(100명) 달성!"
-                if "선택 그룹" in final_layer_check:
+                if popup == Outcome.GROUP_FULL:
                     return "STOP_GROUP_FULL", final_layer_check
                 
                 driver.execute_script("document.getElementById('_alertLayerClose').click();")
-                if "5,000" in final_layer_check or "5000" in final_layer_check:
+                if popup == Outcome.FULL:
                     return False, "스킵(상대방 5000명 초과)"
                 return False, f"실패(팝업: {final_layer_check})"
 
@@ -200,11 +208,12 @@ def process_neighbor(driver, blog_id):
             txt = alert.text
             alert.accept()
             
-            if "하루" in txt and "초과" in txt:
+            popup = classify_popup(txt)
+            if popup == Outcome.DAY_LIMIT:
                 return "DONE_DAY_LIMIT", txt
-            if "선택 그룹" in txt and "초과" in txt:
+            if popup == Outcome.GROUP_FULL:
                 return "STOP_GROUP_FULL", txt
-            if "5,000" in txt or "5000" in txt:
+            if popup == Outcome.FULL:
                 return False, "스킵(상대방 5000명 초과)"
             
             if "신청" in txt or "완료" in txt: return True, "신청 완료"
@@ -354,7 +363,6 @@ def main():
     main_window = driver.current_window_handle
     
     my_id_clean = MY_BLOG_ID.strip().lower()
-    BLACKLIST = {"myblog", "postlist", "buddyaddform", "likeit", "nvisitor", "blog", "domainid", "admin"}
     
     print(f"📋 설정 확인: 타겟 {TARGET_COUNT}명 / 제외 ID '{MY_BLOG_ID}'", flush=True)
 
@@ -385,17 +393,11 @@ def main():
             found_count = 0
             for link in driver.find_elements(By.TAG_NAME, "a"):
                 try:
-                    href = link.get_attribute("href")
-                    if href and "blog.naver.com" in href:
-                        match = re.search(r'blog\.naver\.com\/([a-zA-Z0-9_-]+)', href)
-                        if match:
-                            bid = match.group(1)
-                            bid_l = bid.lower()
-                            if bid_l in BLACKLIST or bid_l == my_id_clean: continue
-                            if bid not in processed_ids and len(bid) > 3:
-                                queue.append(bid)
-                                processed_ids.add(bid)
-                                found_count += 1
+                    bid = extract_id(link.get_attribute("href"))
+                    if bid and bid.lower() != my_id_clean and bid not in processed_ids and is_candidate_id(bid):
+                        queue.append(bid)
+                        processed_ids.add(bid)
+                        found_count += 1
                 except: continue
             
             print(f"   ✅ {found_count}개의 새로운 ID 발견! (현재 대기열: {len(queue)}명)", flush=True)
@@ -406,7 +408,7 @@ def main():
 
         # [B] 작업 시작
         blog_id = queue.pop(0)
-        if blog_id.lower() == my_id_clean or blog_id.lower() in BLACKLIST: continue
+        if blog_id.lower() == my_id_clean or blog_id.lower() in BLOG_ID_BLACKLIST: continue
 
         print(f"\n▶️ [{success_cnt+1}/{TARGET_COUNT}] '{blog_id}' 작업 시작", flush=True)
         
@@ -430,7 +432,7 @@ def main():
         time.sleep(1.0)
 
         # 🚨 [MobileErrorView 처리 수정] - 여기가 문제였음
-        if "MobileErrorView" in driver.current_url or "일시적인 오류" in driver.page_source:
+        if is_error_page(driver.current_url, driver.page_source):
             print(f"   ❌ 접근 불가/차단된 블로그 (Skip)", flush=True)
             try:
                 # [핵심] 현재 탭이 메인 탭이 아닐 때만 닫는다!
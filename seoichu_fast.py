@@ -1,6 +1,7 @@
+import os
+import sys
 import time
 import random
-import re
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
@@ -8,6 +9,9 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "서이추 리뉴얼"))
+from naver_core import BLOG_LINKS_JS, Outcome, classify_popup, extract_ids, is_candidate_id
+
 # ==========================================
 # [User Settings]
 # ==========================================
@@ -28,19 +32,10 @@ def connect_debugger_driver():
 def extract_blog_ids(driver):
     ids = set()
     try:
-        # [Speed] Filter links via CSS Selector in the browser engine (much faster than Python loop)
+        # [Speed] Filter and dedupe links inside the page in one round trip
         driver.implicitly_wait(0.1)
-        links = driver.find_elements(By.CSS_SELECTOR, "a[href*='blog.naver.com']")
-        
-        for link in links:
-            try:
-                url = link.get_attribute("href")
-                # Regex extraction remains same
-                match = re.search(r'blog\.naver\.com\/([a-zA-Z0-9_-]+)', url)
-                if match:
-                    b_id = match.group(1)
-                    if len(b_id) > 3: ids.add(b_id)
-            except: continue
+        links = driver.execute_script(BLOG_LINKS_JS) or []
+        ids.update(b_id for b_id in extract_ids(links) if is_candidate_id(b_id))
     except: pass
     finally:
         driver.implicitly_wait(3) # Restore default wait
@@ -145,9 +140,10 @@ def process_neighbor_natural(driver, blog_id):
         
         alert_msg = check_alert(driver)
         if alert_msg:
+            popup = classify_popup(alert_msg)
+            if popup == Outcome.DAY_LIMIT or "100명" in alert_msg: return "DONE_DAY", "Limit Reached"
+            if popup == Outcome.FULL: return False, "Fail (Limit Reached)"
             if "신청" in alert_msg: return False, "Skip (In Progress)"
-            if "5000" in alert_msg or "초과" in alert_msg: return False, "Fail (Limit Reached)"
-            if "하루" in alert_msg or "100명" in alert_msg: return "DONE_DAY", "Limit Reached"
             return False, f"Skip ({alert_msg})"
 
         # 4. Wait for Form & Select Option (JS One-Shot)
@@ -212,7 +208,7 @@ def process_neighbor_natural(driver, blog_id):
         final_alert = check_alert(driver)
         if final_alert:
             if "완료" in final_alert or "보냈습니다" in final_alert: return True, "Success"
-            if "하루" in final_alert: return "DONE_DAY", "Daily Limit"
+            if classify_popup(final_alert) == Outcome.DAY_LIMIT: return "DONE_DAY", "Daily Limit"
             return False, f"Fail ({final_alert})"
 
         return True, "Success"
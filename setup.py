@@ -6,8 +6,12 @@ py2app은 macOS 전용으로 PyInstaller보다 더 나은 호환성을 제공합
 from setuptools import setup
 import py2app
 import os
+import sys
 import customtkinter
 
+# 공유 모듈(naver_core) 위치
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '서이추 리뉴얼'))
+
 # customtkinter assets 경로
 ct_path = os.path.dirname(customtkinter.__file__)
 assets_path = os.path.join(ct_path, 'assets')
@@ -33,6 +37,7 @@ OPTIONS = {
         'AppKit',
         'tkinter',
         'tkinter.messagebox',
+        'naver_core',
     ],
     'iconfile': None,
     'plist': {
@@ -1,6 +1,7 @@
+import os
+import sys
 import time
 import random
-import re
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
@@ -8,6 +9,9 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "서이추 리뉴얼"))
+from naver_core import Outcome, classify_popup, extract_id, is_candidate_id, is_error_page
+
 # ==========================================
 # [사용자 설정]
 # ==========================================
@@ -31,12 +35,8 @@ def extract_blog_ids(driver):
         links = driver.find_elements(By.TAG_NAME, "a")
         for link in links:
             try:
-                url = link.get_attribute("href")
-                if url and "blog.naver.com" in url:
-                    match = re.search(r'blog\.naver\.com\/([a-zA-Z0-9_-]+)', url)
-                    if match:
-                        b_id = match.group(1)
-                        if len(b_id) > 3: ids.add(b_id)
+                b_id = extract_id(link.get_attribute("href"))
+                if b_id and is_candidate_id(b_id): ids.add(b_id)
             except: continue
     except: pass
     finally:
@@ -126,7 +126,7 @@ def process_neighbor_natural(driver, blog_id):
         time.sleep(1.0) # 로딩 대기
 
         # 2. [차단 감지] 일시적인 오류 페이지인지 확인
-        if "MobileErrorView" in driver.current_url or "일시적인 오류" in driver.page_source:
+        if is_error_page(driver.current_url, driver.page_source):
             return "BLOCK_DETECTED", "차단 감지(일시적 오류)"
 
         # 3. 이미 이웃인지 확인
@@ -159,9 +159,10 @@ def process_neighbor_natural(driver, blog_id):
         
         alert_msg = check_alert(driver)
         if alert_msg:
+            popup = classify_popup(alert_msg)
+            if popup == Outcome.DAY_LIMIT or "100명" in alert_msg: return "DONE_DAY", "완료(한도달성)"
+            if popup == Outcome.FULL: return False, "실패(상대 정원 초과)"
             if "신청" in alert_msg: return False, "스킵(신청중)"
-            if "5000" in alert_msg or "초과" in alert_msg: return False, "실패(상대 정원 초과)"
-            if "하루" in alert_msg or "100명" in alert_msg: return "DONE_DAY", "완료(한도달성)"
             return False, f"스킵({alert_msg})"
 
         # --------------------------------------------------------
@@ -236,9 +237,10 @@ def process_neighbor_natural(driver, blog_id):
         final_alert = check_alert(driver)
         if final_alert:
             if "완료" in final_alert or "보냈습니다" in final_alert: return True, "성공"
-            if "그룹" in final_alert and "가득" in final_alert: return "STOP_ERROR", f"중단(그룹꽉참)"
-            if "하루" in final_alert or "100명" in final_alert: return "DONE_DAY", "완료(한도달성)"
-            if "5,000" in final_alert or "초과" in final_alert: return False, f"실패(상대 5000명 초과)"
+            popup = classify_popup(final_alert)
+            if popup == Outcome.GROUP_FULL or ("그룹" in final_alert and "가득" in final_alert): return "STOP_ERROR", f"중단(그룹꽉참)"
+            if popup == Outcome.DAY_LIMIT or "100명" in final_alert: return "DONE_DAY", "완료(한도달성)"
+            if popup == Outcome.FULL: return False, f"실패(상대 5000명 초과)"
             return False, f"실패(알림: {final_alert})"
 
         return True, "성공"
@@ -0,0 +1,301 @@
+"""봇의 순수 Python 핫패스 마이크로 벤치마크.
+
+실제 검색 결과와 비슷한 고정 입력(수천 개 링크, 중복/비블로그 링크 섞임, 결과 문구 분포, 수 MB 블로그 HTML)으로
+각 경로의 초당 실행 수와 1회 실행당 메모리 할당(tracemalloc 최대치)을 잰다.
+
+    python bench_hotpaths.py                  # 결과 표 출력
+    python bench_hotpaths.py --save-baseline  # 현재 결과를 기준값으로 저장
+    python bench_hotpaths.py --check          # 기준값보다 threshold 이상 느려지면 종료 코드 1
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import timeit
+import tracemalloc
+
+from candidate_queue import CandidateQueue
+from history_store import HistoryStore
+from naver_core import (
+    Outcome, append_blog_ids, classify_outcome, classify_popup, extract_ids, is_day_limit_page, is_error_page,
+    is_logged_in_page,
+)
+from negative_cache import NegativeCache
+from run_journal import DEFAULT_JOURNAL_DIR
+
+
+DEFAULT_BASELINE_PATH = os.path.join(DEFAULT_JOURNAL_DIR, "bench_baseline.json")
+
+CASES = {}
+
+
+def case(name):
+    """setup 함수 등록. setup은 고정 입력을 만든 뒤 측정할 무인자 함수를 반환한다."""
+    def _register(setup):
+        CASES[name] = setup
+        return setup
+    return _register
+
+
+# ----------------------------------------------------------------------
+# 고정 입력
+# ----------------------------------------------------------------------
+def _blog_id(rng):
+    alphabet = "abcdefghijklmnopqrstuvwxyz0123456789_-"
+    return "".join(rng.choice(alphabet) for _ in range(rng.randint(5, 14)))
+
+
+def search_page_links(count=2000, duplicate_ratio=0.3, seed=7):
+    """검색 결과 페이지의 href 목록: 블로그 홈/글/모바일 링크, 경로명, 다른 서비스 링크와 중복을 섞는다."""
+    rng = random.Random(seed)
+    ids = [_blog_id(rng) for _ in range(max(1, int(count * (1 - duplicate_ratio))))]
+    links = []
+    for _ in range(count):
+        bid = rng.choice(ids)
+        kind = rng.random()
+        if kind < 0.45:
+            links.append(f"https://blog.naver.com/{bid}")
+        elif kind < 0.7:
+            links.append(f"https://blog.naver.com/{bid}/22{rng.randint(10**9, 10**10 - 1)}")
+        elif kind < 0.8:
+            links.append(f"https://m.blog.naver.com/{bid}?tab=1")
+        elif kind < 0.85:
+            links.append(f"https://blog.naver.com/PostView.naver?blogId={bid}&logNo=1")
+        elif kind < 0.9:
+            links.append("https://blog.naver.com/" + rng.choice(("MyBlog.naver", "BuddyAddForm.naver", "1234")))
+        else:
+            links.append(f"https://{rng.choice(('cafe', 'news', 'shopping'))}.naver.com/{bid}")
+    return links
+
+
+RESULT_MESSAGES = (
+    (True, "신청 완료"),
+    (False, "스킵(이미 이웃)"),
+    (False, "스킵(이미 신청중)"),
+    (False, "스킵(서이추 비활성화)"),
+    (False, "스킵(서이추 불가)"),
+    (False, "스킵(상대 5000명)"),
+    (False, "접근 불가 블로그"),
+    (False, "스킵(버튼 없음)"),
+    (False, "실패(양식 없음)"),
+    (False, "에러: Message: stale elem"),
+    (False, "중단됨"),
+    ("DONE_DAY_LIMIT", "🎉 일일 한도 달성!"),
+)
+
+POPUP_TEXTS = (
+    "하루에 신청 가능한 이웃수가 초과되어 더 이상 이웃을 추가할 수 없습니다.",
+    "선택 그룹의 이웃수가 초과되어 이웃을 추가할 수 없습니다.",
+    "상대방의 이웃수가 5,000명을 초과하여 더 이상 이웃을 추가할 수 없습니다.",
+    "서로이웃 신청을 보냈습니다.",
+    "잠시 후 다시 시도해주세요.",
+)
+
+
+def blog_html(size_bytes=3 * 1024 * 1024, seed=9, marker=None):
+    """글 목록/댓글 블록을 반복해 size_bytes 정도로 만든 블로그 본문 HTML. marker는 끝부분에 넣는다."""
+    rng = random.Random(seed)
+    words = ("오늘", "맛집", "후기", "여행", "카페", "일상", "리뷰", "사진", "추천", "주말")
+    blocks = ['<!DOCTYPE html><html><head><meta charset="utf-8"><title>블로그</title></head><body>']
+    size = len(blocks[0].encode("utf-8"))
+    while size < size_bytes:
+        bid = _blog_id(rng)
+        text = " ".join(rng.choice(words) for _ in range(40))
+        block = (f'<div class="post"><a href="https://blog.naver.com/{bid}" class="link">{bid}</a>'
+                 f'<p class="se-text">{text}</p><span data-click-area="ebc.add">이웃추가</span></div>')
+        blocks.append(block)
+        size += len(block.encode("utf-8"))
+    if marker:
+        blocks.append(f"<div>{marker}</div>")
+    blocks.append("</body></html>")
+    return "".join(blocks)
+
+
+def _outcome_rows(ids, seed=11):
+    rng = random.Random(seed)
+    outcomes = (Outcome.SUCCESS, Outcome.ALREADY_NEIGHBOR, Outcome.DISABLED, Outcome.NO_BUTTON, Outcome.FAILED)
+    return [(bid, rng.choice(outcomes), 0) for bid in ids]
+
+
+# ----------------------------------------------------------------------
+# 측정 대상
+# ----------------------------------------------------------------------
+@case("links.extract_ids_2k")
+def _links_extract_ids():
+    links = search_page_links(2000)
+
+    def run():
+        extract_ids(links)
+    return run
+
+
+@case("links.extract_2k")
+def _links_extract():
+    links = search_page_links(2000)
+
+    def run():
+        append_blog_ids(links, CandidateQueue(exclude=("myblog_id",)))
+    return run
+
+
+@case("links.extract_10k_dupes")
+def _links_extract_dupes():
+    links = search_page_links(10000, duplicate_ratio=0.9)
+
+    def run():
+        append_blog_ids(links, CandidateQueue(exclude=("myblog_id",)))
+    return run
+
+
+@case("queue.prefiltered_2k")
+def _queue_prefiltered():
+    links = search_page_links(2000)
+    ids = [href.rstrip("/").split("/")[3].split("?")[0] for href in links if "blog.naver.com/" in href]
+    history = HistoryStore(":memory:")
+    for bid, outcome, _ in _outcome_rows(ids[::3]):
+        history.record(bid, outcome)
+    cache = NegativeCache()
+    cache.warm((bid, outcome, None) for bid, outcome, _ in _outcome_rows(ids[1::3], seed=12))
+
+    def run():
+        queue = CandidateQueue(exclude=("myblog_id",), prefilters=(history.filter_unseen, cache.filter))
+        queue.extend(ids)
+    return run
+
+
+@case("outcome.classify_1k")
+def _outcome_classify():
+    rng = random.Random(3)
+    rows = [rng.choice(RESULT_MESSAGES) for _ in range(1000)]
+
+    def run():
+        for result, message in rows:
+            classify_outcome(result, message)
+    return run
+
+
+@case("popup.classify_1k")
+def _popup_classify():
+    rng = random.Random(5)
+    texts = [rng.choice(POPUP_TEXTS) for _ in range(1000)]
+
+    def run():
+        for text in texts:
+            classify_popup(text)
+    return run
+
+
+# 구버전 진입점들이 driver.page_source(수 MB)에 대해 호출하는 판정 함수. 모두 없는 문구라 끝까지 훑는다
+@case("markers.error_page_3mb")
+def _markers_error_page():
+    html = blog_html()
+
+    def run():
+        return is_error_page("https://m.blog.naver.com/someone", html)
+    return run
+
+
+@case("markers.day_limit_3mb")
+def _markers_day_limit():
+    html = blog_html()
+
+    def run():
+        return is_day_limit_page(html)
+    return run
+
+
+@case("markers.login_check_3mb")
+def _markers_login_check():
+    html = blog_html()
+
+    def run():
+        return is_logged_in_page(html)
+    return run
+
+
+# ----------------------------------------------------------------------
+# 실행
+# ----------------------------------------------------------------------
+def measure(run, repeat=5):
+    """(초당 실행 수, 1회 실행당 최대 할당 바이트). 실행 시간은 repeat회 중 가장 빠른 값."""
+    timer = timeit.Timer(run)
+    number, _ = timer.autorange()
+    best = min(timer.repeat(repeat=repeat, number=number)) / number
+    tracemalloc.start()
+    try:
+        base, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        run()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return 1.0 / best, max(0, peak - base)
+
+
+def run_cases(pattern=None, repeat=5):
+    results = {}
+    for name, setup in CASES.items():
+        if pattern and pattern not in name:
+            continue
+        ops, peak = measure(setup(), repeat=repeat)
+        results[name] = {"ops_per_sec": ops, "peak_bytes": peak}
+    return results
+
+
+def compare(results, baseline, threshold):
+    """기준값 대비 threshold(비율) 넘게 느려진 항목 목록."""
+    regressions = []
+    for name, current in results.items():
+        base = baseline.get(name)
+        if not base or not base.get("ops_per_sec"):
+            continue
+        ratio = current["ops_per_sec"] / base["ops_per_sec"]
+        if ratio < 1.0 - threshold:
+            regressions.append((name, ratio))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="봇 핫패스 마이크로 벤치마크")
+    parser.add_argument("-k", "--filter", help="이름에 이 문자열이 들어간 항목만 실행")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE_PATH)
+    parser.add_argument("--save-baseline", action="store_true", help="현재 결과를 기준값으로 저장")
+    parser.add_argument("--check", action="store_true", help="기준값 대비 느려진 항목이 있으면 실패")
+    parser.add_argument("--threshold", type=float, default=0.25, help="허용 감속 비율 (0.25 = 25%%)")
+    args = parser.parse_args(argv)
+
+    results = run_cases(args.filter, repeat=args.repeat)
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+
+    print(f"{'항목':<26}{'ops/s':>12}{'us/op':>12}{'peak KB':>10}{'기준 대비':>10}")
+    for name, r in results.items():
+        base = baseline.get(name) or {}
+        delta = f"{r['ops_per_sec'] / base['ops_per_sec'] * 100:.0f}%" if base.get("ops_per_sec") else "-"
+        print(f"{name:<26}{r['ops_per_sec']:>12.1f}{1e6 / r['ops_per_sec']:>12.1f}"
+              f"{r['peak_bytes'] / 1024:>10.1f}{delta:>10}")
+
+    if args.save_baseline:
+        os.makedirs(os.path.dirname(os.path.abspath(args.baseline)), exist_ok=True)
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(dict(baseline, **results), f, ensure_ascii=False, indent=2)
+        print(f"기준값 저장: {args.baseline}")
+
+    if args.check:
+        if not baseline:
+            print(f"기준값 없음: {args.baseline} (--save-baseline으로 먼저 저장)")
+            return 2
+        regressions = compare(results, baseline, args.threshold)
+        for name, ratio in regressions:
+            print(f"❌ {name}: 기준 대비 {ratio * 100:.0f}% 속도")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
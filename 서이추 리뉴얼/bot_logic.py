@@ -1,42 +1,43 @@
 import time
 import random
-import re
 import os
 import subprocess
 import platform
+import signal
 import socket
-import json
-import threading
-import urllib.request
-import urllib.parse
+from contextlib import contextmanager
 
 
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
+# selenium.webdriver 하위 모듈은 무거워서 Selenium 백엔드를 실제로 쓸 때 불러온다 (예외 모듈은 가벼움)
 from selenium.common.exceptions import (
     TimeoutException,
     WebDriverException,
     NoSuchElementException,
-    StaleElementReferenceException,
 )
 
 from config import AppConfig
-
-try:
-    import websocket
-except Exception:
-    websocket = None
+from browser_backend import CdpBackend, OperationStats, SeleniumBackend, TimedBackend
+from cdp_client import CdpConnection
+from cdp_replay import REPLAY_CONFIG_KEYS, CdpRecorder
+from history_store import HistoryStore
+from negative_cache import NegativeCache
+from search_cursor import SearchCursor
+from candidate_queue import CandidateQueue
+from run_control import RunControl
+from run_journal import DEFAULT_JOURNAL_DIR, RunJournal
+from span_tracer import SpanTracer
+from metrics import MetricsRegistry
+from naver_core import MOBILE_BLOG_ID_RE, Outcome, append_blog_ids, classify_outcome, classify_popup
 
 
 class NaverBotLogic:
     def __init__(self, config: AppConfig, log_func, progress_func, status_func, gui_window=None):
         self.config = config
         self.driver = None
-        self.is_running = False
-        self.is_paused = False
+        self.backend = None
+        # 실행/일시정지/중지 상태: 모든 대기가 이 토큰을 따른다
+        self.control = RunControl()
+        self.control.on_stop(self._cancel_browser_waits)
         self.log = log_func
         self.update_progress = progress_func
         self.update_status = status_func
@@ -52,10 +53,9 @@ class NaverBotLogic:
         self._chrome_process_id = None
         self._chrome_user_data_dir = None
         self._embed_attempt_count = 0
-        self._webview2_mode = bool(config.get("use_webview2_panel")) and self._is_windows
-        self._cdp_ws = None
-        self._cdp_lock = threading.Lock()
-        self._cdp_msg_id = 0
+        # WebView2 패널은 Windows 전용이지만 CDP 자동화는 force_cdp_mode로 다른 OS에서도 쓸 수 있다 (대역 서버 벤치마크 등)
+        self._cdp_mode_allowed = self._is_windows or bool(config.get("force_cdp_mode"))
+        self._webview2_mode = bool(config.get("use_webview2_panel")) and self._cdp_mode_allowed
 
         # 성능 설정
         self.page_load_timeout = config.get("page_load_timeout")
@@ -64,31 +64,160 @@ class NaverBotLogic:
         self.normal_wait = config.get("normal_wait")
         self.slow_wait = config.get("slow_wait")
 
+        # Selenium 작업 탭 재사용 (비활성 시 블로그마다 새 탭)
+        self.reuse_worker_tab = bool(config.get("reuse_worker_tab"))
+        self.worker_tab_recycle_pages = max(1, int(config.get("worker_tab_recycle_pages") or 1))
+        self.worker_tab_memory_mb = float(config.get("worker_tab_memory_mb") or 0)
+        self.lightweight_profile = bool(config.get("lightweight_profile"))
+
+        # 실행 간 처리 기록 (이미 처리한 블로그는 수집 단계에서 제외)
+        try:
+            self.history = HistoryStore(config.get("history_db_path") or None)
+        except Exception as e:
+            self.history = None
+            self.log(f"⚠️ 처리 기록 DB 열기 실패: {str(e)[:40]}")
+        self._search_cursors = {}
+        self.search_empty_refills = max(1, int(config.get("search_empty_refills") or 1))
+
+        # 블로그별 단계 소요 시간/결과 저널
+        self.journal = None
+        if config.get("run_journal"):
+            try:
+                self.journal = RunJournal(
+                    max_bytes=float(config.get("run_journal_max_mb") or 5) * 1024 * 1024,
+                    backup_count=int(config.get("run_journal_backups") or 0),
+                )
+            except Exception:
+                self.journal = None
+        self._run_id = ""
+        self._run_keyword = ""
+        self._blog_ctx = None
+        self._last_error = None
+        # GUI 성능 지표 패널이 주기적으로 읽는 실행 지표
+        self.metrics = MetricsRegistry()
+        self._memory_sampled_at = 0.0
+        # 마지막으로 조회한 현재(작업) 탭의 JS 힙 사용량(MB). 작업 탭 재생성 판단에도 쓴다
+        self._heap_mb = None
+        # 단계별 구간 추적 (Chrome trace JSON, 기본 꺼짐)
+        self.tracer = SpanTracer(
+            enabled=config.get("trace_spans"),
+            sample_rate=config.get("trace_sample_rate"),
+        )
+        self.negative_cache = NegativeCache(
+            config.get("negative_cache_ttl_hours"),
+            config.get("negative_cache_size"),
+        )
+        if self.history is not None:
+            try:
+                self.negative_cache.warm(self.history.items())
+            except Exception:
+                pass
+        self._worker_window = None
+        self._worker_pages = 0
+
+        # 브라우저 백엔드: 조작별 왕복 수/지연은 backend_stats에 누적
+        self.backend_stats = OperationStats()
+        self._cdp_backend = CdpBackend(
+            log_func=self.log,
+            page_load_timeout=self.page_load_timeout,
+            ready_level=config.get("navigation_ready_level"),
+        )
+        self._cdp_conn = self._cdp_backend.connection
+
     # ------------------------------------------------------------------
     # 헬퍼
     # ------------------------------------------------------------------
+    @property
+    def is_running(self):
+        return self.control.running
+
+    @is_running.setter
+    def is_running(self, value):
+        if value:
+            self.control.start()
+        else:
+            self.control.stop()
+
+    @property
+    def is_paused(self):
+        return self.control.paused
+
+    @is_paused.setter
+    def is_paused(self, value):
+        self.control.set_paused(value)
+
     def safe_sleep(self, seconds):
-        if seconds > 0:
-            time.sleep(seconds)
+        """중지 요청 시 즉시 깨어나는 sleep."""
+        with self.tracer.span("sleep", seconds=round(seconds, 2)):
+            self.control.sleep(seconds)
 
     def _wait_if_paused(self):
-        while self.is_paused and self.is_running:
-            time.sleep(0.5)
+        self.control.wait_if_paused()
+
+    def _blog_interval(self):
+        """블로그 사이 대기 시간 (config blog_interval_sec: [최소, 최대] 초)."""
+        try:
+            low, high = (float(v) for v in self.config.get("blog_interval_sec"))
+        except (TypeError, ValueError):
+            low, high = 0.8, 1.5
+        return random.uniform(low, max(low, high))
+
+    def _cancel_browser_waits(self):
+        """중지 요청 시 진행 중인 페이지 이동/조건 대기를 끊는다."""
+        backend = self.backend
+        if backend is None:
+            return
+        try:
+            backend.cancel_pending()
+        except Exception:
+            pass
 
     def set_webview2_mode(self, enabled):
-        self._webview2_mode = bool(enabled) and self._is_windows
+        self._webview2_mode = bool(enabled) and self._cdp_mode_allowed
         if not self._webview2_mode:
             self._close_cdp()
 
+    @property
+    def _cdp(self):
+        return self._cdp_conn.client
+
     def _close_cdp(self):
-        ws = self._cdp_ws
-        self._cdp_ws = None
-        self._cdp_msg_id = 0
-        if ws:
+        self._cdp_conn.close()
+        if self.backend is not None and self.backend.name == "cdp":
+            self.backend = None
+
+    def shutdown(self, close_browser=False):
+        """프로그램 종료 시 호출. 실행 기록 저널을 비워 닫고 이력 DB와 CDP 연결을 닫는다.
+
+        close_browser=True면 chromedriver 세션을 끝내고 직접 띄운 크롬도 종료한다 (헤드리스 실행 등).
+        """
+        self.is_running = False
+        journal, self.journal = self.journal, None
+        if journal is not None:
+            journal.close()
+        history, self.history = self.history, None
+        if history is not None:
+            history.close()
+        self._cdp_conn.close()
+        if not close_browser:
+            return
+        driver, self.driver = self.driver, None
+        if driver is not None:
             try:
-                ws.close()
+                driver.quit()
             except Exception:
                 pass
+        pid, self._chrome_process_id = self._chrome_process_id, None
+        if pid:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except OSError:
+                pass
+
+    def _use_backend(self, backend):
+        self.backend = TimedBackend(backend, self.backend_stats)
+        if self.lightweight_profile:
+            self.backend.set_resource_blocking(True)
 
     def _get_webview_debug_port(self):
         if self.gui_window:
@@ -102,212 +231,133 @@ class NaverBotLogic:
                     pass
         return self._get_debug_port()
 
-    def _read_json_url(self, url):
-        with urllib.request.urlopen(url, timeout=2.0) as resp:
-            raw = resp.read().decode("utf-8", errors="ignore")
-        return json.loads(raw)
-
-    def _pick_cdp_target(self, debug_port):
-        try:
-            targets = self._read_json_url(f"http://127.0.0.1:{int(debug_port)}/json/list")
-        except Exception:
-            try:
-                targets = self._read_json_url(f"http://127.0.0.1:{int(debug_port)}/json")
-            except Exception:
-                return None
-
-        if not isinstance(targets, list):
-            return None
-
-        page_targets = [t for t in targets if isinstance(t, dict) and t.get("type") == "page"]
-        if not page_targets:
-            return None
-
-        for t in page_targets:
-            url = str(t.get("url") or "")
-            if "naver.com" in url:
-                return t
-        return page_targets[0]
-
     def _ensure_cdp_connected(self, force_restart=False):
-        if websocket is None:
+        if not CdpConnection.available():
             self.log("❌ CDP 연결 실패: websocket-client 미설치")
             return False
 
-        if self._cdp_ws and not force_restart:
-            try:
-                _ = self._cdp_eval("return location.href;", timeout=2.0)
-                self.driver = self._cdp_ws
-                return True
-            except Exception:
-                self._close_cdp()
-
         debug_port = self._get_webview_debug_port()
         if debug_port <= 0:
             self.log("❌ CDP 연결 실패: debug port 없음")
             return False
 
-        for _ in range(60):
-            if self._is_debug_port_open(debug_port):
-                break
-            time.sleep(0.2)
-
-        if not self._is_debug_port_open(debug_port):
-            self.log(f"❌ CDP 연결 실패: 포트 미오픈 ({debug_port})")
-            return False
-
-        target = self._pick_cdp_target(debug_port)
-        if not target:
-            self.log(f"❌ CDP 연결 실패: page target 없음 ({debug_port})")
-            return False
-
-        ws_url = target.get("webSocketDebuggerUrl")
-        if not ws_url:
-            self.log("❌ CDP 연결 실패: webSocketDebuggerUrl 없음")
-            return False
+        # 빠른 헬스 체크: reader 스레드 생존 + 웹소켓 ping (CDP 왕복 없음)
+        if not force_restart and self._cdp_conn.is_healthy(debug_port):
+            self.driver = self._cdp
+            self._use_backend(self._cdp_backend)
+            return True
 
         try:
-            self._cdp_ws = self._open_cdp_socket(ws_url)
-            self._cdp_msg_id = 0
-            try:
-                self._cdp_cmd("Runtime.enable", timeout=2.0)
-            except Exception:
-                pass
-            try:
-                self._cdp_cmd("Page.enable", timeout=2.0)
-            except Exception:
-                pass
-            try:
-                self._cdp_cmd("Network.enable", timeout=2.0)
-            except Exception:
-                pass
-            self.driver = self._cdp_ws
+            self._cdp_conn.connect(debug_port, force=force_restart)
+            self.driver = self._cdp
+            self._use_backend(self._cdp_backend)
             self.log(f"✅ WebView2 CDP 연결 성공: {debug_port}")
             return True
         except Exception as e:
-            self._close_cdp()
             err_text = str(e)
             if "403" in err_text:
                 self.log("   ↪ 핸드셰이크 403: Origin 제한 가능성")
-            self.log(f"❌ CDP 소켓 연결 실패: {err_text[:180]}")
+            self.log(f"❌ CDP 연결 실패: {err_text[:180]}")
             return False
 
-    def _open_cdp_socket(self, ws_url):
-        strategies = [
-            {"suppress_origin": True},
-            {"origin": "http://127.0.0.1"},
-            {"origin": "http://localhost"},
-            {"origin": "null"},
-            {},
-        ]
-        last_error = None
-        for extra in strategies:
-            try:
-                kwargs = {
-                    "timeout": 8.0,
-                    "enable_multithread": True,
-                }
-                kwargs.update(extra)
-                return websocket.create_connection(ws_url, **kwargs)
-            except Exception as e:
-                last_error = e
-                continue
-        if last_error:
-            raise last_error
-        raise RuntimeError("CDP 소켓 연결 실패")
-
-    def _cdp_cmd(self, method, params=None, timeout=8.0):
-        if not self._cdp_ws:
-            raise RuntimeError("CDP 미연결")
-        with self._cdp_lock:
-            self._cdp_msg_id += 1
-            req_id = self._cdp_msg_id
-            payload = {
-                "id": req_id,
-                "method": str(method),
-                "params": params or {},
-            }
-            self._cdp_ws.settimeout(timeout)
-            self._cdp_ws.send(json.dumps(payload, ensure_ascii=False))
-            while True:
-                raw = self._cdp_ws.recv()
-                data = json.loads(raw)
-                if not isinstance(data, dict):
-                    continue
-                if data.get("id") != req_id:
-                    continue
-                if "error" in data:
-                    err = data.get("error") or {}
-                    raise RuntimeError(err.get("message") or str(err))
-                return data.get("result") or {}
-
-    def _cdp_eval(self, script, timeout=8.0):
-        expr = f"(() => {{ {script} }})()"
-        result = self._cdp_cmd(
-            "Runtime.evaluate",
-            {
-                "expression": expr,
-                "returnByValue": True,
-                "awaitPromise": True,
-            },
-            timeout=timeout,
-        )
-        if result.get("exceptionDetails"):
-            detail = result["exceptionDetails"]
-            text = ""
-            if isinstance(detail, dict):
-                text = str(detail.get("text") or detail.get("exception", {}).get("description") or "")
-            raise RuntimeError(text or "Runtime.evaluate 실패")
-        value = (result.get("result") or {}).get("value")
-        return value
-
-    def _cdp_navigate(self, url):
-        self._cdp_cmd("Page.navigate", {"url": str(url)}, timeout=10.0)
-        deadline = time.time() + 15.0
-        while time.time() < deadline:
+    def _start_cdp_recording(self, keyword, target_count, neighbor_msg):
+        """config cdp_record가 켜져 있으면 이번 실행의 CDP 세션을 logs/cdp-<실행시각>.jsonl.gz로 기록.
+
+        연결/로그인 확인 전에 시작해 재생 시 같은 순서로 명령이 나가게 한다.
+        """
+        if not self._webview2_mode or not self.config.get("cdp_record"):
+            return
+        # 재생 시 같은 후보가 걸러지도록 실행 시작 시점의 제외 목록과 검색 위치를 함께 남긴다
+        skip_ids = set(self.negative_cache.active_ids())
+        if self.history is not None:
             try:
-                state = self._cdp_eval("return document.readyState;", timeout=3.0)
-                if state in ("interactive", "complete"):
-                    return True
+                skip_ids.update(bid for bid, outcome, _ in self.history.items() if outcome in Outcome.FINAL)
             except Exception:
                 pass
-            time.sleep(0.2)
-        return False
+        cursor = self._search_cursor(keyword)
+        meta = {
+            "keyword": keyword,
+            "target_count": target_count,
+            "neighbor_msg": neighbor_msg,
+            "my_blog_id": str(self.config.get("my_blog_id") or "").strip(),
+            "config": {key: self.config.get(key) for key in REPLAY_CONFIG_KEYS},
+            "cursor": {"offset": cursor.offset, "base_url": cursor.base_url},
+            "skip_ids": sorted(skip_ids),
+        }
+        path = os.path.join(DEFAULT_JOURNAL_DIR, f"cdp-{self._run_id}.jsonl.gz")
+        try:
+            recorder = CdpRecorder(path, meta)
+        except OSError as e:
+            self.log(f"⚠️ CDP 기록 시작 실패: {str(e)[:60]}")
+            return
+        self._cdp_conn.recorder = recorder
+        client = self._cdp
+        if client is not None:
+            client.recorder = recorder
+        self.log(f"📼 CDP 기록 시작: {path}")
+
+    def _stop_cdp_recording(self):
+        recorder = self._cdp_conn.recorder
+        if recorder is None:
+            return
+        self._cdp_conn.recorder = None
+        client = self._cdp
+        if client is not None:
+            client.recorder = None
+        recorder.close()
+        self.log(f"📼 CDP 기록 저장: {recorder.path} ({recorder.entries}건)")
+
+    def _export_trace(self):
+        if not self.tracer.enabled or not len(self.tracer):
+            return
+        path = os.path.join(DEFAULT_JOURNAL_DIR, f"trace-{self._run_id}.json")
+        try:
+            count = self.tracer.export(path)
+            self.log(f"🧭 구간 추적 저장: {path} ({count}건)")
+        except OSError as e:
+            self.log(f"⚠️ 구간 추적 저장 실패: {str(e)[:60]}")
+
+    def _log_backend_stats(self):
+        self._export_trace()
+        lines = self.backend_stats.summary_lines()
+        if not lines:
+            return
+        self.log(f"📊 브라우저 조작 통계 ({self.backend.name if self.backend else '-'})")
+        for line in lines:
+            self.log(f"   {line}")
+        if self.negative_cache.hits:
+            self.log(f"   서이추 불가 캐시로 건너뛴 블로그: {self.negative_cache.hits}명")
+        blocked = getattr(self.backend, "blocked_requests", 0) if self.backend else 0
+        if blocked:
+            self.log(f"   경량 프로필 차단 요청: {blocked}건")
+
+    def _nnp_call(self, fn, *args, timeout=4.0):
+        """window.__nnp 헬퍼 함수 호출 (백엔드 공통)."""
+        return self.backend.call_helper(fn, *args, timeout=timeout)
 
     def _find_text_in_body(self, keyword):
         try:
-            body_text = self._cdp_eval("return (document.body && document.body.innerText) ? document.body.innerText : '';", timeout=4.0) or ""
+            body_text = self.backend.run_script(
+                "return (document.body && document.body.innerText) ? document.body.innerText : '';",
+                timeout=4.0,
+            ) or ""
             return str(keyword) in str(body_text)
         except Exception:
             return False
 
     def _get_current_url(self):
-        if self._webview2_mode:
-            try:
-                return str(self._cdp_eval("return location.href || '';", timeout=3.0) or "")
-            except Exception:
-                return ""
-        try:
-            return str(self.driver.current_url or "")
-        except Exception:
+        if not self.backend:
             return ""
+        return self.backend.current_url()
 
     def _get_page_source(self):
-        if self._webview2_mode:
-            try:
-                return str(
-                    self._cdp_eval(
-                        "return document.documentElement ? document.documentElement.outerHTML : '';",
-                        timeout=5.0,
-                    )
-                    or ""
-                )
-            except Exception:
-                return ""
-        try:
-            return str(self.driver.page_source or "")
-        except Exception:
+        if not self.backend:
             return ""
+        return self.backend.page_source()
+
+    def _probe_page(self):
+        """현재 페이지 상태 스냅샷 (BrowserBackend.probe 참고)."""
+        return self.backend.probe()
 
     def _ensure_my_blog_id(self):
         """my_blog_id가 비어 있으면 로그인 세션으로 자동 감지."""
@@ -319,7 +369,7 @@ class NaverBotLogic:
             if not self.safe_get(self.driver, "https://m.blog.naver.com/MyBlog.naver"):
                 return ""
             current_url = self._get_current_url()
-            match = re.search(r"m\.blog\.naver\.com\/([a-zA-Z0-9_-]+)", current_url or "", re.IGNORECASE)
+            match = MOBILE_BLOG_ID_RE.search(current_url or "")
             if not match:
                 return ""
             detected = (match.group(1) or "").strip()
@@ -332,251 +382,183 @@ class NaverBotLogic:
             pass
         return ""
 
-    def _append_blog_ids_from_links(self, links, processed_ids, queue, blacklist):
-        new_count = 0
-        my_id_clean = str(self.my_blog_id or "").strip().lower()
-        if not isinstance(links, list):
-            return new_count
-        for href in links:
-            try:
-                href = str(href or "")
-                if not href or "blog.naver.com" not in href:
-                    continue
-                match = re.search(r"blog\.naver\.com\/([a-zA-Z0-9_-]+)", href)
-                if not match:
-                    continue
-                bid = match.group(1)
-                bid_lower = bid.lower()
-                if bid_lower in blacklist:
-                    continue
-                if my_id_clean and bid_lower == my_id_clean:
-                    continue
-                if bid in processed_ids or len(bid) <= 3:
-                    continue
-                if bid in queue or bid.isdigit():
-                    continue
-                queue.append(bid)
-                processed_ids.add(bid)
-                new_count += 1
-            except Exception:
-                continue
-        return new_count
+    def _new_candidate_queue(self):
+        """이번 실행용 후보 대기열. 처리 기록/서이추 불가 캐시를 배치 단위 prefilter로 건다."""
+        queue = CandidateQueue(exclude=(self.my_blog_id,))
+        if self.history is not None:
+            # 이전 실행에서 끝난 블로그 제외
+            queue.add_prefilter(self.history.filter_unseen)
+        # 서이추 불가로 확인된 블로그는 유지 시간 동안 방문하지 않음
+        queue.add_prefilter(self.negative_cache.filter)
+        return queue
 
-    def _get_layer_popup_text_webview2(self):
+    def _begin_blog(self, blog_id):
+        backend = self.backend
+        self.tracer.begin_unit()
+        self._last_error = None
+        self._blog_ctx = {
+            "blog_id": blog_id,
+            "t0": time.perf_counter(),
+            "stages": {},
+            "bytes0": backend.bytes_received if backend else None,
+            "calls0": self.backend_stats.calls,
+        }
+
+    @contextmanager
+    def _stage(self, name):
+        """현재 블로그 처리의 단계별 소요 시간(ms) 누적."""
+        t0 = time.perf_counter()
         try:
-            return self._cdp_eval(
-                """
-                var layer = document.getElementById('_alertLayer');
-                if (layer && layer.style.display !== 'none') {
-                    var dsc = layer.querySelector('.dsc');
-                    return dsc ? (dsc.innerText || '').trim() : null;
-                }
-                return null;
-                """,
-                timeout=3.0,
-            )
-        except Exception:
-            return None
-
-    def _close_layer_popup_webview2(self):
+            with self.tracer.span(name, cat="blog"):
+                yield
+        finally:
+            ctx = self._blog_ctx
+            if ctx is not None:
+                stages = ctx["stages"]
+                stages[name] = round(stages.get(name, 0.0) + (time.perf_counter() - t0) * 1000.0, 1)
+
+    def _finish_blog(self, blog_id, outcome, message):
+        """블로그 하나의 처리 결과를 지표/저널에 반영."""
+        self.metrics.incr(f"outcome.{outcome}")
+        ctx = self._blog_ctx
+        if ctx is None or ctx["blog_id"] != blog_id:
+            return
+        self._blog_ctx = None
+        backend = self.backend
+        nbytes = None
+        if backend is not None and ctx["bytes0"] is not None and backend.bytes_received is not None:
+            nbytes = backend.bytes_received - ctx["bytes0"]
+        total_ms = round((time.perf_counter() - ctx["t0"]) * 1000.0, 1)
+
+        metrics = self.metrics
+        metrics.observe("blog_ms", total_ms)
+        for name, ms in ctx["stages"].items():
+            metrics.observe(f"stage.{name}", ms)
+        metrics.observe("round_trips", self.backend_stats.calls - ctx["calls0"])
+        if nbytes is not None:
+            metrics.observe("bytes", nbytes)
+        self._sample_browser_memory()
+
+        journal = self.journal
+        if journal is None:
+            return
+        journal.write({
+            "ts": round(time.time(), 3),
+            "run": self._run_id,
+            "keyword": self._run_keyword,
+            "blog_id": blog_id,
+            "backend": backend.name if backend else None,
+            "outcome": outcome,
+            "message": message,
+            "total_ms": total_ms,
+            "stages": ctx["stages"],
+            "bytes": nbytes,
+            "error": self._last_error,
+        })
+
+    def _sample_browser_memory(self, interval=10.0):
+        """현재 탭의 JS 힙 사용량을 조회해 지표와 작업 탭 재생성 판단(_heap_mb)에 함께 쓴다.
+
+        작업 탭 메모리 한도를 쓰는 동안은 블로그마다 한 번, 그 외에는 interval초에 한 번만 조회한다.
+        """
+        now = time.monotonic()
+        every_blog = self._worker_window is not None and self.worker_tab_memory_mb > 0
+        if not self.backend or (not every_blog and now - self._memory_sampled_at < interval):
+            return
+        self._memory_sampled_at = now
         try:
-            self._cdp_eval(
-                """
-                var btn = document.getElementById('_alertLayerClose');
-                if (btn) { btn.click(); return true; }
-                return false;
-                """,
+            used = self.backend.run_script(
+                "return (performance.memory && performance.memory.usedJSHeapSize) || 0;",
                 timeout=2.0,
             )
+        except Exception:
+            return
+        if used:
+            self._heap_mb = float(used) / (1024 * 1024)
+            self.metrics.gauge("js_heap_mb", self._heap_mb)
+
+    def _record_outcome(self, blog_id, result, message):
+        outcome = classify_outcome(result, message)
+        self._finish_blog(blog_id, outcome, message)
+        self.tracer.instant("outcome", cat="blog", blog_id=blog_id, outcome=outcome)
+        self.tracer.end_unit()
+        if outcome in Outcome.SESSION:
+            return outcome
+        self.negative_cache.add(blog_id, outcome)
+        if self.history is None:
+            return outcome
+        try:
+            self.history.record(blog_id, outcome, message)
         except Exception:
             pass
-
-    def _process_neighbor_webview2(self, blog_id):
+        return outcome
+
+    def _take_dialog(self, hit, timeout):
+        """열린 JS 대화상자 문구. 대기 중 대화상자가 떴으면 timeout까지 기다리고,
+        백엔드가 이미 닫아 take_dialog가 비면 대기 결과에 실려 온 문구("" 가능)를 쓴다.
+        대화상자가 없으면 None."""
+        opened = bool(hit) and hit[0] == "dialog"
+        text = self.backend.take_dialog(timeout if opened else 0)
+        if text is None and opened:
+            return hit[1] if hit[1] is not None else ""
+        return text
+
+    def _close_layer_popup(self):
         try:
-            self._wait_if_paused()
-            if not self.is_running:
-                return False, "중단됨"
-            src = self._get_page_source()
-            if "이웃끊기" in src or "서로이웃 취소" in src:
-                return False, "스킵(이미 이웃)"
-
-            self._wait_if_paused()
-            if not self.is_running:
-                return False, "중단됨"
-            clicked = self._cdp_eval(
-                """
-                try {
-                    var addBtn = document.querySelector("[data-click-area='ebc.add']");
-                    if (addBtn) { addBtn.click(); return 'CLICKED'; }
-                    if (document.querySelector("[data-click-area='ebc.ngr']")) return 'ALREADY';
-                    var nodes = Array.from(document.querySelectorAll("a,button,span,div"));
-                    var textBtn = nodes.find(function(el){
-                        var txt = (el.innerText || el.textContent || '').trim();
-                        return txt.indexOf('이웃추가') >= 0;
-                    });
-                    if (textBtn) { textBtn.click(); return 'CLICKED'; }
-                    return 'NONE';
-                } catch (e) {
-                    return 'ERROR:' + (e && e.message ? e.message : '');
-                }
-                """,
-                timeout=4.0,
-            )
-            if clicked == "ALREADY":
-                return False, "스킵(이미 이웃)"
-            if isinstance(clicked, str) and clicked.startswith("ERROR:"):
-                return False, f"실패({clicked[:20]})"
-            if clicked != "CLICKED":
-                return False, "스킵(버튼 없음)"
-
-            self.safe_sleep(0.35)
-
-            self._wait_if_paused()
-            if not self.is_running:
-                return False, "중단됨"
-            src_after = self._get_page_source()
-            if "하루에 신청 가능한 이웃수" in src_after and "초과" in src_after:
-                try:
-                    self._cdp_eval(
-                        """
-                        var closeBtn = Array.from(document.querySelectorAll("button,a"))
-                            .find(function(el){ return (el.innerText || '').indexOf('닫기') >= 0; });
-                        if (closeBtn) closeBtn.click();
-                        return true;
-                        """,
-                        timeout=2.0,
-                    )
-                except Exception:
-                    pass
-                return "DONE_DAY_LIMIT", "🎉 일일 한도 달성!"
-
-            if "서로이웃 신청 진행중입니다" in src_after:
-                try:
-                    self._cdp_eval(
-                        """
-                        var cancelBtn = Array.from(document.querySelectorAll("button,a"))
-                            .find(function(el){ return (el.innerText || '').indexOf('취소') >= 0; });
-                        if (cancelBtn) cancelBtn.click();
-                        return true;
-                        """,
-                        timeout=2.0,
-                    )
-                except Exception:
-                    pass
-                return False, "스킵(이미 신청중)"
-
-            layer_popup = self._get_layer_popup_text_webview2()
-            if layer_popup:
-                if "하루" in layer_popup and "초과" in layer_popup:
-                    return "DONE_DAY_LIMIT", "🎉 일일 한도 달성!"
-                if "선택 그룹" in layer_popup:
-                    return "STOP_GROUP_FULL", layer_popup
-                self._close_layer_popup_webview2()
-                if "5,000" in layer_popup or "5000" in layer_popup:
-                    return False, "스킵(상대 5000명)"
-                return False, f"스킵({layer_popup[:20]})"
-
-            self._wait_if_paused()
-            if not self.is_running:
-                return False, "중단됨"
-            current_url = self._get_current_url()
-            if "BuddyAddForm" not in current_url:
-                if not self.safe_get(self.driver, f"https://m.blog.naver.com/BuddyAddForm.naver?blogId={blog_id}"):
-                    return False, "실패(양식 페이지 로드 실패)"
-                self.safe_sleep(1.0)
-
-            page_src = self._get_page_source()
-            if "로그인" in page_src and "로그인이 필요" in page_src:
-                return False, "실패(로그인 필요)"
-
-            form_state = self._cdp_eval(
-                """
-                try {
-                    var both = document.getElementById('bothBuddyRadio');
-                    if (!both) {
-                        if (document.getElementById('onewayBuddyRadio')) return 'ONEWAY_ONLY';
-                        return 'NO_FORM';
-                    }
-                    if (both.disabled || both.getAttribute('disabled')) return 'DISABLED';
-                    if (!both.checked) {
-                        var label = document.querySelector("label[for='bothBuddyRadio']");
-                        if (label) label.click();
-                        else both.click();
-                    }
-                    return 'OK';
-                } catch (e) {
-                    return 'ERROR:' + (e && e.message ? e.message : '');
-                }
-                """,
-                timeout=4.0,
-            )
-            if form_state == "ONEWAY_ONLY":
-                return False, "스킵(서이추 비활성화)"
-            if form_state == "NO_FORM":
-                if "진행 중" in page_src or "신청중" in page_src:
-                    return False, "스킵(이미 신청중)"
-                return False, "실패(양식 없음)"
-            if form_state == "DISABLED":
-                return False, "스킵(서이추 불가)"
-            if isinstance(form_state, str) and form_state.startswith("ERROR:"):
-                return False, f"실패({form_state[:20]})"
-
-            msg_json = json.dumps(self.neighbor_msg or "")
-            self._cdp_eval(
-                f"""
-                var el = document.querySelector("textarea");
-                if (!el) return false;
-                el.focus();
-                el.value = {msg_json};
-                el.dispatchEvent(new Event('input', {{ bubbles: true }}));
-                el.dispatchEvent(new Event('change', {{ bubbles: true }}));
-                return true;
-                """,
-                timeout=4.0,
-            )
-
-            self._wait_if_paused()
-            if not self.is_running:
-                return False, "중단됨"
-            clicked_confirm = self._cdp_eval(
-                """
-                var btn = Array.from(document.querySelectorAll("button,a,input[type='button'],input[type='submit']"))
-                    .find(function(el){
-                        var txt = (el.innerText || el.value || '').trim();
-                        return txt === '확인' || txt.indexOf('확인') >= 0;
-                    });
-                if (!btn) return false;
-                btn.click();
-                return true;
-                """,
-                timeout=4.0,
-            )
-            if not clicked_confirm:
-                return False, "실패(확인 버튼 없음)"
-
-            self.safe_sleep(self.fast_wait)
+            self._nnp_call("closeAlert", timeout=2.0)
+        except Exception:
+            pass
 
-            final_popup = self._get_layer_popup_text_webview2()
-            if final_popup:
-                if "하루" in final_popup and "초과" in final_popup:
-                    return "DONE_DAY_LIMIT", "🎉 일일 한도 달성!"
-                if "선택 그룹" in final_popup:
-                    return "STOP_GROUP_FULL", final_popup
-                self._close_layer_popup_webview2()
-                if "5,000" in final_popup or "5000" in final_popup:
-                    return False, "스킵(상대 5000명)"
-                if "신청" in final_popup or "완료" in final_popup:
-                    return True, "신청 완료"
-                return False, f"실패({final_popup[:20]})"
+    def _classify_popup(self, text):
+        """레이어/JS 알림 문구 중 작업 결과가 정해지는 경우만 (결과, 메시지)로 분류. 그 외 None."""
+        outcome = classify_popup(text)
+        if outcome == Outcome.DAY_LIMIT:
+            return "DONE_DAY_LIMIT", "🎉 일일 한도 달성!"
+        if outcome == Outcome.GROUP_FULL:
+            return "STOP_GROUP_FULL", text
+        if outcome == Outcome.FULL:
+            return False, "스킵(상대 5000명)"
+        return None
 
-            return True, "신청 완료"
-        except Exception as e:
-            return False, f"에러: {str(e)[:15]}"
+    def _worker_tab_needs_recycle(self):
+        limit = self.worker_tab_recycle_pages if self.reuse_worker_tab else 1
+        if self._worker_pages >= limit:
+            return True
+        # 직전 블로그를 마칠 때 _sample_browser_memory가 이 탭에서 잰 값을 쓴다 (별도 왕복 없음)
+        heap_mb = self._heap_mb
+        if self.worker_tab_memory_mb > 0 and heap_mb is not None and heap_mb >= self.worker_tab_memory_mb:
+            self.log(f"   ↪ 작업 탭 메모리 {heap_mb:.0f}MB: 탭 재생성")
+            return True
+        return False
 
-    def _close_tab_and_return(self, main_window):
-        """현재 탭 닫고 메인 윈도우로 복귀."""
+    def _acquire_worker_tab(self, main_window):
+        """블로그 방문용 작업 탭으로 전환. 페이지 수/메모리 한도를 넘으면 새 탭으로 교체."""
+        worker = self._worker_window
+        if worker and worker in self.driver.window_handles:
+            self.driver.switch_to.window(worker)
+            if not self._worker_tab_needs_recycle():
+                self._worker_pages += 1
+                return
+            self._release_worker_tab(main_window)
+        self.driver.switch_to.window(main_window)
+        self.driver.switch_to.new_window("tab")
+        self._worker_window = self.driver.current_window_handle
+        self._worker_pages = 1
+        self._heap_mb = None
+        # 차단 목록과 헬퍼 주입 스크립트는 탭마다 따로 걸린다
+        if self.lightweight_profile:
+            self.backend.set_resource_blocking(True)
+        self.backend.install_helper()
+
+    def _release_worker_tab(self, main_window):
+        """작업 탭을 닫고 검색 탭으로 복귀."""
+        worker = self._worker_window
+        self._worker_window = None
+        self._worker_pages = 0
+        self._heap_mb = None
         try:
-            if len(self.driver.window_handles) > 1:
+            if worker and worker != main_window and worker in self.driver.window_handles:
+                self.driver.switch_to.window(worker)
                 self.driver.close()
             self.driver.switch_to.window(main_window)
         except WebDriverException:
@@ -585,166 +567,104 @@ class NaverBotLogic:
     def _navigate_to_blog_search(self, keyword):
         """네이버 블로그 검색 페이지로 이동."""
         search_url = f"https://search.naver.com/search.naver?where=blog&query={keyword}"
-        if self._webview2_mode:
-            if not self._cdp_navigate(search_url):
-                return False
-            self.safe_sleep(1.0)
-            return True
-        if not self.safe_get(self.driver, search_url):
-            return False
-        self.safe_sleep(1.0)
-        return True
+        with self.tracer.span("search.navigate", cat="search"):
+            return self.safe_get(self.driver, search_url)
 
     def _click_blog_tab(self):
         """검색 결과에서 '블로그' 탭 클릭."""
-        if self._webview2_mode:
-            for _ in range(5):
-                try:
-                    clicked_state = self._cdp_eval(
-                        """
-                        try {
-                            var blogTab = null;
-                            var tabs = Array.from(document.querySelectorAll("[role='tab'], .tab, .lnb_item a"));
-                            for (var i = 0; i < tabs.length; i++) {
-                                var txt = (tabs[i].innerText || tabs[i].textContent || '').trim();
-                                if (txt.indexOf('블로그') >= 0) {
-                                    blogTab = tabs[i];
-                                    break;
-                                }
-                            }
-                            if (!blogTab) {
-                                var candidates = Array.from(document.querySelectorAll("a[href*='search.naver.com/search.naver']"));
-                                blogTab = candidates.find(function(el){
-                                    var txt = (el.innerText || el.textContent || '').trim();
-                                    return txt.indexOf('블로그') >= 0;
-                                }) || null;
-                            }
-                            if (!blogTab) return "NONE";
-                            blogTab.click();
-                            return "CLICKED";
-                        } catch (e) {
-                            return "ERROR";
-                        }
-                        """,
-                        timeout=4.0,
-                    )
-                    if clicked_state == "CLICKED":
-                        self.log("   ↪ '블로그' 탭 클릭...")
-                        self.safe_sleep(1.0)
-                        return
-                except Exception:
-                    pass
-                self.safe_sleep(0.3)
+        with self.tracer.span("search.blog_tab", cat="search"):
+            self._click_blog_tab_once()
 
-            # 클릭 실패 시 검색어를 유지한 채 블로그 결과로 강제 이동
+    def _click_blog_tab_once(self):
+        for _ in range(5):
             try:
-                forced = self._cdp_eval(
-                    """
-                    try {
-                        var q = '';
-                        var u = new URL(location.href);
-                        q = u.searchParams.get('query') || '';
-                        if (!q) {
-                            var input = document.querySelector("input[name='query'], input#nx_query");
-                            q = input ? (input.value || '').trim() : '';
-                        }
-                        if (!q) return false;
-                        location.href = "https://search.naver.com/search.naver?where=blog&query=" + encodeURIComponent(q);
-                        return true;
-                    } catch (e) {
-                        return false;
-                    }
-                    """,
-                    timeout=4.0,
-                )
-                if forced:
-                    self.log("   ↪ '블로그' 탭 강제 이동...")
-                    self.safe_sleep(1.0)
+                before_url = self._get_current_url()
+                clicked_state = self._nnp_call("clickBlogTab", timeout=4.0)
+                if clicked_state == "CLICKED":
+                    self.log("   ↪ '블로그' 탭 클릭...")
+                    self._wait_for_results(before_url)
+                    return
             except Exception:
                 pass
-            return
-        try:
-            blog_tab = None
-            tabs = self.driver.find_elements(By.CSS_SELECTOR, "[role='tab'], .tab, .lnb_item a")
-            for tab in tabs:
-                try:
-                    if "블로그" in tab.text:
-                        blog_tab = tab
-                        break
-                except (StaleElementReferenceException, NoSuchElementException):
-                    continue
+            # 탭 영역이 아직 그려지지 않았으면 나타날 때까지만 대기
+            self._wait_for([("selector", "[role='tab'], .tab, .lnb_item a")], 0.3)
 
-            if not blog_tab:
-                candidates = self.driver.find_elements(By.XPATH, "//a[contains(text(), '블로그')]")
-                for cand in candidates:
-                    try:
-                        href = (cand.get_attribute("href") or "").lower()
-                        if "search.naver.com/search.naver" in href or "where=blog" in href:
-                            blog_tab = cand
-                            break
-                    except (StaleElementReferenceException, NoSuchElementException):
-                        continue
-                if not blog_tab and candidates:
-                    blog_tab = candidates[0]
-
-            if blog_tab:
-                self.log("   ↪ '블로그' 탭 클릭...")
-                self.safe_click(self.driver, blog_tab)
-                self.safe_sleep(1.0)
-                return
-
-            # 클릭 실패 시 검색어를 유지한 채 블로그 결과로 강제 이동
-            q = ""
-            try:
-                m = re.search(r"[?&]query=([^&]+)", self.driver.current_url or "")
-                if m:
-                    q = urllib.parse.unquote_plus(m.group(1))
-            except Exception:
-                q = ""
-            if not q:
-                try:
-                    q_input = self.driver.find_element(By.CSS_SELECTOR, "input[name='query'], input#nx_query")
-                    q = (q_input.get_attribute("value") or "").strip()
-                except (NoSuchElementException, StaleElementReferenceException):
-                    q = ""
-            if q:
+        # 클릭 실패 시 검색어를 유지한 채 블로그 결과로 강제 이동
+        try:
+            before_url = self._get_current_url()
+            forced = self._nnp_call("forceBlogSearch", timeout=4.0)
+            if forced:
                 self.log("   ↪ '블로그' 탭 강제 이동...")
-                self.safe_get(self.driver, f"https://search.naver.com/search.naver?where=blog&query={q}")
-                self.safe_sleep(1.0)
-        except (NoSuchElementException, StaleElementReferenceException):
+                self._wait_for_results(before_url)
+        except Exception:
             pass
 
+    def _wait_for_results(self, before_url):
+        """탭 이동 후 URL 변경 → 블로그 링크 등장(또는 네트워크 유휴)까지 대기."""
+        self._wait_for([("url_changed", before_url)], self.slow_wait)
+        self._wait_for([("selector", "a[href*='blog.naver.com']"), ("idle", 300)], self.element_wait_timeout)
+
+    def _search_cursor(self, keyword):
+        """키워드별 검색 진행 위치 (같은 세션의 다음 실행에서도 이어서 사용)."""
+        cursor = self._search_cursors.get(keyword)
+        if cursor is None:
+            cursor = self._search_cursors[keyword] = SearchCursor(
+                keyword, exhausted_ttl=float(self.config.get("search_exhausted_ttl_min") or 0) * 60.0
+            )
+        return cursor
+
+    def _open_search_cursor(self, cursor):
+        """커서 위치의 검색 결과를 연다. 블로그 탭 URL을 알면 탭 클릭을 건너뛴다."""
+        with self.tracer.span("search.navigate", cat="search", offset=cursor.offset):
+            if not self.safe_get(self.driver, cursor.url()):
+                return False
+        if cursor.base_url is None:
+            self._click_blog_tab()
+            cursor.remember_base(self._get_current_url())
+        cursor.new_document()
+        return True
+
+    def _wait_for(self, conditions, timeout):
+        """페이지 조건 대기 (timeout은 상한). 만족한 (kind, value), 시간 초과/실패 시 None."""
+        if not self.backend:
+            return None
+        try:
+            return self.backend.wait_for(conditions, timeout=timeout, cancel=self.control.stop_event)
+        except Exception:
+            return None
+
+    def _wait_blog_ready(self):
+        """블로그 홈 로드 후 이웃추가 버튼이나 오류 화면이 나타날 때까지 대기."""
+        return self._wait_for(
+            [
+                ("selector", "[data-click-area='ebc.add'], [data-click-area='ebc.ngr']"),
+                ("text", "일시적인 오류"),
+                ("url_contains", "MobileErrorView"),
+            ],
+            self.element_wait_timeout,
+        )
+
     # ------------------------------------------------------------------
     # Selenium 유틸
     # ------------------------------------------------------------------
     def safe_get(self, driver, url, max_retries=2):
-        if self._webview2_mode:
-            for attempt in range(max_retries):
-                try:
-                    if self._cdp_navigate(url):
-                        return True
-                except Exception:
-                    pass
-                if attempt < max_retries - 1:
-                    self.safe_sleep(0.5)
+        if not self.backend:
             return False
         for attempt in range(max_retries):
             try:
-                driver.get(url)
-                return True
-            except TimeoutException:
-                if attempt < max_retries - 1:
-                    driver.execute_script("window.stop();")
-                else:
-                    return False
-            except WebDriverException:
-                if attempt < max_retries - 1:
-                    self.safe_sleep(0.5)
-                else:
-                    return False
+                if self.backend.navigate(url):
+                    self.metrics.mark("page_load")
+                    return True
+            except Exception:
+                pass
+            if attempt < max_retries - 1:
+                self.safe_sleep(0.5)
         return False
 
     def safe_find_element(self, driver, by, value, timeout=None):
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.webdriver.support import expected_conditions as EC
+
         if timeout is None:
             timeout = self.element_wait_timeout
         try:
@@ -811,6 +731,8 @@ class NaverBotLogic:
             f"--window-size={chrome_width},{chrome_height}",
             f"--window-position={chrome_x},{chrome_y}",
         ]
+        if self.config.get("chrome_headless"):
+            cmd.append("--headless=new")
         if initial_url:
             cmd.append(initial_url)
 
@@ -842,6 +764,8 @@ class NaverBotLogic:
         if self.driver and not force_restart:
             try:
                 _ = self.driver.window_handles
+                if self.backend is None or self.backend.name != "selenium":
+                    self._use_backend(SeleniumBackend(self.driver))
                 if self.gui_window:
                     self._position_chrome_window(self.gui_window)
                 return True
@@ -861,6 +785,9 @@ class NaverBotLogic:
                 time.sleep(0.5)
 
             # 디버그 포트 준비 후 attach
+            from selenium import webdriver
+            from selenium.webdriver.chrome.options import Options
+
             self.driver = None
             for _ in range(20):
                 try:
@@ -878,6 +805,8 @@ class NaverBotLogic:
                 raise RuntimeError("크롬 디버그 포트 연결 실패")
 
             self.driver.set_page_load_timeout(self.page_load_timeout)
+            self._use_backend(SeleniumBackend(self.driver))
+            self.backend.install_helper()
 
             if self.gui_window:
                 self._position_chrome_window(self.gui_window)
@@ -1172,42 +1101,22 @@ class NaverBotLogic:
     # 로그인 / 검색
     # ------------------------------------------------------------------
     def check_login_status(self):
-        if not self.driver:
+        if not self.driver or not self.backend:
             return False
-        if self._webview2_mode:
-            try:
-                current_url = self._get_current_url().lower()
-                if "nid.naver.com/nidlogin" in current_url:
-                    return False
-                try:
-                    self._cdp_cmd("Network.enable", timeout=2.0)
-                except Exception:
-                    pass
-                cookie_data = self._cdp_cmd(
-                    "Network.getCookies",
-                    {"urls": ["https://nid.naver.com", "https://m.blog.naver.com", "https://blog.naver.com"]},
-                    timeout=4.0,
-                )
-                cookies = cookie_data.get("cookies") or []
-                for cookie in cookies:
-                    name = str((cookie or {}).get("name") or "")
-                    if name in ("NID_AUT", "NID_SES"):
-                        return True
-                if self._find_text_in_body("로그아웃"):
-                    return True
-                return False
-            except Exception:
-                return False
         try:
-            current_url = (self.driver.current_url or "").lower()
+            current_url = self._get_current_url().lower()
             if "nid.naver.com/nidlogin" in current_url:
                 return False
-            cookies = self.driver.get_cookies()
+            cookies = self.backend.get_cookies(
+                ["https://nid.naver.com", "https://m.blog.naver.com", "https://blog.naver.com"]
+            )
             for cookie in cookies:
-                if cookie.get("name") in ("NID_AUT", "NID_SES"):
+                if str((cookie or {}).get("name") or "") in ("NID_AUT", "NID_SES"):
                     return True
+            if self._webview2_mode and self._find_text_in_body("로그아웃"):
+                return True
             return False
-        except WebDriverException:
+        except Exception:
             return False
 
     def open_login_page(self):
@@ -1256,291 +1165,225 @@ class NaverBotLogic:
     # ------------------------------------------------------------------
     # 블로그 ID 수집
     # ------------------------------------------------------------------
-    def collect_blog_ids(self, processed_ids):
-        queue = []
-        blacklist = {"myblog", "postlist", "buddyaddform", "likeit", "nvisitor", "blog", "domainid", "admin", "search"}
-
-        if self._webview2_mode:
-            scroll_attempts = 0
-            max_scroll = 7
-            while len(queue) < 20 and scroll_attempts < max_scroll:
-                self._wait_if_paused()
-                if not self.is_running:
-                    break
-                try:
-                    self._cdp_eval("window.scrollTo(0, document.body.scrollHeight); return true;", timeout=4.0)
-                except Exception:
-                    pass
-                self.safe_sleep(1.0)
-
-                new_count = 0
-                try:
-                    links = self._cdp_eval(
-                        "return Array.from(document.querySelectorAll('a[href]')).map(function(a){ return a.href || ''; });",
-                        timeout=6.0,
-                    )
-                    new_count += self._append_blog_ids_from_links(links, processed_ids, queue, blacklist)
-                except Exception:
-                    pass
-
-                self.log(f"   ⬇️ 스크롤 {scroll_attempts+1}/{max_scroll} - 신규 {new_count}명 (대기열: {len(queue)}명)")
-
-                if len(queue) >= 20:
-                    break
-
-                scroll_attempts += 1
-
-                if new_count == 0:
-                    try:
-                        clicked_more = self._cdp_eval(
-                            """
-                            var btn = document.querySelector('.btn_more, .more_btn');
-                            if (!btn) return false;
-                            var style = window.getComputedStyle(btn);
-                            if (style && style.display === 'none') return false;
-                            btn.click();
-                            return true;
-                            """,
-                            timeout=3.0,
-                        )
-                        if clicked_more:
-                            self.safe_sleep(0.8)
-                    except Exception:
-                        pass
-
-            return queue
-
+    def collect_blog_ids(self, queue, cursor=None):
+        """검색 결과를 스크롤하며 후보를 queue에 추가하고 추가된 수를 반환."""
+        target = len(queue) + 20
+        added = 0
         scroll_attempts = 0
         max_scroll = 7
-
-        while len(queue) < 20 and scroll_attempts < max_scroll:
+        link_count = 0
+        while len(queue) < target and scroll_attempts < max_scroll:
             self._wait_if_paused()
             if not self.is_running:
                 break
-            self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            self.safe_sleep(1.0)
+            with self.tracer.span("collect.scroll", cat="search", attempt=scroll_attempts + 1):
+                try:
+                    expected = self._nnp_call("scrollToBottom", timeout=4.0)
+                except Exception:
+                    expected = None
+                self._wait_for_more_links(expected)
 
             new_count = 0
+            grew = True
             try:
-                all_links = self.driver.find_elements(By.TAG_NAME, "a")
-
-                for link in all_links:
-                    try:
-                        href = link.get_attribute("href")
-                        new_count += self._append_blog_ids_from_links([href], processed_ids, queue, blacklist)
-                    except (StaleElementReferenceException, NoSuchElementException):
-                        continue
-            except WebDriverException:
+                # 앵커마다 get_attribute 왕복 대신 페이지 안에서 한 번에 추출
+                links = self._nnp_call("blogLinks", timeout=6.0)
+                new_count += append_blog_ids(links, queue)
+                if isinstance(links, list):
+                    grew = len(links) > link_count
+                    link_count = len(links)
+                    if cursor is not None:
+                        cursor.advance(link_count)
+            except Exception:
                 pass
 
+            added += new_count
             self.log(f"   ⬇️ 스크롤 {scroll_attempts+1}/{max_scroll} - 신규 {new_count}명 (대기열: {len(queue)}명)")
 
-            if len(queue) >= 20:
+            if len(queue) >= target:
                 break
 
             scroll_attempts += 1
 
             if new_count == 0:
                 try:
-                    more_btn = self.driver.find_element(By.CSS_SELECTOR, ".btn_more, .more_btn")
-                    if more_btn.is_displayed():
-                        self.safe_click(self.driver, more_btn)
-                        self.safe_sleep(0.8)
-                except (NoSuchElementException, StaleElementReferenceException):
+                    expected = self._nnp_call("clickMore", timeout=3.0)
+                    if expected:
+                        self._wait_for_more_links(expected)
+                    elif not grew:
+                        # 스크롤해도 결과가 늘지 않고 더보기도 없으면 결과 끝
+                        if cursor is not None:
+                            cursor.mark_exhausted()
+                        break
+                except Exception:
                     pass
 
-        return queue
+        return added
+
+    def _continue_after_empty_refill(self, cursor, empty_refills):
+        """재수집 후보가 0명일 때 다음 결과로 넘어가 다시 수집할지.
+
+        소진 표시는 collect_blog_ids가 링크가 늘지 않고 더보기도 없을 때만 한다.
+        결과는 늘었는데 모두 이력/캐시로 걸러진 경우는 search_empty_refills번까지 이어서 수집한다.
+        """
+        if cursor.exhausted:
+            self.log("⚠️ 더 이상 수집할 블로그가 없습니다.")
+            return False
+        if empty_refills + 1 >= self.search_empty_refills:
+            self.log(f"⚠️ {empty_refills + 1}회 연속 새 후보가 없어 수집을 멈춥니다. (검색 위치: {cursor.offset})")
+            return False
+        self.log(f"   ↪ 새 후보 없음 (이미 처리한 블로그), 다음 결과에서 다시 수집 (검색 위치: {cursor.offset})")
+        return True
+
+    def _wait_for_more_links(self, expected):
+        """스크롤/더보기 후 링크가 늘어나거나 네트워크가 잠잠해질 때까지 대기 (상한 slow_wait)."""
+        conditions = [("idle", 400)]
+        if isinstance(expected, int) and not isinstance(expected, bool):
+            conditions.insert(0, ("count", ["a[href*='blog.naver.com']", expected]))
+        self._wait_for(conditions, self.slow_wait)
 
     # ------------------------------------------------------------------
     # 서이추 신청
     # ------------------------------------------------------------------
-    def process_neighbor(self, blog_id):
-        if self._webview2_mode:
-            return self._process_neighbor_webview2(blog_id)
-
-        driver = self.driver
+    def process_neighbor(self, blog_id, state=None):
+        """현재 블로그에 서로이웃 신청. state는 방금 찍은 probe 스냅샷 (없으면 새로 검사)."""
         try:
             self._wait_if_paused()
             if not self.is_running:
                 return False, "중단됨"
-            src = driver.page_source
-            if "이웃끊기" in src or "서로이웃 취소" in src:
+            if state is None:
+                with self.tracer.span("neighbor.probe", cat="blog"):
+                    state = self._probe_page()
+            if state["already_neighbor"] or state["has_neighbor_button"]:
                 return False, "스킵(이미 이웃)"
 
             self._wait_if_paused()
             if not self.is_running:
                 return False, "중단됨"
-            clicked = False
-            try:
-                btn = driver.find_element(By.CSS_SELECTOR, "[data-click-area='ebc.add']")
-                self.safe_click(driver, btn)
-                clicked = True
-            except (NoSuchElementException, StaleElementReferenceException):
-                try:
-                    if driver.find_elements(By.CSS_SELECTOR, "[data-click-area='ebc.ngr']"):
-                        return False, "스킵(이미 이웃)"
-                    btn = driver.find_element(By.XPATH, "//*[contains(text(), '이웃추가')]")
-                    self.safe_click(driver, btn)
-                    clicked = True
-                except (NoSuchElementException, StaleElementReferenceException):
-                    pass
-
-            if not clicked:
+            click_state = self._nnp_call("clickAddButton", timeout=4.0)
+            if click_state == "ALREADY":
+                return False, "스킵(이미 이웃)"
+            if click_state != "CLICKED":
                 return False, "스킵(버튼 없음)"
 
-            self.safe_sleep(0.3)
+            # 고정 대기 대신 레이어/양식 이동/진행중 문구 중 먼저 나타나는 것을 기다림
+            hit = self._wait_for(
+                [
+                    ("alert", None),
+                    ("url_contains", "BuddyAddForm"),
+                    ("selector", "#bothBuddyRadio, #onewayBuddyRadio"),
+                    ("text", "서로이웃 신청 진행중"),
+                    ("text", "하루에 신청 가능한"),
+                ],
+                self.normal_wait,
+            )
+            if hit and hit[0] == "url_contains":
+                self._wait_for(
+                    [("selector", "#bothBuddyRadio, #onewayBuddyRadio, textarea"), ("idle", 300)],
+                    self.element_wait_timeout,
+                )
 
             self._wait_if_paused()
             if not self.is_running:
                 return False, "중단됨"
-            src_after = driver.page_source
-            if "하루에 신청 가능한 이웃수" in src_after and "초과" in src_after:
+
+            # 버튼 클릭 직후 뜬 JS 알림(confirm/alert)은 레이어 검사 전에 먼저 처리
+            dialog_text = self._take_dialog(hit, 0)
+            if dialog_text:
+                verdict = self._classify_popup(dialog_text)
+                if verdict:
+                    return verdict
+
+            state_after = self._probe_page()
+            if state_after["day_limit"]:
                 try:
-                    close_btn = driver.find_element(By.XPATH, "//button[contains(text(), '닫기')]")
-                    self.safe_click(driver, close_btn)
-                except (NoSuchElementException, StaleElementReferenceException):
+                    self._nnp_call("clickButtonByText", "닫기", timeout=2.0)
+                except Exception:
                     pass
                 return "DONE_DAY_LIMIT", "🎉 일일 한도 달성!"
 
-            if "서로이웃 신청 진행중입니다" in src_after:
+            if state_after["request_in_progress"]:
                 try:
-                    cancel_btns = driver.find_elements(By.XPATH, "//button[contains(text(), '취소')]")
-                    for btn in cancel_btns:
-                        if btn.is_displayed():
-                            self.safe_click(driver, btn)
-                            self.safe_sleep(0.1)
-                            return False, "스킵(이미 신청중)"
-                except (NoSuchElementException, StaleElementReferenceException):
+                    self._nnp_call("clickButtonByText", "취소", timeout=2.0)
+                except Exception:
                     pass
                 return False, "스킵(이미 신청중)"
 
-            layer_popup = driver.execute_script("""
-                var layer = document.getElementById('_alertLayer');
-                if (layer && layer.style.display !== 'none') {
-                    var dsc = layer.querySelector('.dsc');
-                    return dsc ? dsc.innerText : null;
-                }
-                return null;
-            """)
-
+            layer_popup = state_after["alert_text"]
             if layer_popup:
-                if "하루" in layer_popup and "초과" in layer_popup:
-                    return "DONE_DAY_LIMIT", "🎉 일일 한도 달성!"
-                if "선택 그룹" in layer_popup:
-                    return "STOP_GROUP_FULL", layer_popup
-                try:
-                    driver.execute_script("document.getElementById('_alertLayerClose').click();")
-                except WebDriverException:
-                    pass
-                if "5,000" in layer_popup or "5000" in layer_popup:
-                    return False, "스킵(상대 5000명)"
-                return False, f"스킵({layer_popup[:20]})"
+                verdict = self._classify_popup(layer_popup) or (False, f"스킵({layer_popup[:20]})")
+                if verdict[0] is False:
+                    self._close_layer_popup()
+                return verdict
 
             self._wait_if_paused()
             if not self.is_running:
                 return False, "중단됨"
-            current_url = driver.current_url
-            if "BuddyAddForm" not in current_url:
-                if not self.safe_get(driver, f"https://m.blog.naver.com/BuddyAddForm.naver?blogId={blog_id}"):
-                    return False, "실패(양식 페이지 로드 실패)"
-                self.safe_sleep(1.0)
-
-            page_src = driver.page_source
-            if "로그인" in page_src and "로그인이 필요" in page_src:
+            with self.tracer.span("neighbor.form_load", cat="blog"):
+                if not state_after["is_buddy_form"]:
+                    if not self.safe_get(self.driver, f"https://m.blog.naver.com/BuddyAddForm.naver?blogId={blog_id}"):
+                        return False, "실패(양식 페이지 로드 실패)"
+                form_page = self._probe_page()
+            if form_page["login_required"]:
                 return False, "실패(로그인 필요)"
 
-            try:
-                self.safe_sleep(0.2)
-                radio_exists = driver.execute_script("return document.getElementById('bothBuddyRadio') !== null;")
-
-                if not radio_exists:
-                    one_way_radio = driver.execute_script("return document.getElementById('onewayBuddyRadio') !== null;")
-                    if one_way_radio:
-                        return False, "스킵(서이추 비활성화)"
-                    if "진행 중" in page_src or "신청중" in page_src:
-                        return False, "스킵(이미 신청중)"
-                    return False, "실패(양식 없음)"
-
-                result = driver.execute_script("""
-                    try {
-                        var radio = document.getElementById('bothBuddyRadio');
-                        var label = document.querySelector("label[for='bothBuddyRadio']");
-                        if (radio.disabled || radio.getAttribute('disabled')) return 'DISABLED';
-                        if (!radio.checked && label) label.click();
-                        return 'OK';
-                    } catch(e) { return 'ERROR:' + e.message; }
-                """)
-
-                if result == "DISABLED":
-                    return False, "스킵(서이추 불가)"
-                if result and result.startswith("ERROR"):
-                    return False, f"실패({result})"
-            except WebDriverException as e:
-                return False, f"실패(라디오: {str(e)[:10]})"
+            if not form_page["has_both_radio"]:
+                if form_page["has_oneway_radio"]:
+                    return False, "스킵(서이추 비활성화)"
+                if form_page["pending_text"]:
+                    return False, "스킵(이미 신청중)"
+                return False, "실패(양식 없음)"
+
+            radio_state = self._nnp_call("selectBothRadio", timeout=4.0)
+            if radio_state == "DISABLED":
+                return False, "스킵(서이추 불가)"
+            if radio_state == "ONEWAY_ONLY":
+                return False, "스킵(서이추 비활성화)"
+            if radio_state == "NO_FORM":
+                return False, "실패(양식 없음)"
+            if isinstance(radio_state, str) and radio_state.startswith("ERROR"):
+                return False, f"실패({radio_state})"
 
             try:
-                textarea = driver.find_element(By.TAG_NAME, "textarea")
-                driver.execute_script("""
-                    var el = arguments[0];
-                    var txt = arguments[1];
-                    el.value = txt;
-                    el.dispatchEvent(new Event('input', { bubbles: true }));
-                    el.dispatchEvent(new Event('change', { bubbles: true }));
-                """, textarea, self.neighbor_msg)
-            except (NoSuchElementException, StaleElementReferenceException):
+                self._nnp_call("fillMessage", self.neighbor_msg, timeout=4.0)
+            except Exception:
                 pass
 
-            try:
-                confirm_btn = driver.find_element(By.XPATH, "//*[text()='확인']")
-                self.safe_click(driver, confirm_btn)
-                self.safe_sleep(self.fast_wait)
-            except (NoSuchElementException, StaleElementReferenceException):
-                return False, "실패(확인 버튼 없음)"
+            with self.tracer.span("neighbor.confirm", cat="blog"):
+                form_url = self._get_current_url()
+                if not self._nnp_call("clickConfirm", timeout=4.0):
+                    return False, "실패(확인 버튼 없음)"
+                hit = self._wait_for([("alert", None), ("url_changed", form_url)], self.normal_wait)
 
             self._wait_if_paused()
             if not self.is_running:
                 return False, "중단됨"
-            final_popup = driver.execute_script("""
-                var layer = document.getElementById('_alertLayer');
-                if (layer && layer.style.display !== 'none') {
-                    var dsc = layer.querySelector('.dsc');
-                    return dsc ? dsc.innerText : null;
-                }
-                return null;
-            """)
 
+            final_popup = hit[1] if hit and hit[0] == "alert" else None
             if final_popup:
-                if "하루" in final_popup and "초과" in final_popup:
-                    return "DONE_DAY_LIMIT", "🎉 일일 한도 달성!"
-                if "선택 그룹" in final_popup:
-                    return "STOP_GROUP_FULL", final_popup
-                try:
-                    driver.execute_script("document.getElementById('_alertLayerClose').click();")
-                except WebDriverException:
-                    pass
-                if "5,000" in final_popup or "5000" in final_popup:
-                    return False, "스킵(상대 5000명)"
-                return False, f"실패({final_popup[:20]})"
-
-            try:
-                WebDriverWait(driver, 0.5).until(EC.alert_is_present())
-                alert = driver.switch_to.alert
-                txt = alert.text
-                alert.accept()
-
-                if "하루" in txt and "초과" in txt:
-                    return "DONE_DAY_LIMIT", txt
-                if "선택 그룹" in txt:
-                    return "STOP_GROUP_FULL", txt
-                if "5,000" in txt or "5000" in txt:
-                    return False, "스킵(상대 5000명)"
-                if "신청" in txt or "완료" in txt:
+                verdict = self._classify_popup(final_popup)
+                if verdict is None and ("신청" in final_popup or "완료" in final_popup):
                     return True, "신청 완료"
-                return False, f"알림: {txt[:15]}"
-            except (TimeoutException, NoSuchElementException):
-                return True, "신청 완료"
+                verdict = verdict or (False, f"실패({final_popup[:20]})")
+                if verdict[0] is False:
+                    self._close_layer_popup()
+                return verdict
+
+            dialog_text = self._take_dialog(hit, self.fast_wait)
+            if dialog_text:
+                verdict = self._classify_popup(dialog_text)
+                if verdict:
+                    return verdict
+                if "신청" in dialog_text or "완료" in dialog_text:
+                    return True, "신청 완료"
+                return False, f"알림: {dialog_text[:15]}"
+            if dialog_text is not None:
+                # 대화상자가 떴지만 문구를 읽지 못함: 한도 초과 알림일 수 있으므로 성공으로 세지 않는다
+                return False, "실패(알림 확인 불가)"
+            return True, "신청 완료"
 
         except Exception as e:
+            self._last_error = type(e).__name__
             return False, f"에러: {str(e)[:15]}"
 
     # ------------------------------------------------------------------
@@ -1548,10 +1391,10 @@ class NaverBotLogic:
     # ------------------------------------------------------------------
     def _run_single_tab_loop(self, keyword):
         """WebView2(단일 뷰) 모드용 자동화 루프."""
-        search_url = f"https://search.naver.com/search.naver?where=blog&query={keyword}"
-        processed_ids = set()
-        queue = []
+        cursor = self._search_cursor(keyword)
+        queue = self._new_candidate_queue()
         consecutive_errors = 0
+        empty_refills = 0
 
         while self.is_running and self.current_count < self.target_count:
             self._wait_if_paused()
@@ -1561,33 +1404,40 @@ class NaverBotLogic:
                 self._wait_if_paused()
                 if not self.is_running:
                     break
-                self.log(f"🔄 ID 수집 중... (처리 완료: {len(processed_ids)}명)")
-                if not self.safe_get(self.driver, search_url):
+                if cursor.exhausted:
+                    self.log(f"⚠️ '{keyword}' 검색 결과를 모두 확인했습니다.")
+                    break
+                self.log(f"🔄 ID 수집 중... (처리 완료: {queue.seen_count}명, 검색 위치: {cursor.offset})")
+                # 검색 첫 화면부터 다시 스크롤하지 않고 지난번 위치에서 이어서 연다
+                if not self._open_search_cursor(cursor):
                     self.log("❌ 검색 페이지 재진입 실패")
                     break
-                self.safe_sleep(1.0)
-                self._click_blog_tab()
 
-                queue = self.collect_blog_ids(processed_ids)
+                self.collect_blog_ids(queue, cursor)
                 if not queue:
-                    self.log("⚠️ 더 이상 수집할 블로그가 없습니다.")
-                    break
+                    if not self._continue_after_empty_refill(cursor, empty_refills):
+                        break
+                    empty_refills += 1
+                    continue
+                empty_refills = 0
 
                 self.log(f"   ✅ {len(queue)}명 수집 완료!")
 
-            blog_id = queue.pop(0)
-            blacklist = {"myblog", "postlist", "buddyaddform", "likeit", "nvisitor", "blog", "domainid", "admin", "search"}
-            my_id_clean = str(self.my_blog_id or "").strip().lower()
-            if blog_id.lower() in blacklist or (my_id_clean and blog_id.lower() == my_id_clean):
-                continue
+            blog_id = queue.popleft()
 
             self.log(f"\n▶️ [{self.current_count+1}/{self.target_count}] '{blog_id}' 작업 시작")
 
             self._wait_if_paused()
             if not self.is_running:
                 break
-            if not self.safe_get(self.driver, f"https://m.blog.naver.com/{blog_id}"):
+            self._begin_blog(blog_id)
+            with self._stage("navigate"):
+                loaded = self.safe_get(self.driver, f"https://m.blog.naver.com/{blog_id}")
+                if loaded:
+                    self._wait_blog_ready()
+            if not loaded:
                 self.log("   ❌ 페이지 로드 실패")
+                self._record_outcome(blog_id, False, "실패(페이지 로드 실패)")
                 consecutive_errors += 1
                 if consecutive_errors >= 5:
                     self.log("⚠️ 연속 5회 실패. 잠시 대기...")
@@ -1595,19 +1445,21 @@ class NaverBotLogic:
                     consecutive_errors = 0
                 continue
 
-            self.safe_sleep(1.2)
             consecutive_errors = 0
 
-            current_url = self._get_current_url()
-            page_source = self._get_page_source()
-            if "MobileErrorView" in current_url or "일시적인 오류" in page_source:
+            with self._stage("probe"):
+                state = self._probe_page()
+            if state["error_page"]:
                 self.log("   ❌ 접근 불가 블로그 (Skip)")
+                self._record_outcome(blog_id, False, "접근 불가 블로그")
                 continue
 
             self._wait_if_paused()
             if not self.is_running:
                 break
-            is_friend, msg_friend = self.process_neighbor(blog_id)
+            with self._stage("neighbor"):
+                is_friend, msg_friend = self.process_neighbor(blog_id, state)
+            self._record_outcome(blog_id, is_friend, msg_friend)
 
             if is_friend == "DONE_DAY_LIMIT":
                 self.log("\n🎉 목표 달성! 오늘 할당량을 모두 채웠습니다!")
@@ -1622,18 +1474,25 @@ class NaverBotLogic:
                 self._wait_if_paused()
                 if not self.is_running:
                     break
-                self.safe_get(self.driver, f"https://m.blog.naver.com/{blog_id}")
-                self.safe_sleep(self.normal_wait)
+                if self.safe_get(self.driver, f"https://m.blog.naver.com/{blog_id}"):
+                    self._wait_blog_ready()
 
             if is_friend is True:
                 self.current_count += 1
                 self.log(f"   ✅ 성공! (현재 {self.current_count}/{self.target_count})")
                 self.update_progress(self.current_count / self.target_count)
 
-            wait_time = random.uniform(0.8, 1.5)
-            self.safe_sleep(wait_time)
+            self.safe_sleep(self._blog_interval())
 
     def start_working(self, keyword, target_count, neighbor_msg):
+        self._run_id = time.strftime("%Y%m%d-%H%M%S")
+        self._start_cdp_recording(keyword, target_count, neighbor_msg)
+        try:
+            self._start_working(keyword, target_count, neighbor_msg)
+        finally:
+            self._stop_cdp_recording()
+
+    def _start_working(self, keyword, target_count, neighbor_msg):
         if not self.connect_driver():
             self.log("❌ 브라우저 연결 실패")
             return
@@ -1653,28 +1512,40 @@ class NaverBotLogic:
         self.is_paused = False
         self.current_count = 0
 
+        self.backend_stats.reset()
+        self.negative_cache.hits = 0
+        self._run_keyword = keyword
+        self.tracer.clear()
+        self.metrics.reset()
         self.log("🚀 작업 시작")
         self.update_status("작업 실행 중...", "blue")
 
         if self._webview2_mode:
             self._run_single_tab_loop(keyword)
             self.is_running = False
+            self._log_backend_stats()
             self.log("🏁 작업 종료")
             self.update_status("작업 완료", "green")
             return
 
-        if not self._navigate_to_blog_search(keyword):
+        cursor = self._search_cursor(keyword)
+        if cursor.exhausted:
+            self.log(f"⚠️ '{keyword}' 검색 결과를 모두 확인했습니다. 다른 키워드를 사용하세요.")
+            self.is_running = False
+            self.update_status("검색 결과 소진", "orange")
+            return
+
+        # 검색 탭은 작업 내내 유지되므로 재수집은 같은 문서에서 이어서 스크롤한다
+        if not self._open_search_cursor(cursor):
             self.log("❌ 검색 페이지 로드 실패")
             self.is_running = False
             self.update_status("검색 실패", "red")
             return
 
-        self._click_blog_tab()
-
         main_window = self.driver.current_window_handle
-        processed_ids = set()
-        queue = []
+        queue = self._new_candidate_queue()
         consecutive_errors = 0
+        empty_refills = 0
 
         while self.is_running and self.current_count < self.target_count:
             self._wait_if_paused()
@@ -1684,7 +1555,7 @@ class NaverBotLogic:
                 self._wait_if_paused()
                 if not self.is_running:
                     break
-                self.log(f"🔄 ID 수집 중... (처리 완료: {len(processed_ids)}명)")
+                self.log(f"🔄 ID 수집 중... (처리 완료: {queue.seen_count}명)")
 
                 try:
                     if not self.driver.window_handles:
@@ -1695,19 +1566,18 @@ class NaverBotLogic:
                     self.log("❌ 메인 탭 접근 불가")
                     break
 
-                queue = self.collect_blog_ids(processed_ids)
+                self.collect_blog_ids(queue, cursor)
 
                 if not queue:
-                    self.log("⚠️ 더 이상 수집할 블로그가 없습니다.")
-                    break
+                    if not self._continue_after_empty_refill(cursor, empty_refills):
+                        break
+                    empty_refills += 1
+                    continue
+                empty_refills = 0
 
                 self.log(f"   ✅ {len(queue)}명 수집 완료!")
 
-            blog_id = queue.pop(0)
-            blacklist = {"myblog", "postlist", "buddyaddform", "likeit", "nvisitor", "blog", "domainid", "admin", "search"}
-            my_id_clean = str(self.my_blog_id or "").strip().lower()
-            if blog_id.lower() in blacklist or (my_id_clean and blog_id.lower() == my_id_clean):
-                continue
+            blog_id = queue.popleft()
 
             self.log(f"\n▶️ [{self.current_count+1}/{self.target_count}] '{blog_id}' 작업 시작")
 
@@ -1715,10 +1585,16 @@ class NaverBotLogic:
                 self._wait_if_paused()
                 if not self.is_running:
                     break
-                self.driver.switch_to.new_window("tab")
-                if not self.safe_get(self.driver, f"https://m.blog.naver.com/{blog_id}"):
+                self._begin_blog(blog_id)
+                with self._stage("tab"):
+                    self._acquire_worker_tab(main_window)
+                with self._stage("navigate"):
+                    loaded = self.safe_get(self.driver, f"https://m.blog.naver.com/{blog_id}")
+                    if loaded:
+                        self._wait_blog_ready()
+                if not loaded:
                     self.log("   ❌ 페이지 로드 실패")
-                    self._close_tab_and_return(main_window)
+                    self._record_outcome(blog_id, False, "실패(페이지 로드 실패)")
                     consecutive_errors += 1
                     if consecutive_errors >= 5:
                         self.log("⚠️ 연속 5회 실패. 잠시 대기...")
@@ -1727,57 +1603,46 @@ class NaverBotLogic:
                     continue
             except WebDriverException as e:
                 self.log(f"   ⚠️ 탭 열기 실패: {str(e)[:20]}")
-                self._close_tab_and_return(main_window)
+                self._release_worker_tab(main_window)
                 continue
 
-            self.safe_sleep(1.5)
             consecutive_errors = 0
 
-            current_url = self.driver.current_url
-            page_source = self.driver.page_source
-
-            if "MobileErrorView" in current_url or "일시적인 오류" in page_source:
+            with self._stage("probe"):
+                state = self._probe_page()
+            if state["error_page"]:
                 self.log("   ❌ 접근 불가 블로그 (Skip)")
-                self._close_tab_and_return(main_window)
+                self._record_outcome(blog_id, False, "접근 불가 블로그")
                 continue
 
             self._wait_if_paused()
             if not self.is_running:
-                self._close_tab_and_return(main_window)
                 break
-            is_friend, msg_friend = self.process_neighbor(blog_id)
+            with self._stage("neighbor"):
+                is_friend, msg_friend = self.process_neighbor(blog_id, state)
+            self._record_outcome(blog_id, is_friend, msg_friend)
 
             if is_friend == "DONE_DAY_LIMIT":
                 self.log("\n🎉 목표 달성! 오늘 할당량을 모두 채웠습니다!")
-                self._close_tab_and_return(main_window)
                 break
 
             if is_friend == "STOP_GROUP_FULL":
                 self.log("\n⛔ 내 이웃 그룹이 가득 찼습니다.")
-                self._close_tab_and_return(main_window)
                 break
 
+            # 작업 탭은 다음 블로그로 바로 이동하므로 양식 페이지에서 되돌아가지 않는다
             self.log(f"   └ 서이추: {msg_friend}")
 
-            if "BuddyAddForm" in self.driver.current_url:
-                self._wait_if_paused()
-                if not self.is_running:
-                    self._close_tab_and_return(main_window)
-                    break
-                self.safe_get(self.driver, f"https://m.blog.naver.com/{blog_id}")
-                self.safe_sleep(self.normal_wait)
-
             if is_friend is True:
                 self.current_count += 1
                 self.log(f"   ✅ 성공! (현재 {self.current_count}/{self.target_count})")
                 self.update_progress(self.current_count / self.target_count)
 
-            self._close_tab_and_return(main_window)
-
-            wait_time = random.uniform(0.8, 1.5)
-            self.safe_sleep(wait_time)
+            self.safe_sleep(self._blog_interval())
 
+        self._release_worker_tab(main_window)
         self.is_running = False
         self.is_paused = False
+        self._log_backend_stats()
         self.log("🏁 작업 종료")
         self.update_status("작업 완료", "green")
@@ -0,0 +1,638 @@
+import json
+import time
+import threading
+from collections import deque
+
+from selenium.common.exceptions import (
+    TimeoutException,
+    WebDriverException,
+    NoSuchElementException,
+    UnexpectedAlertPresentException,
+)
+
+import resource_profile
+from cdp_client import CdpConnection
+from page_scripts import EMPTY_PAGE_STATE, NNP_HELPER_JS, NNP_MISSING, NNP_VERSION, nnp_call_script
+
+
+class BrowserBackend:
+    """NaverBotLogic이 사용하는 브라우저 조작 인터페이스.
+
+    하위 클래스는 기본 조작(navigate/current_url/page_source/run_script/
+    add_init_script/get_cookies/take_dialog)만 구현하고, window.__nnp 헬퍼
+    호출과 페이지 상태 probe는 이 클래스가 run_script 위에서 공통 처리한다.
+    """
+
+    name = "base"
+    # 누적 수신 바이트. 백엔드가 알 수 없으면 None
+    bytes_received = None
+    # wait_for가 페이지 스크립트 실행 실패를 연속 몇 번까지 다시 시도할지 (간격은 0.05초부터 두 배씩, 최대 0.5초)
+    WAIT_MAX_FAILURES = 8
+    # 페이지 안 대기 한 번의 상한(초). None이면 남은 시간 전체를 한 번에 기다린다.
+    # 값을 주면 조각마다 cancel을 확인한다 ('idle' 조건의 유휴 시간은 이 값보다 짧아야 한다)
+    WAIT_SLICE = None
+    # JS 대화상자를 이벤트로 받아 두는지 (True면 take_dialog는 대화상자가 있을 때만 왕복이 생긴다)
+    dialog_events = False
+
+    def navigate(self, url):
+        raise NotImplementedError
+
+    def current_url(self):
+        raise NotImplementedError
+
+    def page_source(self):
+        raise NotImplementedError
+
+    def run_script(self, script, timeout=4.0):
+        """함수 본문 형태의 JS를 실행하고 return 값을 돌려준다."""
+        raise NotImplementedError
+
+    def add_init_script(self, source):
+        """이후 열리는 모든 문서에 스크립트를 자동 주입."""
+        raise NotImplementedError
+
+    def get_cookies(self, urls=None):
+        raise NotImplementedError
+
+    def take_dialog(self, timeout=0.5):
+        """열린 JS 대화상자(alert 등)를 수락하고 문구를 반환. 없으면 None."""
+        raise NotImplementedError
+
+    def set_resource_blocking(self, enabled):
+        """경량 프로필(resource_profile) 적용 여부. 적용되면 True."""
+        return False
+
+    def cancel_pending(self):
+        """진행 중인 이동/조건 대기를 즉시 끝낸다 (중지 요청 시)."""
+
+    # ------------------------------------------------------------------
+    # 공통: window.__nnp 헬퍼
+    # ------------------------------------------------------------------
+    def install_helper(self):
+        try:
+            self.add_init_script(NNP_HELPER_JS)
+        except Exception:
+            pass
+        try:
+            self.run_script(NNP_HELPER_JS, timeout=3.0)
+        except Exception:
+            pass
+
+    def call_helper(self, fn, *args, timeout=4.0):
+        """window.__nnp 헬퍼 함수 호출. 현재 문서에 헬퍼가 없으면 주입 후 한 번 재시도."""
+        script = nnp_call_script(fn, *args)
+        value = self.run_script(script, timeout=timeout)
+        if value == NNP_MISSING:
+            self.run_script(NNP_HELPER_JS, timeout=timeout)
+            value = self.run_script(script, timeout=timeout)
+            if value == NNP_MISSING:
+                raise RuntimeError(f"__nnp 헬퍼 주입 실패: {fn}")
+        return value
+
+    def wait_for(self, conditions, timeout=5.0, cancel=None):
+        """조건 [(kind, arg), ...] 중 하나가 만족될 때까지 페이지 안에서 대기.
+
+        kind: selector / gone / alert / url_changed / url_contains / text / count / idle
+        반환: 먼저 만족한 (kind, value), JS 대화상자가 열리면 ("dialog", 문구 또는 None), 시간 초과 시 None.
+        timeout은 상한일 뿐이며 조건이 만족되는 즉시 돌아온다. cancel(Event)이 켜지면 None.
+        """
+        conds = [[str(kind), arg] for kind, arg in conditions]
+        deadline = time.monotonic() + max(0.0, float(timeout or 0))
+        failures = 0
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or (cancel is not None and cancel.is_set()):
+                return None
+            budget = remaining if self.WAIT_SLICE is None else min(remaining, self.WAIT_SLICE)
+            try:
+                hit = self._wait_in_page(conds, budget)
+            except Exception:
+                # 이동 중에는 실행 컨텍스트가 사라지므로 새 문서에서 다시 대기.
+                # 분리된 프레임처럼 계속 실패하면 간격을 늘리다가 포기한다
+                failures += 1
+                if not self._retry_pause(failures, deadline):
+                    return None
+                continue
+            if hit == NNP_MISSING:
+                try:
+                    self.run_script(NNP_HELPER_JS, timeout=min(remaining, 3.0))
+                except Exception:
+                    failures += 1
+                    if not self._retry_pause(failures, deadline):
+                        return None
+                continue
+            failures = 0
+            if isinstance(hit, (list, tuple)) and len(hit) == 2:
+                if hit[0] == "dialog":
+                    return "dialog", hit[1]
+                return conds[int(hit[0])][0], hit[1]
+            if budget < remaining:
+                continue
+            return None
+
+    def _retry_pause(self, failures, deadline):
+        """wait_for 재시도 전 대기. 연속 실패가 WAIT_MAX_FAILURES에 닿으면 False."""
+        if failures >= self.WAIT_MAX_FAILURES:
+            return False
+        time.sleep(min(0.05 * (2 ** (failures - 1)), 0.5, max(0.0, deadline - time.monotonic())))
+        return True
+
+    def _wait_in_page(self, conds, remaining):
+        """__nnp.waitFor 한 번 실행. [index, value] / None / NNP_MISSING 반환."""
+        script = nnp_call_script("waitFor", conds, int(remaining * 1000))
+        return self.run_script(script, timeout=remaining + 1.0)
+
+    def probe(self):
+        """현재 페이지 상태를 페이지 안에서 한 번에 검사해 작은 dict로 반환 (outerHTML 전송 없음)."""
+        try:
+            snap = self.call_helper("probe", timeout=5.0)
+        except Exception:
+            snap = None
+        state = dict(EMPTY_PAGE_STATE)
+        if isinstance(snap, dict):
+            state.update(snap)
+        return state
+
+
+class SeleniumBackend(BrowserBackend):
+    name = "selenium"
+
+    # waitFor 상한보다 넉넉한 비동기 스크립트 제한 (한 번만 설정)
+    SCRIPT_TIMEOUT = 60
+    # chromedriver는 명령을 차례로 처리해 진행 중인 execute_async_script를 끊을 수 없으므로
+    # 조건 대기를 1초 조각으로 나눠 그 사이마다 중지 요청을 확인한다
+    WAIT_SLICE = 1.0
+
+    def __init__(self, driver):
+        self.driver = driver
+        try:
+            self.driver.set_script_timeout(self.SCRIPT_TIMEOUT)
+        except WebDriverException:
+            pass
+
+    def navigate(self, url):
+        try:
+            self.driver.get(url)
+            return True
+        except TimeoutException:
+            try:
+                self.driver.execute_script("window.stop();")
+            except WebDriverException:
+                pass
+            return False
+        except WebDriverException:
+            return False
+
+    def current_url(self):
+        try:
+            return str(self.driver.current_url or "")
+        except Exception:
+            return ""
+
+    def page_source(self):
+        try:
+            return str(self.driver.page_source or "")
+        except Exception:
+            return ""
+
+    def run_script(self, script, timeout=4.0):
+        return self.driver.execute_script(script)
+
+    def add_init_script(self, source):
+        self.driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": source})
+
+    def get_cookies(self, urls=None):
+        return list(self.driver.get_cookies() or [])
+
+    def set_resource_blocking(self, enabled):
+        # execute_cdp_cmd는 현재 탭에만 적용되므로 탭을 새로 열 때마다 다시 호출해야 한다
+        enabled = bool(enabled)
+        urls = resource_profile.blocked_url_patterns() if enabled else []
+        try:
+            self.driver.execute_cdp_cmd("Network.enable", {})
+            self.driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": urls})
+        except WebDriverException:
+            return False
+        return enabled
+
+    def cancel_pending(self):
+        """Selenium은 진행 중인 명령을 중단할 수 없다. 중지 지연은 조건 대기는 WAIT_SLICE초,
+        페이지 이동은 page_load_timeout까지로 제한된다."""
+
+    def _wait_in_page(self, conds, remaining):
+        script = (
+            "var done = arguments[arguments.length - 1];"
+            f"if (!(window.__nnp && window.__nnp.version === {NNP_VERSION})) {{ done({json.dumps(NNP_MISSING)}); return; }}"
+            "window.__nnp.waitFor(arguments[0], arguments[1]).then(done, function () { done(null); });"
+        )
+        try:
+            return self.driver.execute_async_script(script, conds, int(remaining * 1000))
+        except UnexpectedAlertPresentException as e:
+            # chromedriver 기본 설정은 이 시점에 이미 대화상자를 닫았으므로 take_dialog로는 문구를 읽을 수 없다
+            return ["dialog", e.alert_text or ""]
+
+    def take_dialog(self, timeout=0.5):
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.webdriver.support import expected_conditions as EC
+
+        try:
+            WebDriverWait(self.driver, timeout).until(EC.alert_is_present())
+            alert = self.driver.switch_to.alert
+            text = alert.text
+            alert.accept()
+            return str(text or "")
+        except (TimeoutException, NoSuchElementException, WebDriverException):
+            return None
+
+
+class CdpBackend(BrowserBackend):
+    """WebView2 디버그 포트에 붙는 CDP 백엔드. 연결 수명은 CdpConnection이 관리한다."""
+
+    name = "cdp"
+    dialog_events = True
+
+    def __init__(self, log_func=None, page_load_timeout=15, ready_level="DOMContentLoaded"):
+        self.connection = CdpConnection(on_connected=self._on_connected, log_func=log_func)
+        self.page_load_timeout = float(page_load_timeout or 15)
+        self.ready_level = str(ready_level or "DOMContentLoaded")
+        self._lifecycle_enabled = False
+        self._dialogs = deque(maxlen=8)
+        self._dialog_event = threading.Event()
+        # 대화상자/취소 시 깨울 대기 Event 목록
+        self._wakers = set()
+        self._cancel_seq = 0
+        self._block_resources = False
+        self.blocked_requests = 0
+        self.bytes_received = 0
+
+    @property
+    def client(self):
+        return self.connection.client
+
+    def cmd(self, method, params=None, timeout=8.0):
+        client = self.client
+        if not client:
+            raise RuntimeError("CDP 미연결")
+        return client.send(method, params, timeout=timeout)
+
+    def on(self, event, callback):
+        """CDP 이벤트 구독. 구독 해제 함수 반환."""
+        client = self.client
+        if not client:
+            raise RuntimeError("CDP 미연결")
+        return client.on(event, callback)
+
+    def _on_connected(self, client):
+        """(재)연결 직후 도메인 활성화와 헬퍼 주입. 명령은 병렬로 보내 한 번의 왕복으로 끝낸다."""
+        futures = {
+            method: client.send_async(method, params)
+            for method, params in (
+                ("Runtime.enable", None),
+                ("Page.enable", None),
+                ("Page.setLifecycleEventsEnabled", {"enabled": True}),
+                ("Network.enable", None),
+            )
+        }
+        for method, fut in futures.items():
+            try:
+                fut.result(timeout=2.0)
+                ok = True
+            except Exception:
+                ok = False
+            if method == "Page.setLifecycleEventsEnabled":
+                self._lifecycle_enabled = ok
+        client.on("Page.javascriptDialogOpening", self._on_dialog_opening)
+        client.on("Fetch.requestPaused", self._on_request_paused)
+        client.on("Network.loadingFinished", self._on_loading_finished)
+        if self._block_resources:
+            self._enable_fetch(client)
+        self.install_helper()
+
+    def _on_loading_finished(self, params):
+        self.bytes_received += int(params.get("encodedDataLength") or 0)
+
+    def _on_dialog_opening(self, params):
+        self._dialogs.append(str(params.get("message") or ""))
+        self._dialog_event.set()
+        # 대화상자가 열리면 페이지 JS가 멈추므로 waitFor 대기를 즉시 깨운다
+        self._wake_all()
+
+    def _wake_all(self):
+        for wake in list(self._wakers):
+            wake.set()
+
+    def cancel_pending(self):
+        self._cancel_seq += 1
+        self._wake_all()
+        client = self.client
+        if client:
+            client.cancel_pending()
+
+    def _enable_fetch(self, client):
+        try:
+            client.send("Fetch.enable", {"patterns": resource_profile.fetch_patterns()}, timeout=2.0)
+            return True
+        except Exception:
+            return False
+
+    def _on_request_paused(self, params):
+        # reader 스레드에서 호출되므로 응답을 기다리지 않고 send_async로만 처리
+        client = self.client
+        if not client:
+            return
+        request = params.get("request") or {}
+        headers = request.get("headers") or {}
+        referer = headers.get("Referer") or headers.get("referer") or ""
+        request_id = params.get("requestId")
+        if not self._block_resources or resource_profile.is_allowed(request.get("url"), referer):
+            client.send_async("Fetch.continueRequest", {"requestId": request_id})
+            return
+        self.blocked_requests += 1
+        client.send_async("Fetch.failRequest", {"requestId": request_id, "errorReason": "BlockedByClient"})
+
+    # ------------------------------------------------------------------
+    # BrowserBackend
+    # ------------------------------------------------------------------
+    def set_resource_blocking(self, enabled):
+        enabled = bool(enabled)
+        if enabled == self._block_resources:
+            return enabled
+        self._block_resources = enabled
+        client = self.client
+        if not client:
+            # 다음 연결 시 _on_connected에서 적용
+            return enabled
+        if enabled:
+            return self._enable_fetch(client)
+        try:
+            client.send("Fetch.disable", timeout=2.0)
+        except Exception:
+            pass
+        return False
+
+    def navigate(self, url, ready_level=None):
+        """Page.navigate 후 해당 frame/loader의 lifecycle 이벤트로 로드 완료 판정.
+
+        ready_level: "commit" | "DOMContentLoaded" | "load" | "networkAlmostIdle" | "networkIdle"
+        """
+        level = str(ready_level or self.ready_level)
+        if not self._lifecycle_enabled:
+            return self._navigate_polling(url)
+
+        reached = set()
+        done = threading.Event()
+        target = {}
+        seq = self._cancel_seq
+
+        def _on_lifecycle(params):
+            if params.get("name") != level:
+                return
+            key = (params.get("frameId"), params.get("loaderId"))
+            reached.add(key)
+            if target and key == (target.get("frameId"), target.get("loaderId")):
+                done.set()
+
+        unsubscribe = self.on("Page.lifecycleEvent", _on_lifecycle)
+        try:
+            result = self.cmd("Page.navigate", {"url": str(url)}, timeout=10.0)
+            if result.get("errorText"):
+                return False
+            loader_id = result.get("loaderId")
+            if level == "commit" or not loader_id:
+                # 같은 문서 내 이동(해시 변경 등)은 loaderId가 없다
+                return True
+            target["frameId"] = result.get("frameId")
+            target["loaderId"] = loader_id
+            if (target["frameId"], loader_id) in reached:
+                return True
+            self._wakers.add(done)
+            return done.wait(self.page_load_timeout) and seq == self._cancel_seq
+        finally:
+            self._wakers.discard(done)
+            unsubscribe()
+
+    def _navigate_polling(self, url):
+        """lifecycle 이벤트를 쓸 수 없을 때의 readyState 폴링 방식."""
+        self.cmd("Page.navigate", {"url": str(url)}, timeout=10.0)
+        deadline = time.time() + self.page_load_timeout
+        while time.time() < deadline:
+            try:
+                state = self.run_script("return document.readyState;", timeout=3.0)
+                if state in ("interactive", "complete"):
+                    return True
+            except Exception:
+                pass
+            time.sleep(0.2)
+        return False
+
+    def current_url(self):
+        try:
+            return str(self.run_script("return location.href || '';", timeout=3.0) or "")
+        except Exception:
+            return ""
+
+    def page_source(self):
+        try:
+            return str(
+                self.run_script(
+                    "return document.documentElement ? document.documentElement.outerHTML : '';",
+                    timeout=5.0,
+                )
+                or ""
+            )
+        except Exception:
+            return ""
+
+    @staticmethod
+    def _evaluate_params(script):
+        return {
+            "expression": f"(() => {{ {script} }})()",
+            "returnByValue": True,
+            "awaitPromise": True,
+        }
+
+    def run_script(self, script, timeout=4.0):
+        result = self.cmd("Runtime.evaluate", self._evaluate_params(script), timeout=timeout)
+        return self._evaluate_value(result)
+
+    def _wait_in_page(self, conds, remaining):
+        """Runtime.evaluate(awaitPromise)로 waitFor를 기다리되, JS 대화상자가 열리면 바로 반환."""
+        client = self.client
+        if not client:
+            raise RuntimeError("CDP 미연결")
+        if self._dialogs:
+            return ["dialog", None]
+        wake = threading.Event()
+        self._wakers.add(wake)
+        try:
+            fut = client.send_async(
+                "Runtime.evaluate",
+                self._evaluate_params(nnp_call_script("waitFor", conds, int(remaining * 1000))),
+            )
+            fut.add_done_callback(lambda _f: wake.set())
+            if not wake.wait(remaining + 1.0):
+                return None
+        finally:
+            self._wakers.discard(wake)
+        if not fut.done():
+            # 대화상자가 열렸거나 중지 요청으로 깨어난 경우
+            return ["dialog", None] if self._dialogs else None
+        return self._evaluate_value(fut.result())
+
+    @staticmethod
+    def _evaluate_value(result):
+        if result.get("exceptionDetails"):
+            detail = result["exceptionDetails"]
+            text = ""
+            if isinstance(detail, dict):
+                text = str(detail.get("text") or detail.get("exception", {}).get("description") or "")
+            raise RuntimeError(text or "Runtime.evaluate 실패")
+        return (result.get("result") or {}).get("value")
+
+    def add_init_script(self, source):
+        self.cmd("Page.addScriptToEvaluateOnNewDocument", {"source": source}, timeout=3.0)
+
+    def get_cookies(self, urls=None):
+        params = {"urls": list(urls)} if urls else {}
+        data = self.cmd("Network.getCookies", params, timeout=4.0)
+        return list(data.get("cookies") or [])
+
+    def take_dialog(self, timeout=0.5):
+        if not self._dialogs and not self._dialog_event.wait(timeout):
+            return None
+        self._dialog_event.clear()
+        try:
+            text = self._dialogs.popleft()
+        except IndexError:
+            return None
+        try:
+            self.cmd("Page.handleJavaScriptDialog", {"accept": True}, timeout=2.0)
+        except Exception:
+            pass
+        return text
+
+
+class OperationStats:
+    """백엔드 조작별 호출 수(왕복 수), 누적/최대 지연, 반환 바이트 집계."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._ops = {}
+        # 전체 조작 수 (블로그별 왕복 수 계산용)
+        self.calls = 0
+
+    def record(self, op, elapsed, nbytes=0):
+        with self._lock:
+            self.calls += 1
+            entry = self._ops.get(op)
+            if entry is None:
+                entry = self._ops[op] = {"count": 0, "total": 0.0, "max": 0.0, "bytes": 0}
+            entry["count"] += 1
+            entry["total"] += elapsed
+            entry["bytes"] += nbytes
+            if elapsed > entry["max"]:
+                entry["max"] = elapsed
+
+    def snapshot(self):
+        with self._lock:
+            return {op: dict(entry) for op, entry in self._ops.items()}
+
+    def reset(self):
+        with self._lock:
+            self._ops.clear()
+            self.calls = 0
+
+    def summary_lines(self):
+        """호출 누적 시간이 큰 순으로 사람이 읽을 요약 문자열 목록."""
+        lines = []
+        ops = sorted(self.snapshot().items(), key=lambda kv: kv[1]["total"], reverse=True)
+        for op, e in ops:
+            avg_ms = (e["total"] / e["count"] * 1000.0) if e["count"] else 0.0
+            lines.append(
+                f"{op}: {e['count']}회, 평균 {avg_ms:.1f}ms, 최대 {e['max'] * 1000.0:.1f}ms, {e['bytes']}B"
+            )
+        return lines
+
+
+def _result_size(value):
+    if isinstance(value, str):
+        return len(value)
+    return 0
+
+
+class TimedBackend(BrowserBackend):
+    """다른 백엔드를 감싸 조작별 왕복 수와 지연을 OperationStats에 기록하는 데코레이터.
+
+    기본 조작은 각각 1회 왕복으로 집계되고, 헬퍼 호출은 "helper.<fn>"으로 따로 집계된다.
+    대화상자를 이벤트로 받는 백엔드의 take_dialog는 실제로 대화상자를 닫았을 때만 집계한다.
+    """
+
+    def __init__(self, inner, stats=None):
+        self.inner = inner
+        self.stats = stats if stats is not None else OperationStats()
+
+    @property
+    def name(self):
+        return self.inner.name
+
+    @property
+    def bytes_received(self):
+        return self.inner.bytes_received
+
+    @property
+    def dialog_events(self):
+        return self.inner.dialog_events
+
+    def __getattr__(self, item):
+        # cmd/on/connection 등 백엔드 고유 기능은 그대로 위임
+        return getattr(self.inner, item)
+
+    def _timed(self, op, fn, *args, **kwargs):
+        t0 = time.perf_counter()
+        result = None
+        try:
+            result = fn(*args, **kwargs)
+            return result
+        finally:
+            self.stats.record(op, time.perf_counter() - t0, _result_size(result))
+
+    def navigate(self, url, **kwargs):
+        return self._timed("navigate", self.inner.navigate, url, **kwargs)
+
+    def current_url(self):
+        return self._timed("current_url", self.inner.current_url)
+
+    def page_source(self):
+        return self._timed("page_source", self.inner.page_source)
+
+    def run_script(self, script, timeout=4.0):
+        return self._timed("run_script", self.inner.run_script, script, timeout=timeout)
+
+    def add_init_script(self, source):
+        return self._timed("add_init_script", self.inner.add_init_script, source)
+
+    def get_cookies(self, urls=None):
+        return self._timed("get_cookies", self.inner.get_cookies, urls)
+
+    def take_dialog(self, timeout=0.5):
+        if not self.dialog_events:
+            return self._timed("take_dialog", self.inner.take_dialog, timeout)
+        t0 = time.perf_counter()
+        text = self.inner.take_dialog(timeout)
+        if text is not None:
+            self.stats.record("take_dialog", time.perf_counter() - t0, _result_size(text))
+        return text
+
+    def call_helper(self, fn, *args, timeout=4.0):
+        return self._timed(f"helper.{fn}", self.inner.call_helper, fn, *args, timeout=timeout)
+
+    def set_resource_blocking(self, enabled):
+        return self.inner.set_resource_blocking(enabled)
+
+    def cancel_pending(self):
+        return self.inner.cancel_pending()
+
+    def wait_for(self, conditions, timeout=5.0, cancel=None):
+        conditions = list(conditions)
+        op = "wait." + "|".join(str(kind) for kind, _arg in conditions)
+        return self._timed(op, self.inner.wait_for, conditions, timeout=timeout, cancel=cancel)
@@ -0,0 +1,60 @@
+from collections import deque
+
+from naver_core import is_candidate_id
+
+
+class CandidateQueue:
+    """순서를 유지하는 중복 없는 서이추 후보 대기열.
+
+    deque + set 색인으로 추가/꺼내기/포함 검사가 모두 O(1)이고, 이번 실행에서 한 번이라도
+    본 ID(대기열에 넣었거나 필터로 걸러진 ID)는 다시 받지 않는다. prefilter는
+    ID 목록을 받아 남길 목록을 돌려주는 함수로, 배치마다 한 번씩 호출된다.
+    """
+
+    def __init__(self, exclude=(), prefilters=()):
+        self._items = deque()
+        self._index = set()
+        self._seen = set()
+        self._exclude = frozenset(str(x).strip().lower() for x in exclude if str(x or "").strip())
+        self._prefilters = list(prefilters)
+
+    def __len__(self):
+        return len(self._items)
+
+    def __contains__(self, blog_id):
+        return str(blog_id).lower() in self._index
+
+    def __iter__(self):
+        return iter(self._items)
+
+    @property
+    def seen_count(self):
+        return len(self._seen)
+
+    def add_prefilter(self, func):
+        self._prefilters.append(func)
+
+    def extend(self, blog_ids):
+        """ID 배치를 한 번에 추가하고 실제로 들어간 수를 반환."""
+        seen = self._seen
+        exclude = self._exclude
+        batch = []
+        for bid in blog_ids:
+            key = bid.lower()
+            if key in seen or key in exclude or not is_candidate_id(bid):
+                continue
+            seen.add(key)
+            batch.append(bid)
+        for func in self._prefilters:
+            if not batch:
+                break
+            batch = func(batch)
+        for bid in batch:
+            self._items.append(bid)
+            self._index.add(bid.lower())
+        return len(batch)
+
+    def popleft(self):
+        bid = self._items.popleft()
+        self._index.discard(bid.lower())
+        return bid
@@ -0,0 +1,468 @@
+import json
+import time
+import socket
+import itertools
+import threading
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+
+# websocket-client는 첫 연결 때 불러온다 (Selenium만 쓰는 실행은 import 비용 없음)
+_websocket = None
+
+
+def _websocket_module():
+    """websocket 모듈. 미설치면 None."""
+    global _websocket
+    if _websocket is None:
+        try:
+            import websocket
+        except Exception:
+            websocket = False
+        _websocket = websocket
+    return _websocket or None
+
+
+# WebView2/Chrome 버전에 따라 허용되는 Origin이 달라 순서대로 시도한다
+ORIGIN_STRATEGIES = (
+    {"suppress_origin": True},
+    {"origin": "http://127.0.0.1"},
+    {"origin": "http://localhost"},
+    {"origin": "null"},
+    {},
+)
+
+
+class CdpError(RuntimeError):
+    """CDP 명령 실패 (프로토콜 에러 응답 또는 연결 종료)."""
+
+
+class CdpTimeout(CdpError):
+    """CDP 명령 응답 대기 시간 초과."""
+
+
+class CdpClient:
+    """DevTools 웹소켓 위에서 동작하는 다중화 CDP 클라이언트.
+
+    백그라운드 reader 스레드가 응답을 id별 Future로 라우팅하고,
+    이벤트는 구독자 콜백으로 전달한다. 여러 스레드가 동시에 명령을 보내도
+    서로의 응답/이벤트를 버리지 않는다.
+    """
+
+    def __init__(self, ws, on_close=None):
+        self._ws = ws
+        self._on_close = on_close
+        self._ids = itertools.count(1)
+        self._send_lock = threading.Lock()
+        self._state_lock = threading.Lock()
+        self._pending = {}
+        self._listeners = {}
+        self._closed = threading.Event()
+        # 명령/응답/이벤트 기록기 (cdp_replay.CdpRecorder, 기본 꺼짐)
+        self.recorder = None
+        self._ws.settimeout(None)
+        self._reader = threading.Thread(target=self._read_loop, name="cdp-reader", daemon=True)
+        self._reader.start()
+
+    @property
+    def is_connected(self):
+        return not self._closed.is_set() and self._reader.is_alive()
+
+    def ping(self):
+        """웹소켓 ping 프레임으로 소켓 생존 확인 (CDP 왕복 없음)."""
+        if not self.is_connected:
+            return False
+        try:
+            with self._send_lock:
+                self._ws.ping()
+            return True
+        except Exception:
+            return False
+
+    # ------------------------------------------------------------------
+    # 명령
+    # ------------------------------------------------------------------
+    def send_async(self, method, params=None):
+        """명령을 전송하고 응답 Future를 즉시 반환."""
+        fut = Future()
+        if self._closed.is_set():
+            fut.set_exception(CdpError("CDP 미연결"))
+            return fut
+        req_id = next(self._ids)
+        payload = json.dumps(
+            {"id": req_id, "method": str(method), "params": params or {}},
+            ensure_ascii=False,
+        )
+        fut.cdp_id = req_id
+        with self._state_lock:
+            self._pending[req_id] = fut
+        recorder = self.recorder
+        if recorder is not None:
+            recorder.command(req_id, method, params)
+        try:
+            with self._send_lock:
+                self._ws.send(payload)
+        except Exception as e:
+            with self._state_lock:
+                self._pending.pop(req_id, None)
+            if not fut.done():
+                fut.set_exception(CdpError(f"CDP 전송 실패: {e}"))
+        return fut
+
+    def send(self, method, params=None, timeout=8.0):
+        """명령을 전송하고 응답 result를 반환. 실패 시 CdpError."""
+        fut = self.send_async(method, params)
+        try:
+            return fut.result(timeout=timeout)
+        except FutureTimeoutError:
+            with self._state_lock:
+                self._pending.pop(getattr(fut, "cdp_id", None), None)
+            raise CdpTimeout(f"{method} 응답 시간 초과 ({timeout:.1f}s)")
+
+    # ------------------------------------------------------------------
+    # 이벤트
+    # ------------------------------------------------------------------
+    def on(self, event, callback):
+        """이벤트 구독. 구독 해제 함수를 반환한다.
+
+        콜백은 reader 스레드에서 params(dict) 하나를 인자로 호출되므로 짧게 유지해야 한다.
+        """
+        with self._state_lock:
+            self._listeners.setdefault(str(event), []).append(callback)
+
+        def _unsubscribe():
+            self.off(event, callback)
+
+        return _unsubscribe
+
+    def off(self, event, callback):
+        with self._state_lock:
+            callbacks = self._listeners.get(str(event))
+            if not callbacks:
+                return
+            try:
+                callbacks.remove(callback)
+            except ValueError:
+                pass
+            if not callbacks:
+                self._listeners.pop(str(event), None)
+
+    def wait_for_event(self, event, predicate=None, timeout=10.0):
+        """조건에 맞는 이벤트 한 건을 기다린다. 시간 초과 시 None."""
+        hit = threading.Event()
+        box = {}
+
+        def _listener(params):
+            if hit.is_set():
+                return
+            try:
+                if predicate is not None and not predicate(params):
+                    return
+            except Exception:
+                return
+            box["params"] = params
+            hit.set()
+
+        unsubscribe = self.on(event, _listener)
+        try:
+            hit.wait(timeout)
+        finally:
+            unsubscribe()
+        return box.get("params")
+
+    # ------------------------------------------------------------------
+    # 종료
+    # ------------------------------------------------------------------
+    def close(self):
+        if self._closed.is_set():
+            return
+        self._closed.set()
+        try:
+            self._ws.abort()
+        except Exception:
+            pass
+        try:
+            self._ws.close()
+        except Exception:
+            pass
+        self._fail_pending(CdpError("CDP 연결 종료"))
+
+    def cancel_pending(self):
+        """응답 대기 중인 명령을 모두 CdpError로 끝낸다 (연결은 유지, 늦은 응답은 무시)."""
+        self._fail_pending(CdpError("CDP 명령 취소됨"))
+
+    def _fail_pending(self, error):
+        with self._state_lock:
+            pending = list(self._pending.values())
+            self._pending.clear()
+        for fut in pending:
+            if not fut.done():
+                fut.set_exception(error)
+
+    def _read_loop(self):
+        try:
+            while not self._closed.is_set():
+                raw = self._ws.recv()
+                if not raw:
+                    if self._closed.is_set():
+                        break
+                    continue
+                try:
+                    data = json.loads(raw)
+                except ValueError:
+                    continue
+                if isinstance(data, dict):
+                    self._dispatch(data)
+        except Exception:
+            pass
+        was_open = not self._closed.is_set()
+        self._closed.set()
+        self._fail_pending(CdpError("CDP 연결 종료"))
+        if was_open and self._on_close:
+            try:
+                self._on_close(self)
+            except Exception:
+                pass
+
+    def _dispatch(self, data):
+        req_id = data.get("id")
+        recorder = self.recorder
+        if req_id is not None:
+            if recorder is not None:
+                recorder.reply(req_id, data)
+            with self._state_lock:
+                fut = self._pending.pop(req_id, None)
+            if fut is None or fut.done():
+                return
+            if "error" in data:
+                err = data.get("error") or {}
+                fut.set_exception(CdpError(err.get("message") or str(err)))
+            else:
+                fut.set_result(data.get("result") or {})
+            return
+
+        method = data.get("method")
+        if not method:
+            return
+        with self._state_lock:
+            callbacks = list(self._listeners.get(method, ()))
+        params = data.get("params") or {}
+        if recorder is not None and callbacks:
+            # 구독자가 없는 이벤트는 재생에도 영향이 없으므로 기록하지 않는다
+            recorder.event(method, params)
+        for cb in callbacks:
+            try:
+                cb(params)
+            except Exception:
+                continue
+
+
+class CdpConnection:
+    """디버그 포트의 page target에 대한 CdpClient 수명 관리.
+
+    성공한 Origin 전략, target id, webSocketDebuggerUrl을 기억해 재연결 시
+    포트 폴링과 /json/list 조회를 건너뛰고, 소켓이 끊기면 백그라운드에서 재연결한다.
+    on_connected(client)는 (재)연결 직후 도메인 활성화 등에 사용된다.
+    """
+
+    def __init__(self, on_connected=None, log_func=None):
+        self._on_connected = on_connected
+        self._log = log_func or (lambda _msg: None)
+        self._lock = threading.RLock()
+        self._client = None
+        self._port = 0
+        self._target_id = None
+        self._ws_url = None
+        self._origin_index = None
+        self._closed = False
+        self._reconnecting = False
+        # 새로 붙는 클라이언트에 넘겨줄 기록기
+        self.recorder = None
+
+    @staticmethod
+    def available():
+        return _websocket_module() is not None
+
+    @property
+    def client(self):
+        return self._client
+
+    @property
+    def target_id(self):
+        return self._target_id
+
+    def is_healthy(self, port=None):
+        client = self._client
+        if not client or not client.is_connected:
+            return False
+        if port and int(port) != self._port:
+            return False
+        return client.ping()
+
+    # ------------------------------------------------------------------
+    # 연결
+    # ------------------------------------------------------------------
+    def connect(self, port, force=False):
+        """연결된 CdpClient 반환. 실패 시 CdpError."""
+        if _websocket_module() is None:
+            raise CdpError("websocket-client 미설치")
+        port = int(port)
+        with self._lock:
+            self._closed = False
+            if not force and self.is_healthy(port):
+                return self._client
+            self._drop_client()
+            if port != self._port:
+                self._forget_target()
+            self._port = port
+
+            # 빠른 경로: 캐시된 ws URL + 성공했던 Origin 전략
+            if self._ws_url:
+                try:
+                    return self._attach(self._open_socket(self._ws_url, only_cached=True))
+                except Exception:
+                    pass
+
+            self._wait_port_open(port)
+            target = self._discover_target(port)
+            ws_url = target.get("webSocketDebuggerUrl")
+            if not ws_url:
+                raise CdpError("webSocketDebuggerUrl 없음")
+            self._target_id = target.get("id")
+            self._ws_url = ws_url
+            return self._attach(self._open_socket(ws_url))
+
+    def close(self):
+        with self._lock:
+            self._closed = True
+            self._drop_client()
+
+    def attach_client(self, client, port=0):
+        """이미 만들어진 클라이언트(cdp_replay.ReplayClient 등)를 현재 연결로 사용."""
+        with self._lock:
+            self._closed = False
+            self._drop_client()
+            self._forget_target()
+            self._port = int(port or 0)
+            return self._use_client(client)
+
+    def _attach(self, ws):
+        client = CdpClient(ws, on_close=self._on_client_closed)
+        client.recorder = self.recorder
+        return self._use_client(client)
+
+    def _use_client(self, client):
+        self._client = client
+        if self._on_connected:
+            self._on_connected(client)
+        return client
+
+    def _drop_client(self):
+        client = self._client
+        self._client = None
+        if client:
+            try:
+                client.close()
+            except Exception:
+                pass
+
+    def _forget_target(self):
+        self._target_id = None
+        self._ws_url = None
+
+    def _wait_port_open(self, port, attempts=60, interval=0.2):
+        for _ in range(attempts):
+            if is_port_open(port):
+                return
+            time.sleep(interval)
+        raise CdpError(f"포트 미오픈 ({port})")
+
+    def _discover_target(self, port):
+        targets = None
+        for path in ("/json/list", "/json"):
+            try:
+                targets = _read_json_url(f"http://127.0.0.1:{port}{path}")
+                break
+            except Exception:
+                continue
+        if not isinstance(targets, list):
+            raise CdpError(f"page target 없음 ({port})")
+
+        page_targets = [t for t in targets if isinstance(t, dict) and t.get("type") == "page"]
+        if not page_targets:
+            raise CdpError(f"page target 없음 ({port})")
+        if self._target_id:
+            for t in page_targets:
+                if t.get("id") == self._target_id:
+                    return t
+        for t in page_targets:
+            if "naver.com" in str(t.get("url") or ""):
+                return t
+        return page_targets[0]
+
+    def _open_socket(self, ws_url, only_cached=False):
+        order = list(range(len(ORIGIN_STRATEGIES)))
+        if self._origin_index is not None:
+            order.remove(self._origin_index)
+            order.insert(0, self._origin_index)
+            if only_cached:
+                order = order[:1]
+        elif only_cached:
+            raise CdpError("캐시된 Origin 전략 없음")
+
+        last_error = None
+        for idx in order:
+            try:
+                kwargs = {"timeout": 8.0, "enable_multithread": True}
+                kwargs.update(ORIGIN_STRATEGIES[idx])
+                ws = _websocket_module().create_connection(ws_url, **kwargs)
+                self._origin_index = idx
+                return ws
+            except Exception as e:
+                last_error = e
+                continue
+        if last_error:
+            raise last_error
+        raise CdpError("CDP 소켓 연결 실패")
+
+    # ------------------------------------------------------------------
+    # 백그라운드 재연결
+    # ------------------------------------------------------------------
+    def _on_client_closed(self, client):
+        with self._lock:
+            if self._closed or client is not self._client or self._reconnecting:
+                return
+            self._reconnecting = True
+        threading.Thread(target=self._reconnect_loop, name="cdp-reconnect", daemon=True).start()
+
+    def _reconnect_loop(self):
+        delay = 0.05
+        try:
+            for _ in range(40):
+                if self._closed:
+                    return
+                try:
+                    self.connect(self._port)
+                    self._log("🔗 CDP 재연결 완료")
+                    return
+                except Exception:
+                    time.sleep(delay)
+                    delay = min(delay * 2, 1.0)
+            self._log("⚠️ CDP 백그라운드 재연결 실패")
+        finally:
+            self._reconnecting = False
+
+
+def is_port_open(port):
+    try:
+        with socket.create_connection(("127.0.0.1", int(port)), timeout=0.2):
+            return True
+    except OSError:
+        return False
+
+
+def _read_json_url(url):
+    # urllib.request는 ssl/email까지 끌어와 무거우므로 디버그 포트를 처음 조회할 때 불러온다
+    import urllib.request
+
+    with urllib.request.urlopen(url, timeout=2.0) as resp:
+        raw = resp.read().decode("utf-8", errors="ignore")
+    return json.loads(raw)
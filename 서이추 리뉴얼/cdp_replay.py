@@ -0,0 +1,303 @@
+"""CDP 세션 기록/재생.
+
+실제 실행의 명령(method, params)·응답·구독 중이던 이벤트를 시각과 함께 gzip JSONL로 남기고(CdpRecorder),
+같은 파일을 브라우저 없이 NaverBotLogic에 그대로 돌려준다(ReplayClient). 재생은 지연 없이 진행되므로
+봇 루프의 Python 쪽 오버헤드만 측정하거나 수집/서이추 로직 변경 전후를 같은 입력으로 비교할 수 있다.
+
+    python cdp_replay.py logs/cdp-20260101-120000.jsonl.gz
+"""
+
+import argparse
+import gzip
+import itertools
+import json
+import os
+import re
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import Future
+
+from cdp_client import CdpClient, CdpError
+
+
+FORMAT_VERSION = 1
+
+# 재생 시 기록 당시 값으로 맞춰야 흐름(대기 조건/시간 상한)이 같아지는 설정
+REPLAY_CONFIG_KEYS = (
+    "page_load_timeout",
+    "element_wait_timeout",
+    "fast_wait",
+    "normal_wait",
+    "slow_wait",
+    "navigation_ready_level",
+    "lightweight_profile",
+    "search_exhausted_ttl_min",
+)
+
+# waitFor의 남은 시간(ms) 인자는 실행마다 달라지므로 명령 대조 시 무시한다
+_WAITFOR_MS_RE = re.compile(r"(window\.__nnp\.waitFor\.apply\(window\.__nnp, \[.*), -?\d+\]\)")
+
+
+def _command_key(method, params):
+    params = params or {}
+    expression = params.get("expression") if method == "Runtime.evaluate" else None
+    if expression:
+        params = dict(params, expression=_WAITFOR_MS_RE.sub(r"\1, 0])", expression))
+    return method + json.dumps(params, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+
+
+class CdpRecorder:
+    """CdpClient에 붙여 명령/응답/이벤트를 기록. 여러 스레드에서 호출된다."""
+
+    def __init__(self, path, meta=None):
+        self.path = path
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._file = gzip.open(path, "wt", encoding="utf-8", compresslevel=6)
+        self._lock = threading.Lock()
+        self._t0 = time.perf_counter()
+        self.entries = 0
+        self._write({"k": "h", "v": FORMAT_VERSION, "meta": meta or {}})
+
+    def _write(self, entry):
+        line = json.dumps(entry, ensure_ascii=False, separators=(",", ":"))
+        with self._lock:
+            if self._file is None:
+                return
+            self._file.write(line)
+            self._file.write("\n")
+            self.entries += 1
+
+    def _ms(self):
+        return round((time.perf_counter() - self._t0) * 1000.0, 2)
+
+    def command(self, req_id, method, params):
+        self._write({"k": "c", "i": req_id, "m": method, "p": params or {}, "t": self._ms()})
+
+    def reply(self, req_id, data):
+        entry = {"k": "r", "i": req_id, "t": self._ms()}
+        if "error" in data:
+            err = data.get("error") or {}
+            entry["e"] = err.get("message") or str(err)
+        else:
+            entry["r"] = data.get("result") or {}
+        self._write(entry)
+
+    def event(self, method, params):
+        self._write({"k": "v", "m": method, "p": params, "t": self._ms()})
+
+    def close(self):
+        with self._lock:
+            f, self._file = self._file, None
+        if f is not None:
+            f.close()
+
+
+def load_recording(path):
+    """(meta, entries). entries는 헤더를 뺀 기록 순서 그대로."""
+    entries = []
+    meta = {}
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            entry = json.loads(line)
+            if entry.get("k") == "h":
+                meta = entry.get("meta") or {}
+                continue
+            entries.append(entry)
+    return meta, entries
+
+
+class ReplayClient(CdpClient):
+    """기록 파일의 응답/이벤트를 순서대로 돌려주는 CdpClient 대역.
+
+    보낸 명령은 아직 소비하지 않은 기록 명령 중 앞쪽 window개 안에서 (method, params)가 같은 것과 짝짓는다.
+    짝지은 명령보다 앞선 미소비 명령(시간에 따라 생략된 메모리 조회 등)은 건너뛴 것으로 보고,
+    기록 순서대로 응답과 이벤트를 전달하다가 봇이 아직 보내지 않은 명령에서 멈춘다.
+    짝이 없는 명령은 빈 결과로 응답하고 unmatched로 센다.
+    """
+
+    def __init__(self, path, window=64):
+        self.path = path
+        self.meta, self._entries = load_recording(path)
+        self._keys = [
+            _command_key(e.get("m"), e.get("p")) if e.get("k") == "c" else None for e in self._entries
+        ]
+        self._consumed = [False] * len(self._entries)
+        self._window = max(1, int(window))
+        self._pos = 0
+        self._futures = {}
+        self._advancing = False
+        self._lock = threading.RLock()
+        self._ids = itertools.count(1)
+        self.matched = 0
+        self.unmatched = 0
+        self.skipped = 0
+        # CdpClient의 이벤트 구독/대기 메서드가 쓰는 상태
+        self._state_lock = threading.Lock()
+        self._listeners = {}
+        self._pending = {}
+        self._closed = threading.Event()
+        self.recorder = None
+
+    @property
+    def is_connected(self):
+        return not self._closed.is_set()
+
+    @property
+    def remaining(self):
+        """아직 재생하지 않은 기록 명령 수."""
+        return sum(1 for i, key in enumerate(self._keys) if key is not None and not self._consumed[i])
+
+    def ping(self):
+        return self.is_connected
+
+    def send_async(self, method, params=None):
+        fut = Future()
+        fut.cdp_id = next(self._ids)
+        if self._closed.is_set():
+            fut.set_exception(CdpError("CDP 미연결"))
+            return fut
+        key = _command_key(str(method), params)
+        with self._lock:
+            index = self._find(key)
+            if index is None:
+                self.unmatched += 1
+                fut.set_result({"result": {"type": "undefined"}} if method == "Runtime.evaluate" else {})
+                return fut
+            for skip in range(self._pos, index):
+                if self._keys[skip] is not None and not self._consumed[skip]:
+                    self._consumed[skip] = True
+                    self.skipped += 1
+            self._consumed[index] = True
+            self._futures[self._entries[index]["i"]] = fut
+            self.matched += 1
+            self._advance()
+        return fut
+
+    def _find(self, key):
+        seen = 0
+        keys = self._keys
+        for index in range(self._pos, len(keys)):
+            if keys[index] is None or self._consumed[index]:
+                continue
+            if keys[index] == key:
+                return index
+            seen += 1
+            if seen >= self._window:
+                break
+        return None
+
+    def _advance(self):
+        if self._advancing:
+            # 이벤트 콜백 안에서 보낸 명령: 바깥 루프가 이어서 진행한다
+            return
+        self._advancing = True
+        try:
+            entries = self._entries
+            while self._pos < len(entries):
+                entry = entries[self._pos]
+                kind = entry.get("k")
+                if kind == "c" and not self._consumed[self._pos]:
+                    break
+                self._pos += 1
+                if kind == "r":
+                    fut = self._futures.pop(entry.get("i"), None)
+                    if fut is None or fut.done():
+                        continue
+                    if "e" in entry:
+                        fut.set_exception(CdpError(entry["e"]))
+                    else:
+                        fut.set_result(entry.get("r") or {})
+                elif kind == "v":
+                    self._dispatch({"method": entry.get("m"), "params": entry.get("p") or {}})
+        finally:
+            self._advancing = False
+
+    def cancel_pending(self):
+        with self._lock:
+            pending = list(self._futures.values())
+            self._futures.clear()
+        for fut in pending:
+            if not fut.done():
+                fut.set_exception(CdpError("CDP 명령 취소됨"))
+
+    def close(self):
+        self._closed.set()
+        self.cancel_pending()
+
+
+def run_replay(args):
+    """기록 파일로 WebView2(CDP) 모드 봇을 재생하고 소요 시간/대조 결과를 출력."""
+    from config import AppConfig
+    from bot_logic import NaverBotLogic
+    from naver_core import Outcome
+
+    client = ReplayClient(args.path, window=args.window)
+    meta = client.meta
+    work_dir = tempfile.mkdtemp(prefix="nnp-replay-")
+
+    config = AppConfig()
+    for key, value in AppConfig.DEFAULTS.items():
+        config.set(key, value)
+    port = int(config.get("chrome_debug_port") or 9222)
+    for key, value in (meta.get("config") or {}).items():
+        config.set(key, value)
+    for key, value in {
+        "chrome_debug_port": port,
+        "force_cdp_mode": True,
+        "my_blog_id": meta.get("my_blog_id") or "",
+        "history_db_path": os.path.join(work_dir, "history.db"),
+        "run_journal": False,
+        "cdp_record": False,
+        "blog_interval_sec": [0, 0],
+    }.items():
+        config.set(key, value)
+
+    log = print if args.verbose else (lambda _msg: None)
+    bot = NaverBotLogic(config, log, lambda _value: None, lambda *_args: None)
+    bot.set_webview2_mode(True)
+    # 기록 당시 이미 제외되던 블로그와 검색 위치를 그대로 맞춘다
+    if bot.history is not None:
+        for blog_id in meta.get("skip_ids") or ():
+            bot.history.record(blog_id, Outcome.SUCCESS, "replay")
+    keyword = meta.get("keyword") or ""
+    cursor_state = meta.get("cursor") or {}
+    cursor = bot._search_cursor(keyword)
+    cursor.offset = int(cursor_state.get("offset") or 0)
+    cursor.base_url = cursor_state.get("base_url")
+    bot._cdp_conn.attach_client(client, port)
+    # 연결 직후 초기화 명령은 기록 시점에 따라 파일에 없을 수 있으므로 대조 결과에서 뺀다
+    client.matched = client.unmatched = client.skipped = 0
+
+    started = time.perf_counter()
+    bot.start_working(keyword, int(meta.get("target_count") or 0), meta.get("neighbor_msg") or "")
+    elapsed = time.perf_counter() - started
+
+    snap = bot.metrics.snapshot()
+    processed = sum(n for name, n in snap["counters"].items() if name.startswith("outcome."))
+    blog_ms = snap["series"].get("blog_ms") or (None, None, 0)
+    print(f"재생 {processed}개 / 성공 {bot.current_count}개 / {elapsed:.3f}s")
+    if blog_ms[2]:
+        print(f"블로그당 p50 {blog_ms[0]:.2f}ms, p95 {blog_ms[1]:.2f}ms")
+    print(f"명령 대조: 일치 {client.matched}, 불일치 {client.unmatched}, "
+          f"건너뜀 {client.skipped}, 미재생 {client.remaining}")
+
+    bot.shutdown()
+    client.close()
+    return 0 if client.unmatched == 0 else 1
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="CDP 기록 파일로 봇 루프를 브라우저 없이 재생")
+    parser.add_argument("path", help="cdp-<실행시각>.jsonl.gz")
+    parser.add_argument("--window", type=int, default=64, help="명령 대조 시 앞으로 살펴볼 기록 명령 수")
+    parser.add_argument("--verbose", action="store_true", help="봇 로그 출력")
+    return run_replay(parser.parse_args(argv))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
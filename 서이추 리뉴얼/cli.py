@@ -0,0 +1,192 @@
+"""GUI 없이 NaverBotLogic을 실행하는 명령줄 진입점.
+
+Tk/customtkinter/WebView2 패널은 불러오지 않고, Selenium은 Selenium 백엔드로 크롬에 붙을 때만 불러온다.
+로그인은 같은 크롬 프로필로 한 번 해 두거나 --wait-login으로 처음 실행 때 기다린다.
+
+    python cli.py 맛집 --count 50
+    python cli.py 맛집 --count 50 --headless --jsonl > run.jsonl
+    python cli.py 맛집 --backend cdp --port 9222    # 이미 떠 있는 브라우저의 디버그 포트에 CDP로 연결
+"""
+
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+
+# frozen(PyInstaller exe) 환경에서는 sys.path 조작 불필요
+if not getattr(sys, "frozen", False):
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from config import AppConfig
+from bot_logic import NaverBotLogic
+
+
+EXIT_OK = 0
+EXIT_NOT_READY = 2
+EXIT_INTERRUPTED = 130
+
+
+class ConsoleReporter:
+    """봇의 log/progress/status 콜백을 표준 출력으로 내보낸다. 여러 스레드에서 호출된다."""
+
+    def __init__(self, jsonl=False, quiet=False, stream=None):
+        self.jsonl = bool(jsonl)
+        self.quiet = bool(quiet)
+        self.stream = stream or sys.stdout
+        self._lock = threading.Lock()
+        self._last_percent = -1
+
+    def _emit(self, record, text):
+        with self._lock:
+            if self.jsonl:
+                record["t"] = round(time.time(), 3)
+                self.stream.write(json.dumps(record, ensure_ascii=False) + "\n")
+            else:
+                self.stream.write(f"[{time.strftime('%H:%M:%S')}] {text}\n")
+            self.stream.flush()
+
+    def log(self, msg):
+        if not self.quiet:
+            self._emit({"type": "log", "msg": str(msg)}, str(msg))
+
+    def progress(self, value):
+        percent = int(float(value or 0) * 100)
+        # 텍스트 출력은 로그에 이미 진행 수가 찍히므로 JSONL에서만 내보낸다
+        if not self.jsonl or percent == self._last_percent:
+            return
+        self._last_percent = percent
+        self._emit({"type": "progress", "value": round(float(value or 0), 4)}, "")
+
+    def status(self, text, color="gray"):
+        self._emit({"type": "status", "status": str(text), "color": color}, f"[상태] {text}")
+
+    def summary(self, record):
+        record = {"type": "summary", **record}
+        text = (f"처리 {record['processed']}개 / 성공 {record['success']}개 / {record['elapsed_sec']:.1f}s"
+                + "".join(f", {name} {n}" for name, n in sorted(record["outcomes"].items())))
+        self._emit(record, text)
+
+
+def build_config(args):
+    """config.json 값을 읽고 명령줄 인자로 덮어쓴다. 파일에는 저장하지 않는다."""
+    config = AppConfig()
+    overrides = {
+        "my_blog_id": args.my_blog_id,
+        "chrome_debug_port": args.port,
+        "run_journal": False if args.no_journal else None,
+        "trace_spans": True if args.trace else None,
+        "cdp_record": True if args.record else None,
+    }
+    if args.headless:
+        overrides["chrome_headless"] = True
+    if args.backend == "cdp":
+        overrides["force_cdp_mode"] = True
+    for key, value in overrides.items():
+        if value is not None:
+            config.set(key, value)
+    return config
+
+
+def wait_for_login(bot, timeout, log):
+    """로그인 세션이 생길 때까지 대기. timeout 안에 로그인되면 True."""
+    if bot.check_login_status():
+        return True
+    if timeout <= 0:
+        return False
+    bot.open_login_page()
+    log(f"🔓 브라우저에서 네이버에 로그인하세요 (최대 {timeout:.0f}초 대기)")
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        time.sleep(2.0)
+        if bot.check_login_status():
+            return True
+    return False
+
+
+def run(args):
+    config = build_config(args)
+    reporter = ConsoleReporter(jsonl=args.jsonl, quiet=args.quiet)
+    bot = NaverBotLogic(config, reporter.log, reporter.progress, reporter.status)
+    # Windows 기본값(use_webview2_panel)과 관계없이 --backend로 경로를 정한다
+    bot.set_webview2_mode(args.backend == "cdp")
+    try:
+        return _run_bot(bot, args, config, reporter)
+    finally:
+        # 두 번째 Ctrl+C로 빠져나와도 저널/이력 DB를 닫는다. 헤드리스 크롬은 창이 없으므로 함께 종료
+        bot.shutdown(close_browser=bool(args.headless))
+
+
+def _run_bot(bot, args, config, reporter):
+    if not bot.connect_driver():
+        reporter.status("브라우저 연결 실패", "red")
+        return EXIT_NOT_READY
+    if not wait_for_login(bot, args.wait_login, reporter.log):
+        reporter.status("로그인 필요", "red")
+        return EXIT_NOT_READY
+
+    keyword = args.keyword or str(config.get("keyword") or "")
+    if not keyword:
+        reporter.status("검색어 없음", "red")
+        return EXIT_NOT_READY
+    target_count = args.count if args.count is not None else int(config.get("target_count") or 100)
+    neighbor_msg = args.message or config.get("neighbor_msg")
+
+    started = time.perf_counter()
+    worker = threading.Thread(
+        target=bot.start_working, args=(keyword, target_count, neighbor_msg), name="bot", daemon=True
+    )
+    worker.start()
+    interrupted = False
+    try:
+        while worker.is_alive():
+            worker.join(0.5)
+    except KeyboardInterrupt:
+        # 첫 Ctrl+C는 현재 블로그까지만 정리하고 멈춘다. 한 번 더 누르면 바로 종료
+        interrupted = True
+        reporter.log("🛑 정지 요청됨... (한 번 더 누르면 즉시 종료)")
+        bot.is_running = False
+        bot.is_paused = False
+        try:
+            while worker.is_alive():
+                worker.join(0.5)
+        except KeyboardInterrupt:
+            return EXIT_INTERRUPTED
+    elapsed = time.perf_counter() - started
+
+    counters = bot.metrics.snapshot()["counters"]
+    outcomes = {name.split(".", 1)[1]: n for name, n in counters.items() if name.startswith("outcome.")}
+    reporter.summary({
+        "keyword": keyword,
+        "target": target_count,
+        "processed": sum(outcomes.values()),
+        "success": bot.current_count,
+        "elapsed_sec": round(elapsed, 3),
+        "outcomes": outcomes,
+    })
+    return EXIT_INTERRUPTED if interrupted else EXIT_OK
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="네이버 서로이웃 자동 신청 (GUI 없이 실행)")
+    parser.add_argument("keyword", nargs="?", help="검색어 (없으면 config.json의 keyword)")
+    parser.add_argument("-n", "--count", type=int, help="목표 신청 수 (없으면 config.json의 target_count)")
+    parser.add_argument("-m", "--message", help="서로이웃 신청 메시지")
+    parser.add_argument("--my-blog-id", help="제외할 내 블로그 ID")
+    parser.add_argument("--backend", choices=("selenium", "cdp"), default="selenium",
+                        help="selenium: 크롬 실행 후 연결, cdp: 디버그 포트에 CDP로 직접 연결")
+    parser.add_argument("--port", type=int, help="크롬/WebView2 디버그 포트")
+    parser.add_argument("--headless", action="store_true", help="화면 없는 크롬으로 실행 (selenium)")
+    parser.add_argument("--wait-login", type=float, default=0, metavar="SEC",
+                        help="로그인이 안 되어 있으면 로그인 페이지를 열고 최대 SEC초 대기")
+    parser.add_argument("--jsonl", action="store_true", help="로그/진행/상태를 한 줄 JSON으로 출력")
+    parser.add_argument("-q", "--quiet", action="store_true", help="상태 변화와 요약만 출력")
+    parser.add_argument("--no-journal", action="store_true", help="logs/run_journal.jsonl 기록 끄기")
+    parser.add_argument("--trace", action="store_true", help="단계별 구간 추적 파일 저장")
+    parser.add_argument("--record", action="store_true", help="CDP 명령/응답 기록 (cdp 백엔드)")
+    return run(parser.parse_args(argv))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -14,11 +14,42 @@ class AppConfig:
         "keyword": "",
         "target_count": 100,
         "chrome_debug_port": 9222,
+        # 화면 없는 크롬으로 실행 (cli.py --headless). 로그인은 같은 프로필로 한 번 해 두어야 한다
+        "chrome_headless": False,
         "page_load_timeout": 15,
         "element_wait_timeout": 5,
         "fast_wait": 0.2,
         "normal_wait": 0.5,
         "slow_wait": 1.0,
+        # 블로그 사이 대기 시간 범위(초)
+        "blog_interval_sec": [0.8, 1.5],
+        # WebView2(CDP) 페이지 이동 완료 기준: commit / DOMContentLoaded / load / networkAlmostIdle / networkIdle
+        "navigation_ready_level": "DOMContentLoaded",
+        # Selenium 모드: 블로그마다 탭을 새로 열지 않고 작업 탭 하나를 재사용
+        "reuse_worker_tab": True,
+        "worker_tab_recycle_pages": 50,
+        "worker_tab_memory_mb": 300,
+        # 경량 프로필: 이미지/미디어/폰트/광고·통계 요청 차단 (내장 브라우저 화면에도 적용됨)
+        "lightweight_profile": False,
+        # 서이추 불가 블로그 재방문 방지: 결과 분류별 유지 시간(시간)과 최대 항목 수
+        # (버튼 없음은 일시적인 경우가 많아 기본값에서 제외)
+        "negative_cache_ttl_hours": {"disabled": 72, "full": 72, "inaccessible": 168},
+        "negative_cache_size": 5000,
+        # 검색 결과 소진으로 표시된 키워드를 다시 처음부터 훑기까지의 시간(분)
+        "search_exhausted_ttl_min": 60,
+        # 결과는 더 있는데 모두 이력/캐시로 걸러져 후보가 0명인 재수집을 연속 몇 번까지 넘길지
+        "search_empty_refills": 10,
+        # 블로그별 처리 기록(JSONL, logs/run_journal.jsonl): 파일당 최대 크기(MB)와 보관 개수
+        "run_journal": True,
+        "run_journal_max_mb": 5,
+        "run_journal_backups": 5,
+        # 단계별 구간 추적(logs/trace-<실행시각>.json, chrome://tracing·Perfetto용). 긴 실행은 표본 비율로 줄인다
+        "trace_spans": False,
+        "trace_sample_rate": 1.0,
+        # WebView2(CDP) 실행의 명령/응답을 logs/cdp-<실행시각>.jsonl.gz로 기록 (cdp_replay.py로 재생)
+        "cdp_record": False,
+        # Windows가 아니어도 WebView2(CDP) 자동화 경로 사용 (fake_cdp_server.py 벤치마크용)
+        "force_cdp_mode": False,
         "embed_browser_windows": True,
         "use_webview2_panel": True,
     }
@@ -18,3 +18,13 @@ IOS_FONT_MEDIUM = ("SF Pro Display", 17, "bold")
 IOS_FONT_REGULAR = ("SF Pro Text", 15)
 IOS_FONT_SMALL = ("SF Pro Text", 13)
 IOS_FONT_MONO = ("SF Mono", 11)
+
+# 활동 로그: 작업 스레드 로그를 모아 주기적으로 한 번에 출력
+LOG_PUMP_INTERVAL_MS = 100
+LOG_BATCH_MAX = 500
+# 표시 줄 수가 LOG_MAX_LINES를 넘으면 오래된 줄을 LOG_TRIM_CHUNK 단위로 삭제
+LOG_MAX_LINES = 3000
+LOG_TRIM_CHUNK = 500
+
+# 성능 지표 패널 갱신 주기
+METRICS_REFRESH_MS = 2000
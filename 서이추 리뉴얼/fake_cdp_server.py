@@ -0,0 +1,709 @@
+"""네이버 접속 없이 봇 루프를 돌려 보기 위한 로컬 CDP 대역 서버.
+
+표준 라이브러리 HTTP + WebSocket 서버가 봇이 쓰는 CDP 일부(/json/list, Page.navigate,
+Runtime.evaluate, Network.getCookies, 대화상자 이벤트 등)를 흉내 낸다.
+Runtime.evaluate는 JS를 실행하지 않고 `window.__nnp.<fn>` 호출을 가려내
+FixtureSite의 페이지 상태(검색 결과/블로그/서이추 양식/알림 레이어)에 대해 처리한다.
+
+    python fake_cdp_server.py --port 9333            # 서버만 실행
+    python fake_cdp_server.py --bench 50              # WebView2(CDP) 모드 봇을 끝까지 실행하고 처리량 출력
+"""
+
+import argparse
+import base64
+import hashlib
+import json
+import os
+import re
+import struct
+import sys
+import tempfile
+import threading
+import time
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from page_scripts import NNP_MISSING
+
+
+WS_GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+FRAME_ID = "FIXTURE-FRAME"
+LINK_SELECTOR = "a[href*='blog.naver.com']"
+LIFECYCLE_EVENTS = ("commit", "DOMContentLoaded", "load", "networkAlmostIdle", "networkIdle")
+
+NNP_CALL_RE = re.compile(r"window\.__nnp\.(\w+)\.apply\(window\.__nnp, (\[.*\])\) :", re.S)
+
+# 블로그 순번별 시나리오 (순환). 실제 검색 결과와 비슷하게 정상 블로그 비중을 높게 둔다
+DEFAULT_SCENARIOS = (
+    "normal", "normal", "already", "normal", "oneway", "normal",
+    "error", "pending", "normal", "no_button", "normal", "full", "layer_done",
+)
+
+DAY_LIMIT_TEXT = "하루에 신청 가능한 이웃수가 초과되어 더 이상 신청할 수 없습니다."
+FULL_TEXT = "상대방의 이웃수가 5,000명을 초과하여 더 이상 이웃을 추가할 수 없습니다."
+# 확인 후 페이지 이동 없이 양식 위에 뜨는 완료 레이어 (layer_done 시나리오)
+DONE_LAYER_TEXT = "서로이웃 신청이 완료되었습니다."
+
+
+class FixturePage:
+    """페이지 하나의 DOM 상태 요약. __nnp 헬퍼가 검사하는 마커만 담는다."""
+
+    def __init__(self, url, selectors=(), text="", links=None, blog_id=None):
+        self.url = url
+        self.selectors = set(selectors)
+        self.text = text
+        self.links = list(links or [])
+        self.blog_id = blog_id
+        self.alert = None
+
+    def count(self, selector):
+        total = 0
+        for part in str(selector).split(","):
+            part = part.strip()
+            if part == LINK_SELECTOR:
+                total += len(self.links)
+            elif part in self.selectors:
+                total += 1
+        return total
+
+    def matches(self, selector):
+        return self.count(selector) > 0
+
+    def html(self):
+        anchors = "".join(f'<a href="{href}">{href}</a>' for href in self.links)
+        markers = "".join(f"<i data-fixture=\"{sel}\"></i>" for sel in sorted(self.selectors))
+        layer = f'<div id="_alertLayer"><p class="dsc">{self.alert}</p></div>' if self.alert else ""
+        return f"<html><body>{self.text}{anchors}{markers}{layer}</body></html>"
+
+
+class FixtureSite:
+    """검색 결과 → 블로그 → 서이추 양식으로 이어지는 가짜 네이버.
+
+    블로그 ID는 순번으로 만들고, 순번에 따라 scenarios를 순환해 결과(정상/이미 이웃/
+    서이추 비활성화/오류/신청중/버튼 없음/5000명)를 정한다. daily_limit회 신청하면 일일 한도 대화상자를 띄운다.
+    """
+
+    def __init__(self, total_results=400, page_size=10, scenarios=DEFAULT_SCENARIOS,
+                 daily_limit=0, my_blog_id="fixtureuser"):
+        self.total_results = int(total_results)
+        self.page_size = max(1, int(page_size))
+        self.scenarios = tuple(scenarios) or ("normal",)
+        self.daily_limit = int(daily_limit or 0)
+        self.my_blog_id = my_blog_id
+        self.successes = 0
+        self.helper_installed = False
+        self.helper_persistent = False
+        self.events = []
+        self.page = FixturePage("about:blank")
+
+    # ------------------------------------------------------------------
+    # 페이지 상태
+    # ------------------------------------------------------------------
+    @staticmethod
+    def blog_id_at(index):
+        return f"fx{index:05d}blog"
+
+    def scenario_of(self, blog_id):
+        match = re.match(r"fx(\d+)blog$", str(blog_id or ""))
+        if not match:
+            return "normal"
+        return self.scenarios[int(match.group(1)) % len(self.scenarios)]
+
+    def load(self, url):
+        """문서 이동. 새 문서에는 init script로 등록된 헬퍼만 남는다."""
+        self.helper_installed = self.helper_persistent
+        self.page = self._build_page(str(url or ""))
+        return self.page
+
+    def _build_page(self, url):
+        parts = urllib.parse.urlsplit(url)
+        query = dict(urllib.parse.parse_qsl(parts.query))
+        host = parts.netloc
+        path = parts.path.strip("/")
+
+        if host == "search.naver.com":
+            return self._search_page(url, query)
+        if host == "nid.naver.com":
+            return FixturePage(url, {"input#id", "input#pw"}, "로그인 아이디 비밀번호 로그인이 필요합니다")
+        if host in ("m.blog.naver.com", "blog.naver.com"):
+            if path == "MyBlog.naver":
+                return self._blog_page(f"https://m.blog.naver.com/{self.my_blog_id}", self.my_blog_id)
+            if path == "BuddyAddForm.naver":
+                return self._form_page(url, query.get("blogId") or "")
+            if path and "/" not in path:
+                return self._blog_page(url, path)
+        return FixturePage(url)
+
+    def _search_page(self, url, query):
+        start = max(0, int(query.get("start") or 1) - 1)
+        page = FixturePage(url, {"[role='tab']", "input[name='query']"}, f"{query.get('query', '')} 통합 블로그 카페 뉴스")
+        self._reveal(page, start, self.page_size)
+        page.search_start = start
+        return page
+
+    def _reveal(self, page, start, count):
+        """검색 결과 링크를 count개 더 보이게 한다. 추가된 수 반환."""
+        have = len(page.links)
+        end = min(self.total_results, start + have + count)
+        for index in range(start + have, end):
+            page.links.append(f"https://blog.naver.com/{self.blog_id_at(index)}")
+        return end - (start + have) if end > start + have else 0
+
+    def _blog_page(self, url, blog_id):
+        scenario = self.scenario_of(blog_id)
+        if blog_id == self.my_blog_id:
+            return FixturePage(url, {"[data-click-area='ebc.ngr']"}, "내 블로그 로그아웃", blog_id=blog_id)
+        if scenario == "error":
+            return FixturePage("https://m.blog.naver.com/MobileErrorView.naver", set(), "일시적인 오류입니다", blog_id=blog_id)
+        if scenario == "already":
+            return FixturePage(url, {"[data-click-area='ebc.ngr']"}, "서로이웃 취소 이웃끊기", blog_id=blog_id)
+        if scenario == "no_button":
+            return FixturePage(url, set(), "블로그 글 목록", blog_id=blog_id)
+        return FixturePage(url, {"[data-click-area='ebc.add']"}, "이웃추가 블로그 글 목록", blog_id=blog_id)
+
+    def _form_page(self, url, blog_id):
+        if self.scenario_of(blog_id) == "oneway":
+            selectors = {"#onewayBuddyRadio", "textarea", "button"}
+        else:
+            selectors = {"#bothBuddyRadio", "#onewayBuddyRadio", "label[for='bothBuddyRadio']", "textarea", "button"}
+        return FixturePage(url, selectors, "이웃 추가 서로이웃 메시지 확인 취소", blog_id=blog_id)
+
+    # ------------------------------------------------------------------
+    # window.__nnp 헬퍼
+    # ------------------------------------------------------------------
+    def probe(self):
+        page = self.page
+        text = page.html()
+        url = page.url
+        has = text.__contains__
+        return {
+            "url": url,
+            "error_page": "MobileErrorView" in url or has("일시적인 오류"),
+            "login_required": has("로그인이 필요"),
+            "already_neighbor": has("이웃끊기") or has("서로이웃 취소"),
+            "request_in_progress": has("서로이웃 신청 진행중입니다"),
+            "pending_text": has("진행 중") or has("신청중"),
+            "day_limit": has("하루에 신청 가능한 이웃수") and has("초과"),
+            "alert_text": page.alert,
+            "has_add_button": page.matches("[data-click-area='ebc.add']"),
+            "has_neighbor_button": page.matches("[data-click-area='ebc.ngr']"),
+            "has_both_radio": page.matches("#bothBuddyRadio"),
+            "has_oneway_radio": page.matches("#onewayBuddyRadio"),
+            "both_radio_disabled": False,
+            "is_buddy_form": "BuddyAddForm" in url,
+        }
+
+    def call(self, fn, args):
+        handler = getattr(self, f"_nnp_{fn}", None)
+        if handler is None:
+            raise RuntimeError(f"fixture: 지원하지 않는 헬퍼 {fn}")
+        return handler(*args)
+
+    def _nnp_probe(self):
+        return self.probe()
+
+    def _nnp_alertText(self):
+        return self.page.alert
+
+    def _nnp_closeAlert(self):
+        if self.page.alert is None:
+            return False
+        self.page.alert = None
+        return True
+
+    def _nnp_clickButtonByText(self, text):
+        page = self.page
+        if text not in page.text:
+            return False
+        if text == "취소":
+            page.text = page.text.replace("서로이웃 신청 진행중입니다.", "")
+        return True
+
+    def _nnp_clickAddButton(self):
+        page = self.page
+        if not page.matches("[data-click-area='ebc.add']"):
+            return "ALREADY" if page.matches("[data-click-area='ebc.ngr']") else "NONE"
+        scenario = self.scenario_of(page.blog_id)
+        if scenario == "pending":
+            page.text += " 서로이웃 신청 진행중입니다. 취소"
+        elif scenario == "full":
+            page.alert = FULL_TEXT
+        else:
+            self.page = self._form_page(
+                f"https://m.blog.naver.com/BuddyAddForm.naver?blogId={page.blog_id}", page.blog_id
+            )
+        return "CLICKED"
+
+    def _nnp_selectBothRadio(self):
+        page = self.page
+        if not page.matches("#bothBuddyRadio"):
+            return "ONEWAY_ONLY" if page.matches("#onewayBuddyRadio") else "NO_FORM"
+        return "OK"
+
+    def _nnp_fillMessage(self, _msg):
+        return self.page.matches("textarea")
+
+    def _nnp_clickConfirm(self):
+        page = self.page
+        if "확인" not in page.text:
+            return False
+        if self.daily_limit and self.successes >= self.daily_limit:
+            self.events.append(("Page.javascriptDialogOpening", {"message": DAY_LIMIT_TEXT, "type": "alert"}))
+            return True
+        self.successes += 1
+        if self.scenario_of(page.blog_id) == "layer_done":
+            page.alert = DONE_LAYER_TEXT
+            return True
+        self.page = self._blog_page(f"https://m.blog.naver.com/{page.blog_id}", page.blog_id)
+        self.page.text += " 서로이웃 신청중"
+        return True
+
+    def _nnp_clickBlogTab(self):
+        page = self.page
+        if not page.matches("[role='tab']"):
+            return "NONE"
+        url = page.url if "ssc=tab.blog.all" in page.url else page.url + "&ssc=tab.blog.all"
+        start = getattr(page, "search_start", 0)
+        self.page = self._search_page(url, dict(urllib.parse.parse_qsl(urllib.parse.urlsplit(url).query)))
+        self.page.search_start = start
+        return "CLICKED"
+
+    def _nnp_forceBlogSearch(self):
+        return False
+
+    def _nnp_scrollToBottom(self):
+        page = self.page
+        count = len(page.links)
+        if hasattr(page, "search_start"):
+            self._reveal(page, page.search_start, self.page_size)
+        return count + 1
+
+    def _nnp_blogLinks(self):
+        seen = set()
+        out = []
+        for href in self.page.links:
+            match = re.search(r"blog\.naver\.com/([a-zA-Z0-9_-]+)", href)
+            if match and match.group(1) not in seen:
+                seen.add(match.group(1))
+                out.append("blog.naver.com/" + match.group(1))
+        return out
+
+    def _nnp_clickMore(self):
+        return False
+
+    def check(self, conds):
+        """waitFor 조건 중 지금 만족하는 첫 항목 [index, value]. 없으면 None."""
+        page = self.page
+        for index, (kind, arg) in enumerate(conds):
+            value = False
+            if kind == "selector":
+                value = page.matches(arg)
+            elif kind == "gone":
+                value = not page.matches(arg)
+            elif kind == "alert":
+                value = page.alert or False
+            elif kind == "url_changed":
+                value = page.url if page.url != arg else False
+            elif kind == "url_contains":
+                value = page.url if str(arg) in page.url else False
+            elif kind == "text":
+                value = str(arg) in page.text
+            elif kind == "count":
+                value = page.count(arg[0]) >= int(arg[1])
+            elif kind == "idle":
+                value = True
+            if value:
+                return [index, value]
+        return None
+
+
+def _remote_object(value):
+    if value is None:
+        return {"type": "undefined"}
+    if isinstance(value, bool):
+        return {"type": "boolean", "value": value}
+    if isinstance(value, (int, float)):
+        return {"type": "number", "value": value}
+    if isinstance(value, str):
+        return {"type": "string", "value": value}
+    return {"type": "object", "value": value}
+
+
+class _WsSession:
+    """요청 핸들러 소켓 위의 최소 WebSocket (서버 측: 수신 프레임은 마스킹 해제, 송신은 마스킹 없음)."""
+
+    def __init__(self, rfile, wfile):
+        self._rfile = rfile
+        self._wfile = wfile
+        self._send_lock = threading.Lock()
+        self.closed = False
+
+    def _read_exact(self, n):
+        data = self._rfile.read(n)
+        if data is None or len(data) < n:
+            raise EOFError
+        return data
+
+    def recv(self):
+        """텍스트 메시지 하나. 연결이 닫히면 None."""
+        chunks = []
+        while True:
+            try:
+                b1, b2 = self._read_exact(2)
+                length = b2 & 0x7F
+                if length == 126:
+                    length = struct.unpack("!H", self._read_exact(2))[0]
+                elif length == 127:
+                    length = struct.unpack("!Q", self._read_exact(8))[0]
+                mask = self._read_exact(4) if b2 & 0x80 else None
+                payload = self._read_exact(length) if length else b""
+            except (EOFError, OSError, ValueError):
+                self.closed = True
+                return None
+            if mask and payload:
+                key = (mask * (length // 4 + 1))[:length]
+                payload = (int.from_bytes(payload, "big") ^ int.from_bytes(key, "big")).to_bytes(length, "big")
+            opcode = b1 & 0x0F
+            if opcode == 0x8:
+                self.send(payload[:2], opcode=0x8)
+                self.closed = True
+                return None
+            if opcode == 0x9:
+                self.send(payload, opcode=0xA)
+                continue
+            if opcode == 0xA:
+                continue
+            chunks.append(payload)
+            if b1 & 0x80:
+                return b"".join(chunks).decode("utf-8", errors="replace")
+
+    def send(self, data, opcode=0x1):
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        length = len(data)
+        if length < 126:
+            header = struct.pack("!BB", 0x80 | opcode, length)
+        elif length < 1 << 16:
+            header = struct.pack("!BBH", 0x80 | opcode, 126, length)
+        else:
+            header = struct.pack("!BBQ", 0x80 | opcode, 127, length)
+        with self._send_lock:
+            if self.closed and opcode != 0x8:
+                return
+            try:
+                self._wfile.write(header + data)
+                self._wfile.flush()
+            except OSError:
+                self.closed = True
+
+    def send_json(self, obj):
+        self.send(json.dumps(obj, ensure_ascii=False, separators=(",", ":")))
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        fake = self.server.fake
+        path = self.path.split("?", 1)[0].rstrip("/")
+        if self.headers.get("Upgrade", "").lower() == "websocket":
+            self._serve_websocket(fake)
+            return
+        if path in ("/json", "/json/list"):
+            body = [fake.target_info()]
+        elif path == "/json/version":
+            body = {"Browser": "NaverFixture/1.0", "Protocol-Version": "1.3"}
+        else:
+            self.send_error(404)
+            return
+        data = json.dumps(body, ensure_ascii=False).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json; charset=UTF-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _serve_websocket(self, fake):
+        key = self.headers.get("Sec-WebSocket-Key")
+        if not key:
+            self.send_error(400)
+            return
+        accept = base64.b64encode(hashlib.sha1((key + WS_GUID).encode("ascii")).digest()).decode("ascii")
+        self.send_response(101, "Switching Protocols")
+        self.send_header("Upgrade", "websocket")
+        self.send_header("Connection", "Upgrade")
+        self.send_header("Sec-WebSocket-Accept", accept)
+        self.end_headers()
+        self.wfile.flush()
+        fake.serve_session(_WsSession(self.rfile, self.wfile))
+        self.close_connection = True
+
+
+class FakeCdpServer:
+    """FixtureSite를 CDP page target 하나로 노출하는 로컬 서버.
+
+    nav_latency_ms: Page.navigate 후 lifecycle 이벤트까지의 지연 (페이지 로드 시간 흉내)
+    page_bytes: 문서 하나당 Network.loadingFinished로 보고할 수신 바이트
+    max_wait_ms: 만족하지 않는 waitFor를 붙잡아 둘 최대 시간
+    """
+
+    def __init__(self, site=None, host="127.0.0.1", port=0, nav_latency_ms=30, page_bytes=150_000, max_wait_ms=1000):
+        self.site = site or FixtureSite()
+        self.target_id = "FIXTURE-PAGE-1"
+        self.nav_latency = max(0.0, float(nav_latency_ms)) / 1000.0
+        self.page_bytes = int(page_bytes)
+        self.max_wait = max(0.0, float(max_wait_ms)) / 1000.0
+        self.commands = {}
+        self._lock = threading.RLock()
+        self._loader_seq = 0
+        self._request_seq = 0
+        self._httpd = ThreadingHTTPServer((host, int(port)), _Handler)
+        self._httpd.daemon_threads = True
+        self._httpd.fake = self
+        self.port = self._httpd.server_address[1]
+        self._thread = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="fake-cdp", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+        return False
+
+    def target_info(self):
+        return {
+            "id": self.target_id,
+            "type": "page",
+            "title": "Naver fixture",
+            "url": self.site.page.url,
+            "webSocketDebuggerUrl": f"ws://127.0.0.1:{self.port}/devtools/page/{self.target_id}",
+        }
+
+    # ------------------------------------------------------------------
+    # CDP 세션
+    # ------------------------------------------------------------------
+    def serve_session(self, ws):
+        while True:
+            raw = ws.recv()
+            if raw is None:
+                return
+            try:
+                msg = json.loads(raw)
+            except ValueError:
+                continue
+            if isinstance(msg, dict) and msg.get("id") is not None:
+                self._handle(ws, msg)
+
+    def _handle(self, ws, msg):
+        req_id = msg["id"]
+        method = str(msg.get("method") or "")
+        params = msg.get("params") or {}
+        with self._lock:
+            self.commands[method] = self.commands.get(method, 0) + 1
+            handler = getattr(self, "_cmd_" + method.replace(".", "_"), None)
+            try:
+                result = handler(ws, req_id, params) if handler else {}
+            except Exception as e:
+                ws.send_json({"id": req_id, "error": {"code": -32000, "message": str(e)}})
+                return
+            events = self.site.events
+            self.site.events = []
+        # 대화상자 같은 이벤트는 응답보다 먼저 보내 실제 브라우저와 같은 순서를 유지
+        for event, event_params in events:
+            ws.send_json({"method": event, "params": event_params})
+        if result is not None:
+            ws.send_json({"id": req_id, "result": result})
+
+    def _emit_load(self, ws, loader_id, url):
+        ts = time.monotonic()
+        with self._lock:
+            self._request_seq += 1
+            request_id = f"R{self._request_seq}"
+        ws.send_json({"method": "Network.loadingFinished", "params": {
+            "requestId": request_id, "timestamp": ts, "encodedDataLength": self.page_bytes,
+        }})
+        for name in LIFECYCLE_EVENTS:
+            ws.send_json({"method": "Page.lifecycleEvent", "params": {
+                "frameId": FRAME_ID, "loaderId": loader_id, "name": name, "timestamp": ts,
+            }})
+        ws.send_json({"method": "Page.frameNavigated", "params": {"frame": {"id": FRAME_ID, "url": url}}})
+
+    def _cmd_Page_navigate(self, ws, req_id, params):
+        page = self.site.load(params.get("url"))
+        self._loader_seq += 1
+        loader_id = f"L{self._loader_seq}"
+        timer = threading.Timer(self.nav_latency, self._emit_load, (ws, loader_id, page.url))
+        timer.daemon = True
+        timer.start()
+        return {"frameId": FRAME_ID, "loaderId": loader_id}
+
+    def _cmd_Page_addScriptToEvaluateOnNewDocument(self, ws, req_id, params):
+        if "window.__nnp" in str(params.get("source") or ""):
+            self.site.helper_persistent = True
+        return {"identifier": "1"}
+
+    def _cmd_Page_handleJavaScriptDialog(self, ws, req_id, params):
+        return {}
+
+    def _cmd_Network_getCookies(self, ws, req_id, params):
+        return {"cookies": [
+            {"name": "NID_AUT", "value": "fixture", "domain": ".naver.com", "path": "/"},
+            {"name": "NID_SES", "value": "fixture", "domain": ".naver.com", "path": "/"},
+        ]}
+
+    def _cmd_Runtime_evaluate(self, ws, req_id, params):
+        site = self.site
+        expression = str(params.get("expression") or "")
+        call = NNP_CALL_RE.search(expression)
+        if call:
+            if not site.helper_installed:
+                return {"result": _remote_object(NNP_MISSING)}
+            fn, args = call.group(1), json.loads(call.group(2))
+            if fn == "waitFor":
+                return self._wait_for(ws, req_id, args[0], args[1] if len(args) > 1 else 0)
+            return {"result": _remote_object(site.call(fn, args))}
+        if "window.__nnp = {" in expression:
+            site.helper_installed = True
+            return {"result": _remote_object(None)}
+        if "location.href" in expression:
+            return {"result": _remote_object(site.page.url)}
+        if "document.readyState" in expression:
+            return {"result": _remote_object("complete")}
+        if "outerHTML" in expression:
+            return {"result": _remote_object(site.page.html())}
+        if "innerText" in expression:
+            return {"result": _remote_object(site.page.text)}
+        if "performance.memory" in expression:
+            return {"result": _remote_object(64 * 1024 * 1024)}
+        return {
+            "result": {"type": "object", "subtype": "error"},
+            "exceptionDetails": {"text": "fixture: 지원하지 않는 표현식"},
+        }
+
+    def _wait_for(self, ws, req_id, conds, timeout_ms):
+        hit = self.site.check(conds)
+        if hit is not None:
+            return {"result": _remote_object(hit)}
+        delay = min(self.max_wait, max(0.0, float(timeout_ms or 0) / 1000.0))
+
+        def _finish():
+            with self._lock:
+                value = self.site.check(conds)
+            ws.send_json({"id": req_id, "result": _remote_object(value)})
+
+        # 조건이 안 맞으면 페이지처럼 시간 초과까지 응답을 미룬다 (다른 명령은 계속 처리)
+        timer = threading.Timer(delay, _finish)
+        timer.daemon = True
+        timer.start()
+        return None
+
+
+def run_bench(args):
+    """대역 서버에 WebView2(CDP) 모드 봇을 붙여 목표 수만큼 처리하고 처리량을 출력."""
+    from config import AppConfig
+    from bot_logic import NaverBotLogic
+
+    site = FixtureSite(total_results=args.results, daily_limit=args.daily_limit)
+    server = FakeCdpServer(site, port=args.port, nav_latency_ms=args.latency_ms).start()
+    work_dir = tempfile.mkdtemp(prefix="nnp-bench-")
+
+    if args.seen > 0:
+        # 이전 실행에서 이미 처리한 블로그: 검색 결과 앞쪽 N개를 이력에 넣어 둔다
+        from history_store import HistoryStore
+        from naver_core import Outcome
+
+        history = HistoryStore(os.path.join(work_dir, "history.db"))
+        for index in range(args.seen):
+            history.record(site.blog_id_at(index), Outcome.SUCCESS)
+        history.close()
+
+    config = AppConfig()
+    for key, value in AppConfig.DEFAULTS.items():
+        config.set(key, value)
+    for key, value in {
+        "chrome_debug_port": server.port,
+        "force_cdp_mode": True,
+        "my_blog_id": site.my_blog_id,
+        "history_db_path": os.path.join(work_dir, "history.db"),
+        "run_journal": args.journal,
+        "blog_interval_sec": [0.8, 1.5] if args.pacing else [0, 0],
+        "cdp_record": args.record,
+    }.items():
+        config.set(key, value)
+
+    log = print if args.verbose else (lambda _msg: None)
+    bot = NaverBotLogic(config, log, lambda _value: None, lambda *_args: None)
+    bot.set_webview2_mode(True)
+
+    started = time.perf_counter()
+    bot.start_working(args.keyword, args.bench, config.get("neighbor_msg"))
+    elapsed = time.perf_counter() - started
+
+    snap = bot.metrics.snapshot()
+    processed = sum(n for name, n in snap["counters"].items() if name.startswith("outcome."))
+    blog_ms = snap["series"].get("blog_ms") or (None, None, 0)
+    print(f"처리 {processed}개 / 성공 {bot.current_count}개 / {elapsed:.2f}s "
+          f"({processed / elapsed if elapsed else 0:.1f} 블로그/s)")
+    if blog_ms[2]:
+        print(f"블로그당 p50 {blog_ms[0]:.1f}ms, p95 {blog_ms[1]:.1f}ms")
+    print("결과: " + ", ".join(
+        f"{name.split('.', 1)[1]} {n}" for name, n in sorted(snap["counters"].items()) if name.startswith("outcome.")
+    ))
+    print(f"CDP 명령: {sum(server.commands.values())}회 " + json.dumps(server.commands, ensure_ascii=False))
+    for line in bot.backend_stats.summary_lines():
+        print(f"   {line}")
+
+    bot._close_cdp()
+    bot.shutdown()
+    server.stop()
+    # 대역 서버가 받아들인 신청 수와 봇이 센 성공 수가 다르면 결과 판정이 어긋난 것
+    if bot.current_count != site.successes:
+        print(f"❌ 성공 수 불일치: 봇 {bot.current_count}개, 서버 {site.successes}개")
+        return 1
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="네이버 페이지를 흉내 내는 로컬 CDP 대역 서버")
+    parser.add_argument("--port", type=int, default=0, help="0이면 빈 포트 자동 선택")
+    parser.add_argument("--results", type=int, default=400, help="검색 결과 블로그 수")
+    parser.add_argument("--latency-ms", type=float, default=30.0, help="페이지 이동 지연")
+    parser.add_argument("--daily-limit", type=int, default=0, help="N회 신청 후 일일 한도 대화상자 (0: 없음)")
+    parser.add_argument("--bench", type=int, default=0, help="봇을 붙여 N명 서이추까지 실행")
+    parser.add_argument("--keyword", default="맛집")
+    parser.add_argument("--seen", type=int, default=0, help="검색 결과 앞쪽 N개를 이미 처리한 블로그로 이력에 기록")
+    parser.add_argument("--journal", action="store_true", help="벤치마크 중 run journal 기록")
+    parser.add_argument("--record", action="store_true", help="벤치마크 실행을 CDP 기록 파일로 저장 (cdp_replay.py)")
+    parser.add_argument("--pacing", action="store_true", help="블로그 사이 대기(blog_interval_sec 기본값) 유지")
+    parser.add_argument("--verbose", action="store_true", help="봇 로그 출력")
+    args = parser.parse_args(argv)
+
+    if args.bench > 0:
+        return run_bench(args)
+
+    site = FixtureSite(total_results=args.results, daily_limit=args.daily_limit)
+    server = FakeCdpServer(site, port=args.port, nav_latency_ms=args.latency_ms).start()
+    print(f"fake CDP: http://127.0.0.1:{server.port}/json/list (Ctrl+C로 종료)")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        pass
+    server.stop()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,17 +3,28 @@ import time
 import platform
 import threading
 import tkinter as tk
+from collections import deque
 
 import customtkinter as ctk
 
 from config import AppConfig
 from constants import IOS_COLORS, IOS_FONT_LARGE, IOS_FONT_MEDIUM, IOS_FONT_REGULAR, IOS_FONT_SMALL, IOS_FONT_MONO
+from constants import LOG_PUMP_INTERVAL_MS, LOG_BATCH_MAX, LOG_MAX_LINES, LOG_TRIM_CHUNK, METRICS_REFRESH_MS
 from bot_logic import NaverBotLogic
+import startup_profile
 
-try:
-    from webview2_panel import WebView2PanelHost
-except Exception:
-    WebView2PanelHost = None
+
+def _load_webview2_host_class():
+    """webview2_panel(comtypes)은 창이 뜬 뒤 처음 쓸 때 불러온다.
+
+    comtypes는 import한 스레드에서 COM을 초기화하므로 백그라운드가 아니라 메인 스레드에서 불러야 한다.
+    """
+    try:
+        with startup_profile.phase("import webview2_panel"):
+            from webview2_panel import WebView2PanelHost
+    except Exception:
+        return None
+    return WebView2PanelHost
 
 
 class App(ctk.CTk):
@@ -27,6 +38,13 @@ class App(ctk.CTk):
         # iOS 스타일 배경색
         self.configure(fg_color=IOS_COLORS["background"])
 
+        # 로그는 어느 스레드에서든 deque에 쌓고 메인 루프의 펌프가 묶어서 출력
+        self._log_queue = deque()
+        self._log_lines = 0
+        self._log_pump_job = None
+        self._metrics_job = None
+        self._metrics_text = ""
+
         self.logic = NaverBotLogic(config, self.log_msg, self.update_prog, self.update_browser_status, gui_window=self)
         self.embed_browser_windows = bool(self.config.get("embed_browser_windows")) and platform.system() == "Windows"
         self.use_webview2_panel = bool(self.config.get("use_webview2_panel")) and platform.system() == "Windows"
@@ -208,11 +226,28 @@ class App(ctk.CTk):
         )
         self.lbl_browser_status.pack(anchor="w", padx=20, pady=(0, 20))
 
+        # ---- 성능 지표 카드 ----
+        metrics_frame = ctk.CTkFrame(
+            self.scrollable_frame, fg_color=IOS_COLORS["card"], corner_radius=16
+        )
+        metrics_frame.grid(row=5, column=0, padx=20, pady=12, sticky="ew")
+
+        ctk.CTkLabel(
+            metrics_frame, text="성능 지표", font=IOS_FONT_MEDIUM, text_color=IOS_COLORS["text_primary"]
+        ).pack(anchor="w", padx=20, pady=(20, 14))
+
+        self.lbl_metrics = ctk.CTkLabel(
+            metrics_frame, text="작업 시작 후 표시됩니다.", font=IOS_FONT_MONO,
+            text_color=IOS_COLORS["text_secondary"], justify="left", anchor="w",
+        )
+        self.lbl_metrics.pack(fill="x", anchor="w", padx=20, pady=(0, 20))
+        self._metrics_job = self.after(METRICS_REFRESH_MS, self._refresh_metrics)
+
         # ---- 로그 카드 ----
         log_frame = ctk.CTkFrame(
             self.scrollable_frame, fg_color=IOS_COLORS["card"], corner_radius=16
         )
-        log_frame.grid(row=5, column=0, padx=20, pady=12, sticky="ew")
+        log_frame.grid(row=6, column=0, padx=20, pady=12, sticky="ew")
         log_frame.grid_columnconfigure(0, weight=1)
 
         ctk.CTkLabel(
@@ -225,6 +260,7 @@ class App(ctk.CTk):
             corner_radius=10, border_width=0,
         )
         self.txt_log.grid(row=1, column=0, padx=20, pady=(0, 20), sticky="nsew")
+        self._log_pump_job = self.after(LOG_PUMP_INTERVAL_MS, self._pump_log)
 
         # ========== 오른쪽 패널 (브라우저 화면 영역) ==========
         self.right_panel = ctk.CTkFrame(
@@ -285,7 +321,9 @@ class App(ctk.CTk):
         self.protocol("WM_DELETE_WINDOW", self._on_close)
 
         if self.use_webview2_panel:
-            self._init_webview2_panel()
+            # 창을 먼저 그린 뒤 WebView2 모듈을 불러온다: 짧은 타이머는 첫 idle 다시 그리기보다 먼저 돌 수 있으므로
+            # idle 처리(첫 그리기)가 끝난 다음 이벤트 루프 차례에 초기화한다
+            self.after_idle(lambda: self.after(0, self._init_webview2_panel))
 
         self._apply_scroll_fixes()
 
@@ -320,21 +358,88 @@ class App(ctk.CTk):
     # ------------------------------------------------------------------
     # 스레드 안전 UI 업데이트
     # ------------------------------------------------------------------
-    def _do_log(self, msg):
+    def _flush_log(self):
+        """쌓인 로그를 한 번의 insert로 출력하고, 줄 수가 한도를 넘으면 앞부분을 덩어리로 삭제."""
+        queue = self._log_queue
+        if not queue:
+            return
+        lines = []
+        while queue and len(lines) < LOG_BATCH_MAX:
+            lines.append(queue.popleft())
+        text = "".join(lines)
+        line_count = text.count("\n")
+
         log_inner = getattr(self.txt_log, "_textbox", None)
         _, bottom = log_inner.yview() if log_inner else (0.0, 1.0)
         self.txt_log.configure(state="normal")
-        timestamp = time.strftime("%H:%M:%S")
-        self.txt_log.insert("end", f"[{timestamp}] {msg}\n")
+        self.txt_log.insert("end", text)
+        self._log_lines += line_count
+        if self._log_lines > LOG_MAX_LINES:
+            excess = self._log_lines - LOG_MAX_LINES
+            trim = ((excess + LOG_TRIM_CHUNK - 1) // LOG_TRIM_CHUNK) * LOG_TRIM_CHUNK
+            self.txt_log.delete("1.0", f"{trim + 1}.0")
+            self._log_lines -= trim
         if bottom >= 0.95:
             self.txt_log.see("end")
         self.txt_log.configure(state="disabled")
 
+    def _pump_log(self):
+        try:
+            self._flush_log()
+        except Exception:
+            pass
+        self._log_pump_job = self.after(LOG_PUMP_INTERVAL_MS, self._pump_log)
+
+    @staticmethod
+    def _format_metrics(snap):
+        """MetricsRegistry.snapshot()을 패널 표시용 문자열로 변환."""
+        series = snap["series"]
+        lines = []
+
+        def _ms_line(label, name):
+            entry = series.get(name)
+            if entry and entry[2]:
+                lines.append(f"{label:<10} p50 {entry[0] / 1000:5.2f}s  p95 {entry[1] / 1000:5.2f}s")
+
+        _ms_line("블로그당", "blog_ms")
+        for name in ("tab", "navigate", "probe", "neighbor"):
+            _ms_line(f" └ {name}", f"stage.{name}")
+        if not lines:
+            return ""
+
+        loads = snap["rates"].get("page_load", 0.0)
+        lines.append(f"페이지 로드  {loads:.0f}회/분")
+        trips = series.get("round_trips")
+        if trips and trips[2]:
+            lines.append(f"왕복/블로그  p50 {trips[0]:.0f}  p95 {trips[1]:.0f}")
+        nbytes = series.get("bytes")
+        if nbytes and nbytes[2]:
+            lines.append(f"수신/블로그  p50 {nbytes[0] / 1024:.0f}KB  p95 {nbytes[1] / 1024:.0f}KB")
+        heap = snap["gauges"].get("js_heap_mb")
+        if heap:
+            lines.append(f"브라우저 JS 힙  {heap:.0f}MB")
+
+        outcomes = sorted(
+            ((name.split(".", 1)[1], n) for name, n in snap["counters"].items() if name.startswith("outcome.")),
+            key=lambda kv: kv[1], reverse=True,
+        )
+        if outcomes:
+            lines.append("결과  " + ", ".join(f"{name} {n}" for name, n in outcomes))
+        return "\n".join(lines)
+
+    def _refresh_metrics(self):
+        try:
+            text = self._format_metrics(self.logic.metrics.snapshot())
+            if text and text != self._metrics_text:
+                self._metrics_text = text
+                self.lbl_metrics.configure(text=text)
+        except Exception:
+            pass
+        self._metrics_job = self.after(METRICS_REFRESH_MS, self._refresh_metrics)
+
     def log_msg(self, msg):
-        if threading.current_thread() is threading.main_thread():
-            self._do_log(msg)
-        else:
-            self.after(0, self._do_log, msg)
+        # deque.append는 스레드 안전하므로 잠금 없이 적재만 한다
+        self._log_queue.append(f"[{time.strftime('%H:%M:%S')}] {msg}\n")
 
     def _do_update_prog(self, val):
         self.progressbar.set(val)
@@ -415,13 +520,14 @@ class App(ctk.CTk):
     def _init_webview2_panel(self):
         if not self.use_webview2_panel:
             return
-        if WebView2PanelHost is None:
+        host_class = _load_webview2_host_class()
+        if host_class is None:
             self.log_msg("⚠️ WebView2 모듈 로드 실패. Chrome 임베드 모드로 동작합니다.")
             self.use_webview2_panel = False
             if hasattr(self.logic, "set_webview2_mode"):
                 self.logic.set_webview2_mode(False)
             return
-        self.webview2_host = WebView2PanelHost(self.log_msg)
+        self.webview2_host = host_class(self.log_msg)
         if not self.webview2_host.is_available:
             self.log_msg(f"⚠️ WebView2 사용 불가: {self.webview2_host.unavailable_reason}")
             self.use_webview2_panel = False
@@ -545,6 +651,22 @@ class App(ctk.CTk):
                 self._webview2_resize_job = None
         except Exception:
             pass
+        try:
+            if self._log_pump_job is not None:
+                self.after_cancel(self._log_pump_job)
+                self._log_pump_job = None
+        except Exception:
+            pass
+        try:
+            if self._metrics_job is not None:
+                self.after_cancel(self._metrics_job)
+                self._metrics_job = None
+        except Exception:
+            pass
+        try:
+            self.logic.shutdown()
+        except Exception:
+            pass
         try:
             if self.webview2_host:
                 self.webview2_host.close()
@@ -0,0 +1,83 @@
+import os
+import time
+import sqlite3
+import threading
+
+from naver_core import Outcome
+
+
+DEFAULT_HISTORY_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "history.db")
+
+
+class HistoryStore:
+    """처리한 블로그 ID와 마지막 결과를 실행 간에 유지하는 SQLite(WAL) 기록.
+
+    시작 시 전체 (id → 결과)를 메모리 dict로 올려 조회는 디스크 접근 없이 처리하고,
+    기록은 write-through로 즉시 저장한다. 블로그 ID는 소문자로 정규화한다.
+    """
+
+    def __init__(self, path=None):
+        self.path = path or DEFAULT_HISTORY_PATH
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS blog_history (
+                blog_id TEXT PRIMARY KEY,
+                outcome TEXT NOT NULL,
+                message TEXT,
+                updated_at REAL NOT NULL
+            ) WITHOUT ROWID
+            """
+        )
+        self._conn.commit()
+        self._outcomes = {
+            blog_id: outcome
+            for blog_id, outcome in self._conn.execute("SELECT blog_id, outcome FROM blog_history")
+        }
+
+    def __len__(self):
+        return len(self._outcomes)
+
+    def outcome(self, blog_id):
+        return self._outcomes.get(str(blog_id).lower())
+
+    def is_final(self, blog_id):
+        return self._outcomes.get(str(blog_id).lower()) in Outcome.FINAL
+
+    def filter_unseen(self, blog_ids):
+        """다시 방문할 필요가 없는(FINAL) ID를 한 번에 걸러낸 목록."""
+        outcomes = self._outcomes
+        final = Outcome.FINAL
+        return [bid for bid in blog_ids if outcomes.get(bid.lower()) not in final]
+
+    def items(self):
+        """(blog_id, outcome, updated_at) 전체 목록."""
+        with self._lock:
+            return list(self._conn.execute("SELECT blog_id, outcome, updated_at FROM blog_history"))
+
+    def record(self, blog_id, outcome, message=""):
+        key = str(blog_id).lower()
+        with self._lock:
+            self._conn.execute(
+                """
+                INSERT INTO blog_history (blog_id, outcome, message, updated_at)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT(blog_id) DO UPDATE SET
+                    outcome = excluded.outcome,
+                    message = excluded.message,
+                    updated_at = excluded.updated_at
+                """,
+                (key, str(outcome), str(message or "")[:100], time.time()),
+            )
+            self._conn.commit()
+            self._outcomes[key] = str(outcome)
+
+    def close(self):
+        with self._lock:
+            try:
+                self._conn.close()
+            except sqlite3.Error:
+                pass
@@ -1,5 +1,10 @@
 import sys
 import os
+import time
+
+_T0 = time.perf_counter()
+# 시작 시간 프로파일: 모듈별 import 시간과 창이 뜰 때까지의 단계별 시각을 logs/startup-*.json으로 저장
+PROFILE_STARTUP = "--profile-startup" in sys.argv or os.environ.get("NNP_PROFILE_STARTUP") == "1"
 
 
 def _base_dir():
@@ -51,10 +56,16 @@ try:
     if not getattr(sys, "frozen", False):
         sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-    import customtkinter as ctk
+    import startup_profile
+    if PROFILE_STARTUP:
+        startup_profile.start(_T0)
+
+    with startup_profile.phase("import customtkinter"):
+        import customtkinter as ctk
     from config import AppConfig
     from font_setup import register_private_fonts
-    from gui import App
+    with startup_profile.phase("import gui"):
+        from gui import App
 
     warnings.filterwarnings("ignore", message=".*Tcl.*")
     warnings.filterwarnings("ignore", message=".*Tk.*")
@@ -81,12 +92,27 @@ except Exception:
     sys.exit(1)
 
 
+def _finish_startup_profile(app):
+    """첫 화면을 그리고 이벤트 루프가 한가해진 시점에 프로파일 결과를 출력."""
+    profiler = startup_profile.active()
+    if profiler is None:
+        return
+    profiler.mark("window interactive")
+    path = profiler.finish(os.path.join(_base_dir(), "logs"), log=print)
+    if path:
+        app.log_msg(f"⏱ 시작 프로파일 저장: {path} (창 준비 {(time.perf_counter() - _T0) * 1000:.0f}ms)")
+
+
 def main():
-    loaded = register_private_fonts()
+    with startup_profile.phase("register fonts"):
+        loaded = register_private_fonts()
     if loaded:
         logging.info("Loaded private fonts: %s", loaded)
     config = AppConfig()
-    app = App(config)
+    with startup_profile.phase("App()"):
+        app = App(config)
+    if PROFILE_STARTUP:
+        app.after(0, lambda: app.after_idle(_finish_startup_profile, app))
     app.mainloop()
 
 
@@ -0,0 +1,86 @@
+import time
+import threading
+from collections import deque
+
+
+def _percentile(sorted_values, q):
+    if not sorted_values:
+        return None
+    idx = min(len(sorted_values) - 1, max(0, int(round(q * (len(sorted_values) - 1)))))
+    return sorted_values[idx]
+
+
+class MetricsRegistry:
+    """작업 스레드가 기록하고 GUI 타이머가 읽는 프로세스 내 지표 저장소.
+
+    - observe(): 최근 window개 값만 유지하는 분포 (p50/p95)
+    - incr(): 누적 카운터
+    - mark(): 최근 rate_window초 동안의 발생 횟수 (분당 속도)
+    - gauge(): 마지막 값
+    """
+
+    def __init__(self, window=200, rate_window=60.0):
+        self.window = max(10, int(window))
+        self.rate_window = float(rate_window)
+        self._lock = threading.Lock()
+        self._series = {}
+        self._counters = {}
+        self._events = {}
+        self._gauges = {}
+
+    def observe(self, name, value):
+        with self._lock:
+            series = self._series.get(name)
+            if series is None:
+                series = self._series[name] = deque(maxlen=self.window)
+            series.append(float(value))
+
+    def incr(self, name, n=1):
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + n
+
+    def mark(self, name, now=None):
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            events = self._events.get(name)
+            if events is None:
+                events = self._events[name] = deque()
+            events.append(now)
+            self._expire(events, now)
+
+    def gauge(self, name, value):
+        with self._lock:
+            self._gauges[name] = value
+
+    def reset(self):
+        with self._lock:
+            self._series.clear()
+            self._counters.clear()
+            self._events.clear()
+            self._gauges.clear()
+
+    def _expire(self, events, now):
+        cutoff = now - self.rate_window
+        while events and events[0] < cutoff:
+            events.popleft()
+
+    def snapshot(self, now=None):
+        """{"series": {name: (p50, p95, n)}, "counters": {...}, "rates": {name: 분당}, "gauges": {...}}"""
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            series = {name: sorted(values) for name, values in self._series.items()}
+            counters = dict(self._counters)
+            rates = {}
+            for name, events in self._events.items():
+                self._expire(events, now)
+                rates[name] = len(events) * 60.0 / self.rate_window
+            gauges = dict(self._gauges)
+        return {
+            "series": {
+                name: (_percentile(values, 0.5), _percentile(values, 0.95), len(values))
+                for name, values in series.items()
+            },
+            "counters": counters,
+            "rates": rates,
+            "gauges": gauges,
+        }
@@ -0,0 +1,128 @@
+"""진입점(GUI/스크립트)이 공유하는 서이추 도메인 규칙."""
+
+import re
+
+
+class Outcome:
+    """process_neighbor 결과 분류. 기록/캐시에는 이 문자열이 저장된다."""
+
+    SUCCESS = "success"
+    ALREADY_NEIGHBOR = "already_neighbor"
+    PENDING = "pending"
+    DISABLED = "disabled"
+    FULL = "full"
+    INACCESSIBLE = "inaccessible"
+    NO_BUTTON = "no_button"
+    FAILED = "failed"
+    STOPPED = "stopped"
+    DAY_LIMIT = "day_limit"
+    GROUP_FULL = "group_full"
+
+    # 다음 실행부터 다시 방문할 필요가 없는 결과
+    FINAL = frozenset({SUCCESS, ALREADY_NEIGHBOR, PENDING})
+    # 블로그가 아니라 내 계정/실행 상태에 대한 결과 (기록하지 않음)
+    SESSION = frozenset({STOPPED, DAY_LIMIT, GROUP_FULL})
+
+
+def classify_outcome(result, message=""):
+    """process_neighbor의 (result, message)를 Outcome 값으로 분류."""
+    if result is True:
+        return Outcome.SUCCESS
+    if result == "DONE_DAY_LIMIT":
+        return Outcome.DAY_LIMIT
+    if result == "STOP_GROUP_FULL":
+        return Outcome.GROUP_FULL
+    text = str(message or "")
+    if "중단됨" in text:
+        return Outcome.STOPPED
+    if "이미 이웃" in text:
+        return Outcome.ALREADY_NEIGHBOR
+    if "이미 신청중" in text:
+        return Outcome.PENDING
+    if "서이추 비활성화" in text or "서이추 불가" in text:
+        return Outcome.DISABLED
+    if "5000명" in text:
+        return Outcome.FULL
+    if "접근 불가" in text:
+        return Outcome.INACCESSIBLE
+    if "버튼 없음" in text:
+        return Outcome.NO_BUTTON
+    return Outcome.FAILED
+
+
+def classify_popup(text):
+    """레이어/JS 알림 문구를 Outcome으로 분류. 작업 결과와 무관한 문구는 None."""
+    text = text or ""
+    if "하루" in text and "초과" in text:
+        return Outcome.DAY_LIMIT
+    if "선택 그룹" in text:
+        return Outcome.GROUP_FULL
+    if "5,000" in text or "5000" in text:
+        return Outcome.FULL
+    return None
+
+
+def is_day_limit_page(src):
+    """페이지 본문에 일일 신청 한도 초과 안내가 있는지."""
+    return "하루에 신청 가능한 이웃수" in src and "초과" in src
+
+
+def is_error_page(url, src):
+    """접근 불가/일시적 오류 블로그 페이지인지."""
+    return "MobileErrorView" in url or "일시적인 오류" in src
+
+
+def is_logged_in_page(src):
+    """내 블로그 본문에 글쓰기 링크가 보이는지 (로그인 상태)."""
+    return "글쓰기" in src or "write" in src.lower()
+
+
+BLOG_ID_RE = re.compile(r"blog\.naver\.com\/([a-zA-Z0-9_-]+)")
+MOBILE_BLOG_ID_RE = re.compile(r"m\.blog\.naver\.com\/([a-zA-Z0-9_-]+)", re.IGNORECASE)
+
+
+def extract_id(href):
+    """링크 하나에서 블로그 ID. 블로그 링크가 아니면 None."""
+    match = BLOG_ID_RE.search(href or "")
+    return match.group(1) if match else None
+
+
+def extract_ids(hrefs):
+    """링크 목록에서 블로그 ID를 순서대로 추출 (중복/형식 검사는 하지 않음)."""
+    search = BLOG_ID_RE.search
+    matches = (search(h if isinstance(h, str) else str(h or "")) for h in hrefs)
+    return [m.group(1) for m in matches if m]
+
+
+def append_blog_ids(links, queue):
+    """페이지에서 받은 링크 목록의 블로그 ID를 queue(CandidateQueue)에 추가하고 추가된 수를 반환."""
+    if not isinstance(links, list):
+        return 0
+    return queue.extend(extract_ids(links))
+
+
+# 페이지 안에서 blog.naver.com/<id> 링크만 골라 중복 제거 후 반환 (앵커별 get_attribute 왕복 제거)
+BLOG_LINKS_JS = """
+var re = /blog\\.naver\\.com\\/([a-zA-Z0-9_-]+)/;
+var seen = Object.create(null);
+var out = [];
+var anchors = document.querySelectorAll('a[href]');
+for (var i = 0; i < anchors.length; i++) {
+    var m = re.exec(anchors[i].href || '');
+    if (!m || seen[m[1]]) continue;
+    seen[m[1]] = true;
+    out.push('blog.naver.com/' + m[1]);
+}
+return out;
+"""
+
+
+# 블로그 ID가 아닌 blog.naver.com 경로
+BLOG_ID_BLACKLIST = frozenset(
+    {"myblog", "postlist", "buddyaddform", "likeit", "nvisitor", "blog", "domainid", "admin", "search"}
+)
+
+
+def is_candidate_id(bid):
+    """블로그 ID 형식 검사 (경로명/숫자 전용/너무 짧은 ID 제외)."""
+    return len(bid) > 3 and not bid.isdigit() and bid.lower() not in BLOG_ID_BLACKLIST
@@ -0,0 +1,89 @@
+import time
+import threading
+from collections import OrderedDict
+
+from naver_core import Outcome
+
+
+# 결과 분류별 유지 시간(시간). 여기에 없는 결과는 캐시하지 않는다.
+# 버튼 없음(NO_BUTTON)은 느린 렌더링/로그인 풀림/오류 화면에서도 나오는 일시적 결과라 캐시하지 않는다.
+DEFAULT_TTL_HOURS = {
+    Outcome.DISABLED: 72,
+    Outcome.FULL: 72,
+    Outcome.INACCESSIBLE: 168,
+}
+
+
+class NegativeCache:
+    """서이추가 안 되는 블로그를 결과 분류별 TTL 동안 기억하는 크기 제한 캐시.
+
+    만료는 조회 시점에 지연 처리하고, 가득 차면 가장 오래 갱신되지 않은 항목부터 버린다.
+    """
+
+    def __init__(self, ttl_hours=None, max_entries=5000):
+        ttl_hours = dict(DEFAULT_TTL_HOURS if ttl_hours is None else ttl_hours)
+        self._ttl = {str(k): float(v) * 3600.0 for k, v in ttl_hours.items() if v and float(v) > 0}
+        self.max_entries = max(1, int(max_entries or 1))
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def ttl_for(self, outcome):
+        return self._ttl.get(str(outcome))
+
+    def add(self, blog_id, outcome, at=None):
+        """캐시 대상 결과면 저장하고 True. 대상이 아니면 기존 항목을 지우고 False."""
+        key = str(blog_id).lower()
+        ttl = self._ttl.get(str(outcome))
+        with self._lock:
+            if ttl is None:
+                self._entries.pop(key, None)
+                return False
+            expires_at = (time.time() if at is None else float(at)) + ttl
+            if expires_at <= time.time():
+                return False
+            self._entries[key] = (str(outcome), expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            return True
+
+    def get(self, blog_id, now=None):
+        """유효한 캐시 결과 분류. 없거나 만료되면 None."""
+        key = str(blog_id).lower()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[1] <= (time.time() if now is None else now):
+                del self._entries[key]
+                return None
+            return entry[0]
+
+    def active_ids(self):
+        """아직 만료되지 않은 블로그 ID 목록."""
+        now = time.time()
+        with self._lock:
+            return [key for key, (_outcome, expires_at) in self._entries.items() if expires_at > now]
+
+    def filter(self, blog_ids):
+        """캐시에 걸린 ID를 제외한 목록 (한 번의 순회)."""
+        now = time.time()
+        kept = []
+        for bid in blog_ids:
+            if self.get(bid, now) is None:
+                kept.append(bid)
+            else:
+                self.hits += 1
+        return kept
+
+    def warm(self, rows):
+        """(blog_id, outcome, updated_at) 기록으로 초기화. 오래된 기록부터 넣어 최근 항목이 남게 한다."""
+        count = 0
+        for blog_id, outcome, updated_at in sorted(rows, key=lambda r: r[2] or 0):
+            if self.add(blog_id, outcome, at=updated_at):
+                count += 1
+        return count
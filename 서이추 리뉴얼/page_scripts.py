@@ -0,0 +1,284 @@
+"""페이지 안에서 실행되는 JS 헬퍼 라이브러리.
+
+문서마다 한 번 `window.__nnp` 네임스페이스로 설치해 두고(CDP는
+Page.addScriptToEvaluateOnNewDocument), 이후에는 짧은 함수 호출만 전송한다.
+헬퍼 로직을 바꾸면 NNP_VERSION을 올려 이전 버전이 설치된 문서에서도 재주입되게 한다.
+"""
+
+import json
+import textwrap
+
+from naver_core import BLOG_LINKS_JS
+
+NNP_VERSION = 5
+
+# 헬퍼가 없는(또는 버전이 다른) 문서에서 호출했을 때 돌려받는 표식
+NNP_MISSING = "__NNP_MISSING__"
+
+# 페이지 상태 스냅샷 기본값 (스크립트 실행 실패 시에도 같은 키를 보장)
+EMPTY_PAGE_STATE = {
+    "url": "",
+    "error_page": False,
+    "login_required": False,
+    "already_neighbor": False,
+    "request_in_progress": False,
+    "pending_text": False,
+    "day_limit": False,
+    "alert_text": None,
+    "has_add_button": False,
+    "has_neighbor_button": False,
+    "has_both_radio": False,
+    "has_oneway_radio": False,
+    "both_radio_disabled": False,
+    "is_buddy_form": False,
+}
+
+NNP_HELPER_JS = """
+(function () {
+    if (window.__nnp && window.__nnp.version === %(version)d) return;
+    var textOf = function (el) { return (el.innerText || el.textContent || '').trim(); };
+    var errorText = function (e) { return 'ERROR:' + (e && e.message ? e.message : ''); };
+    var clickFirstByText = function (selector, text) {
+        var el = Array.from(document.querySelectorAll(selector))
+            .find(function (n) { return (n.innerText || '').indexOf(text) >= 0; });
+        if (!el) return false;
+        el.click();
+        return true;
+    };
+
+    window.__nnp = {
+        version: %(version)d,
+
+        // 페이지 안에서 마커를 검사하고 작은 dict만 반환. 문구는 outerHTML 직렬화 대신 보이는 텍스트에서 찾는다
+        probe: function () {
+            var text = document.body ? (document.body.innerText || '') : '';
+            var url = location.href || '';
+            var has = function (s) { return text.indexOf(s) >= 0; };
+            var both = document.getElementById('bothBuddyRadio');
+            return {
+                url: url,
+                error_page: url.indexOf('MobileErrorView') >= 0 || has('일시적인 오류'),
+                login_required: has('로그인이 필요'),
+                already_neighbor: has('이웃끊기') || has('서로이웃 취소'),
+                request_in_progress: has('서로이웃 신청 진행중입니다'),
+                pending_text: has('진행 중') || has('신청중'),
+                day_limit: has('하루에 신청 가능한 이웃수') && has('초과'),
+                alert_text: this.alertText(),
+                has_add_button: !!document.querySelector("[data-click-area='ebc.add']"),
+                has_neighbor_button: !!document.querySelector("[data-click-area='ebc.ngr']"),
+                has_both_radio: !!both,
+                has_oneway_radio: !!document.getElementById('onewayBuddyRadio'),
+                both_radio_disabled: !!(both && (both.disabled || both.getAttribute('disabled'))),
+                is_buddy_form: url.indexOf('BuddyAddForm') >= 0
+            };
+        },
+
+        alertText: function () {
+            var layer = document.getElementById('_alertLayer');
+            if (layer && layer.style.display !== 'none') {
+                var dsc = layer.querySelector('.dsc');
+                return dsc ? (dsc.innerText || '').trim() : null;
+            }
+            return null;
+        },
+
+        closeAlert: function () {
+            var btn = document.getElementById('_alertLayerClose');
+            if (btn) { btn.click(); return true; }
+            return false;
+        },
+
+        clickButtonByText: function (text) {
+            return clickFirstByText('button,a', text);
+        },
+
+        clickAddButton: function () {
+            try {
+                var addBtn = document.querySelector("[data-click-area='ebc.add']");
+                if (addBtn) { addBtn.click(); return 'CLICKED'; }
+                if (document.querySelector("[data-click-area='ebc.ngr']")) return 'ALREADY';
+                var textBtn = Array.from(document.querySelectorAll('a,button,span,div'))
+                    .find(function (el) { return textOf(el).indexOf('이웃추가') >= 0; });
+                if (textBtn) { textBtn.click(); return 'CLICKED'; }
+                return 'NONE';
+            } catch (e) {
+                return errorText(e);
+            }
+        },
+
+        selectBothRadio: function () {
+            try {
+                var both = document.getElementById('bothBuddyRadio');
+                if (!both) {
+                    if (document.getElementById('onewayBuddyRadio')) return 'ONEWAY_ONLY';
+                    return 'NO_FORM';
+                }
+                if (both.disabled || both.getAttribute('disabled')) return 'DISABLED';
+                if (!both.checked) {
+                    var label = document.querySelector("label[for='bothBuddyRadio']");
+                    if (label) label.click();
+                    else both.click();
+                }
+                return 'OK';
+            } catch (e) {
+                return errorText(e);
+            }
+        },
+
+        fillMessage: function (msg) {
+            var el = document.querySelector('textarea');
+            if (!el) return false;
+            el.focus();
+            el.value = msg;
+            el.dispatchEvent(new Event('input', { bubbles: true }));
+            el.dispatchEvent(new Event('change', { bubbles: true }));
+            return true;
+        },
+
+        clickConfirm: function () {
+            var btn = Array.from(document.querySelectorAll("button,a,input[type='button'],input[type='submit']"))
+                .find(function (el) {
+                    var txt = (el.innerText || el.value || '').trim();
+                    return txt === '확인' || txt.indexOf('확인') >= 0;
+                });
+            if (!btn) return false;
+            btn.click();
+            return true;
+        },
+
+        clickBlogTab: function () {
+            try {
+                var blogTab = Array.from(document.querySelectorAll("[role='tab'], .tab, .lnb_item a"))
+                    .find(function (el) { return textOf(el).indexOf('블로그') >= 0; }) || null;
+                if (!blogTab) {
+                    blogTab = Array.from(document.querySelectorAll("a[href*='search.naver.com/search.naver']"))
+                        .find(function (el) { return textOf(el).indexOf('블로그') >= 0; }) || null;
+                }
+                if (!blogTab) return 'NONE';
+                blogTab.click();
+                return 'CLICKED';
+            } catch (e) {
+                return 'ERROR';
+            }
+        },
+
+        // 블로그 탭 클릭 실패 시 검색어를 유지한 채 블로그 결과로 강제 이동
+        forceBlogSearch: function () {
+            try {
+                var q = new URL(location.href).searchParams.get('query') || '';
+                if (!q) {
+                    var input = document.querySelector("input[name='query'], input#nx_query");
+                    q = input ? (input.value || '').trim() : '';
+                }
+                if (!q) return false;
+                location.href = 'https://search.naver.com/search.naver?where=blog&query=' + encodeURIComponent(q);
+                return true;
+            } catch (e) {
+                return false;
+            }
+        },
+
+        // 스크롤 직전 블로그 링크 수를 반환 (이후 waitFor 'count' 조건의 기준값)
+        scrollToBottom: function () {
+            var count = document.querySelectorAll("a[href*='blog.naver.com']").length;
+            window.scrollTo(0, document.body.scrollHeight);
+            return count + 1;
+        },
+
+        // blog.naver.com/<id> 링크만 페이지 안에서 골라 id 기준 중복 제거 후 짧은 형태로 반환
+        // (본문은 구버전 진입점과 같은 naver_core.BLOG_LINKS_JS에서 만든다)
+        blogLinks: function () {
+%(blog_links)s
+        },
+
+        // conds: [[kind, arg], ...] 중 먼저 만족한 조건의 [index, value]를 resolve, 시간 초과 시 null.
+        // DOM 변화는 MutationObserver로, URL/네트워크 유휴는 짧은 타이머로 페이지 안에서 판정한다.
+        // 변화가 몰려도 재검사(innerText 계산 포함)는 프레임당 한 번으로 묶는다.
+        waitFor: function (conds, timeoutMs) {
+            var self = this;
+            var lastActivity = Date.now();
+            var check = function (kind, arg) {
+                switch (kind) {
+                    case 'selector': return !!document.querySelector(arg);
+                    case 'gone': return !document.querySelector(arg);
+                    case 'alert': return self.alertText() || false;
+                    case 'url_changed': return location.href !== arg ? location.href : false;
+                    case 'url_contains': return location.href.indexOf(arg) >= 0 ? location.href : false;
+                    case 'text': return !!(document.body && (document.body.innerText || '').indexOf(arg) >= 0);
+                    case 'count': return document.querySelectorAll(arg[0]).length >= arg[1];
+                    case 'idle':
+                        return document.readyState === 'complete' && Date.now() - lastActivity >= (arg || 300);
+                }
+                return false;
+            };
+            var evaluate = function () {
+                for (var i = 0; i < conds.length; i++) {
+                    var v = check(conds[i][0], conds[i][1]);
+                    if (v) return [i, v];
+                }
+                return null;
+            };
+            return new Promise(function (resolve) {
+                var first = evaluate();
+                if (first) { resolve(first); return; }
+                var done = false, observer = null, perf = null, tick = null, timer = null;
+                var finish = function (value) {
+                    if (done) return;
+                    done = true;
+                    if (observer) observer.disconnect();
+                    if (perf) perf.disconnect();
+                    clearInterval(tick);
+                    clearTimeout(timer);
+                    resolve(value);
+                };
+                var recheck = function () { var hit = evaluate(); if (hit) finish(hit); };
+                var pending = false;
+                var runPending = function () { if (!pending) return; pending = false; if (!done) recheck(); };
+                var schedule = function () {
+                    if (pending || done) return;
+                    pending = true;
+                    // 숨은 탭에서는 requestAnimationFrame이 멈추므로 타이머도 함께 건다 (먼저 도는 쪽만 실행)
+                    if (window.requestAnimationFrame) requestAnimationFrame(runPending);
+                    setTimeout(runPending, 100);
+                };
+                observer = new MutationObserver(schedule);
+                observer.observe(document.documentElement || document, {
+                    childList: true, subtree: true, attributes: true, characterData: true
+                });
+                var needsTick = conds.some(function (c) {
+                    return c[0] === 'url_changed' || c[0] === 'url_contains' || c[0] === 'idle';
+                });
+                if (needsTick) {
+                    if (window.PerformanceObserver) {
+                        try {
+                            perf = new PerformanceObserver(function () { lastActivity = Date.now(); });
+                            perf.observe({ entryTypes: ['resource'] });
+                        } catch (e) { perf = null; }
+                    }
+                    tick = setInterval(recheck, 50);
+                }
+                timer = setTimeout(function () { finish(null); }, Math.max(0, timeoutMs || 0));
+            });
+        },
+
+        clickMore: function () {
+            var btn = document.querySelector('.btn_more, .more_btn');
+            if (!btn) return false;
+            var style = window.getComputedStyle(btn);
+            if (style && style.display === 'none') return false;
+            var count = document.querySelectorAll("a[href*='blog.naver.com']").length;
+            btn.click();
+            return count + 1;
+        }
+    };
+})();
+""" % {"version": NNP_VERSION, "blog_links": textwrap.indent(BLOG_LINKS_JS.strip(), " " * 12)}
+
+
+def nnp_call_script(fn, *args):
+    """헬퍼 함수 호출 스크립트(함수 본문 형태). 헬퍼가 없으면 NNP_MISSING을 반환한다."""
+    return (
+        f"return (window.__nnp && window.__nnp.version === {NNP_VERSION}) "
+        f"? window.__nnp.{fn}.apply(window.__nnp, {json.dumps(list(args))}) "
+        f": {json.dumps(NNP_MISSING)};"
+    )
@@ -0,0 +1,59 @@
+"""자동화 탐색용 경량 페이지 프로필.
+
+봇은 DOM 마커와 버튼만 읽으므로 이미지/미디어/폰트와 광고·통계 요청은 받지 않는다.
+CDP는 Fetch 가로채기(리소스 유형 + URL 패턴, 허용 목록 적용),
+Selenium은 Network.setBlockedURLs(URL 패턴만 지원)로 적용한다.
+"""
+
+# Fetch 가로채기 대상 리소스 유형 (CDP Network.ResourceType)
+BLOCKED_RESOURCE_TYPES = ("Image", "Media", "Font")
+
+# 광고/통계 요청
+TRACKER_URL_PATTERNS = (
+    "*://wcs.naver.net/*",
+    "*://lcs.naver.com/*",
+    "*://tivan.naver.com/*",
+    "*://adcr.naver.com/*",
+    "*://siape.veta.naver.com/*",
+    "*://ssl.pstatic.net/tveta/*",
+    "*://*.doubleclick.net/*",
+    "*://www.googletagmanager.com/*",
+    "*://www.google-analytics.com/*",
+)
+
+# 리소스 유형을 알 수 없는 Selenium 경로에서 쓰는 확장자 패턴
+STATIC_URL_PATTERNS = (
+    "*.jpg*",
+    "*.jpeg*",
+    "*.png*",
+    "*.gif*",
+    "*.webp*",
+    "*.bmp*",
+    "*.ico*",
+    "*.mp4*",
+    "*.webm*",
+    "*.m3u8*",
+    "*.woff*",
+    "*.ttf*",
+    "*.otf*",
+)
+
+# URL이나 Referer에 포함되면 차단하지 않음 (로그인/캡차/서이추 양식)
+ALLOWED_URL_KEYWORDS = ("nid.naver.com", "captcha", "BuddyAddForm")
+
+
+def fetch_patterns():
+    """Fetch.enable에 넘길 가로채기 패턴. 여기에 걸린 요청만 Python으로 넘어온다."""
+    patterns = [{"resourceType": t, "requestStage": "Request"} for t in BLOCKED_RESOURCE_TYPES]
+    patterns += [{"urlPattern": p, "requestStage": "Request"} for p in TRACKER_URL_PATTERNS]
+    return patterns
+
+
+def blocked_url_patterns():
+    """Network.setBlockedURLs용 패턴 목록."""
+    return list(STATIC_URL_PATTERNS + TRACKER_URL_PATTERNS)
+
+
+def is_allowed(url, referer=""):
+    text = f"{url or ''} {referer or ''}"
+    return any(keyword in text for keyword in ALLOWED_URL_KEYWORDS)
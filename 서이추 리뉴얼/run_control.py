@@ -0,0 +1,98 @@
+import time
+import threading
+
+
+class RunControl:
+    """작업 실행/일시정지/중지 상태를 공유하는 토큰.
+
+    모든 대기는 하나의 Condition 위에서 이루어지므로 stop()/resume()이 즉시 깨우고,
+    일시정지 중인 작업 스레드는 깨어나지 않고 블록된다.
+    stop() 시 등록된 콜백(진행 중인 CDP 대기 취소 등)을 호출한다.
+    """
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._running = False
+        self._paused = False
+        self._stop_event = threading.Event()
+        self._stop_callbacks = []
+
+    @property
+    def running(self):
+        return self._running
+
+    @property
+    def paused(self):
+        return self._paused
+
+    @property
+    def stop_event(self):
+        """현재 실행에 대한 중지 요청 여부 (start()에서 초기화)."""
+        return self._stop_event
+
+    def start(self):
+        with self._cond:
+            self._running = True
+            self._paused = False
+            self._stop_event.clear()
+            self._cond.notify_all()
+
+    def stop(self):
+        with self._cond:
+            was_running = self._running
+            self._running = False
+            self._paused = False
+            if was_running:
+                self._stop_event.set()
+            self._cond.notify_all()
+            callbacks = list(self._stop_callbacks) if was_running else []
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception:
+                pass
+
+    def set_paused(self, paused):
+        with self._cond:
+            self._paused = bool(paused) and self._running
+            self._cond.notify_all()
+
+    def on_stop(self, callback):
+        """중지 요청 시 호출할 콜백 등록. 등록 해제 함수를 반환한다."""
+        with self._cond:
+            self._stop_callbacks.append(callback)
+
+        def _unsubscribe():
+            with self._cond:
+                try:
+                    self._stop_callbacks.remove(callback)
+                except ValueError:
+                    pass
+
+        return _unsubscribe
+
+    def wait_if_paused(self):
+        """일시정지 동안 블록. 재개되면 True, 중지되면 False."""
+        with self._cond:
+            while self._paused and self._running:
+                self._cond.wait()
+            return self._running
+
+    def sleep(self, seconds):
+        """중지 요청 시 바로 깨어나는 sleep. 끝까지 잤으면 True.
+
+        실행 중이 아닐 때(연결/로그인 단계)는 일반 sleep과 같다.
+        """
+        if seconds <= 0:
+            return True
+        if not self._running:
+            time.sleep(seconds)
+            return True
+        deadline = time.monotonic() + seconds
+        with self._cond:
+            while self._running:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return True
+                self._cond.wait(remaining)
+            return False
@@ -0,0 +1,97 @@
+import os
+import json
+import time
+import queue
+import threading
+
+
+DEFAULT_JOURNAL_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "logs")
+
+_CLOSE = object()
+
+
+class RunJournal:
+    """블로그 처리 기록을 JSONL로 남기는 회전 파일 저널.
+
+    write()는 큐에 넣기만 하고, 직렬화/파일 쓰기/flush/회전은 전용 스레드가 묶어서 처리한다.
+    파일이 max_bytes를 넘으면 run_journal.jsonl → .1 → .2 ... 로 밀어내고 backup_count개만 남긴다.
+    """
+
+    def __init__(self, directory=None, max_bytes=5 * 1024 * 1024, backup_count=5, flush_interval=1.0):
+        self.directory = directory or DEFAULT_JOURNAL_DIR
+        self.path = os.path.join(self.directory, "run_journal.jsonl")
+        self.max_bytes = max(1024, int(max_bytes))
+        self.backup_count = max(0, int(backup_count))
+        self.flush_interval = float(flush_interval)
+        self._queue = queue.SimpleQueue()
+        self._file = None
+        self._size = 0
+        self._thread = threading.Thread(target=self._writer_loop, name="run-journal", daemon=True)
+        self._thread.start()
+
+    def write(self, record):
+        self._queue.put(record)
+
+    def close(self, timeout=2.0):
+        self._queue.put(_CLOSE)
+        self._thread.join(timeout)
+
+    # ------------------------------------------------------------------
+    # writer 스레드
+    # ------------------------------------------------------------------
+    def _open(self):
+        os.makedirs(self.directory, exist_ok=True)
+        self._file = open(self.path, "a", encoding="utf-8", buffering=64 * 1024)
+        self._size = self._file.tell()
+
+    def _rotate(self):
+        self._file.close()
+        self._file = None
+        for idx in range(self.backup_count - 1, 0, -1):
+            src = f"{self.path}.{idx}"
+            if os.path.exists(src):
+                os.replace(src, f"{self.path}.{idx + 1}")
+        if self.backup_count > 0:
+            os.replace(self.path, f"{self.path}.1")
+        else:
+            os.remove(self.path)
+        self._open()
+
+    def _writer_loop(self):
+        last_flush = time.monotonic()
+        closing = False
+        while not closing:
+            try:
+                item = self._queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                item = None
+            try:
+                while item is not None:
+                    if item is _CLOSE:
+                        closing = True
+                        break
+                    self._append(item)
+                    try:
+                        item = self._queue.get_nowait()
+                    except queue.Empty:
+                        item = None
+                if self._file and (closing or time.monotonic() - last_flush >= self.flush_interval):
+                    self._file.flush()
+                    last_flush = time.monotonic()
+            except OSError:
+                continue
+        if self._file:
+            try:
+                self._file.close()
+            except OSError:
+                pass
+
+    def _append(self, record):
+        line = json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n"
+        if self._file is None:
+            self._open()
+        nbytes = len(line.encode("utf-8"))
+        if self._size and self._size + nbytes > self.max_bytes:
+            self._rotate()
+        self._file.write(line)
+        self._size += nbytes
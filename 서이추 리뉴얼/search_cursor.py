@@ -0,0 +1,70 @@
+import time
+import urllib.parse
+
+
+class SearchCursor:
+    """키워드별 블로그 검색 진행 위치.
+
+    재수집 시 검색 첫 화면부터 다시 스크롤하지 않도록 지금까지 훑은 결과 수(offset)를
+    기억해 `start` 파라미터로 이어서 열고, 더 나올 결과가 없으면 소진으로 표시한다.
+    검색 탭을 유지하는 Selenium 모드에서는 같은 문서 안에서 늘어난 만큼만 offset에 더한다.
+    """
+
+    def __init__(self, keyword, exhausted_ttl=3600.0):
+        self.keyword = str(keyword or "")
+        self.base_url = None
+        self.offset = 0
+        self.refills = 0
+        self._doc_links = 0
+        self.exhausted_ttl = float(exhausted_ttl or 0)
+        self._exhausted_at = None
+
+    @property
+    def exhausted(self):
+        if self._exhausted_at is None:
+            return False
+        if self.exhausted_ttl > 0 and time.time() - self._exhausted_at >= self.exhausted_ttl:
+            # 시간이 지나면 새 글이 올라왔을 수 있으므로 처음부터 다시 훑는다
+            self.reset()
+            return False
+        return True
+
+    def url(self):
+        base = self.base_url or (
+            "https://search.naver.com/search.naver?where=blog&query=" + urllib.parse.quote(self.keyword)
+        )
+        if self.offset <= 0:
+            return base
+        parts = urllib.parse.urlsplit(base)
+        query = [(k, v) for k, v in urllib.parse.parse_qsl(parts.query, keep_blank_values=True) if k != "start"]
+        query.append(("start", str(self.offset + 1)))
+        return urllib.parse.urlunsplit(parts._replace(query=urllib.parse.urlencode(query)))
+
+    def remember_base(self, url):
+        """블로그 탭 클릭 후의 URL을 기억해 다음 재수집부터 탭 클릭을 건너뛴다."""
+        url = str(url or "")
+        if "search.naver.com" not in url:
+            return
+        parts = urllib.parse.urlsplit(url)
+        query = [(k, v) for k, v in urllib.parse.parse_qsl(parts.query, keep_blank_values=True) if k != "start"]
+        self.base_url = urllib.parse.urlunsplit(parts._replace(query=urllib.parse.urlencode(query)))
+
+    def new_document(self):
+        """검색 페이지를 새로 열었을 때 호출 (문서 내 링크 수 기준 초기화)."""
+        self._doc_links = 0
+
+    def advance(self, links_in_document):
+        """현재 문서의 결과 링크 수를 반영해 진행 위치를 갱신."""
+        links = max(0, int(links_in_document or 0))
+        if links > self._doc_links:
+            self.offset += links - self._doc_links
+            self._doc_links = links
+        self.refills += 1
+
+    def mark_exhausted(self):
+        self._exhausted_at = time.time()
+
+    def reset(self):
+        self.offset = 0
+        self._doc_links = 0
+        self._exhausted_at = None
@@ -0,0 +1,118 @@
+import os
+import json
+import random
+import threading
+import time
+from collections import deque
+
+
+class _NullSpan:
+    """추적이 꺼져 있을 때 돌려주는 공용 no-op 스팬."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    __slots__ = ("tracer", "name", "cat", "args", "t0")
+
+    def __init__(self, tracer, name, cat, args):
+        self.tracer = tracer
+        self.name = name
+        self.cat = cat
+        self.args = args
+        self.t0 = 0
+
+    def __enter__(self):
+        self.t0 = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        t1 = time.perf_counter_ns()
+        if exc_type is not None:
+            self.args = dict(self.args or {}, error=exc_type.__name__)
+        self.tracer._add_complete(self.name, self.cat, self.t0, t1, self.args)
+        return False
+
+
+class SpanTracer:
+    """작업 단계별 구간(span)을 기록해 Chrome Trace Event JSON으로 내보내는 추적기.
+
+    꺼져 있으면 span()이 공용 no-op 객체를 돌려주므로 호출 비용은 속성 확인 한 번뿐이다.
+    sample_rate < 1이면 블로그 단위(begin_unit~end_unit)로 일부만 기록한다.
+    """
+
+    def __init__(self, enabled=False, sample_rate=1.0, max_events=200000):
+        self.enabled = bool(enabled)
+        self.sample_rate = min(1.0, max(0.0, float(sample_rate if sample_rate is not None else 1.0)))
+        self._events = deque(maxlen=max(1000, int(max_events)))
+        self._origin_ns = time.perf_counter_ns()
+        self._pid = os.getpid()
+        self._thread_names = {}
+        self.active = self.enabled
+
+    def span(self, name, cat="run", **args):
+        if not self.active:
+            return _NULL_SPAN
+        return _Span(self, name, cat, args or None)
+
+    def instant(self, name, cat="run", **args):
+        if not self.active:
+            return
+        self._append({"name": name, "cat": cat, "ph": "i", "s": "t",
+                      "ts": (time.perf_counter_ns() - self._origin_ns) / 1000.0, "args": args})
+
+    def begin_unit(self):
+        """블로그 하나의 처리 시작. 샘플링 대상인지 결정한다."""
+        self.active = self.enabled and (self.sample_rate >= 1.0 or random.random() < self.sample_rate)
+
+    def end_unit(self):
+        self.active = self.enabled
+
+    def clear(self):
+        self._events.clear()
+        self._origin_ns = time.perf_counter_ns()
+        self.active = self.enabled
+
+    def __len__(self):
+        return len(self._events)
+
+    def _add_complete(self, name, cat, t0, t1, args):
+        event = {"name": name, "cat": cat, "ph": "X",
+                 "ts": (t0 - self._origin_ns) / 1000.0, "dur": (t1 - t0) / 1000.0}
+        if args:
+            event["args"] = args
+        self._append(event)
+
+    def _append(self, event):
+        thread = threading.current_thread()
+        tid = thread.ident or 0
+        if tid not in self._thread_names:
+            self._thread_names[tid] = thread.name
+        event["pid"] = self._pid
+        event["tid"] = tid
+        self._events.append(event)
+
+    def export(self, path):
+        """chrome://tracing / Perfetto에서 열 수 있는 JSON 파일로 저장. 기록한 이벤트 수를 반환."""
+        events = list(self._events)
+        meta = [
+            {"name": "thread_name", "ph": "M", "pid": self._pid, "tid": tid, "args": {"name": name}}
+            for tid, name in list(self._thread_names.items())
+        ]
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": meta + events, "displayTimeUnit": "ms"}, f,
+                      ensure_ascii=False, separators=(",", ":"))
+        os.replace(tmp_path, path)
+        return len(events)
@@ -0,0 +1,174 @@
+"""시작 시간 프로파일 (main.py --profile-startup 또는 NNP_PROFILE_STARTUP=1).
+
+모듈별 import 시간(누적/자체)과 초기화 단계 시각을 모아, 창이 입력을 받을 수 있게 된 시점에
+표로 출력하고 logs/startup-<실행시각>.json으로 저장한다. 켜지 않으면 phase()/mark()는 아무것도 하지 않는다.
+"""
+
+import builtins
+import importlib.util
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+
+_profiler = None
+
+
+class StartupProfiler:
+    """builtins.__import__를 감싸 새로 불러온 모듈의 import 시간을 잰다."""
+
+    def __init__(self, t0=None):
+        self.t0 = time.perf_counter() if t0 is None else t0
+        self.imports = {}
+        self.marks = []
+        self.phases = []
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._orig_import = None
+
+    def install(self):
+        if self._orig_import is None:
+            self._orig_import = builtins.__import__
+            builtins.__import__ = self._import
+        return self
+
+    def uninstall(self):
+        if self._orig_import is not None:
+            builtins.__import__ = self._orig_import
+            self._orig_import = None
+
+    def _import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        orig = self._orig_import or builtins.__import__
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        loaded = len(sys.modules)
+        stack.append(0.0)
+        t0 = time.perf_counter()
+        try:
+            return orig(name, globals, locals, fromlist, level)
+        finally:
+            elapsed = time.perf_counter() - t0
+            children = stack.pop()
+            if stack:
+                stack[-1] += elapsed
+            # 이미 불러온 모듈을 다시 찾는 호출은 기록하지 않는다
+            if len(sys.modules) != loaded:
+                self._record(self._resolve(name, globals, level), elapsed, elapsed - children)
+
+    @staticmethod
+    def _resolve(name, globals, level):
+        if level <= 0:
+            return name
+        try:
+            return importlib.util.resolve_name("." * level + name, (globals or {}).get("__package__"))
+        except (ImportError, ValueError):
+            return name
+
+    def _record(self, name, cumulative, own):
+        # 같은 이름으로 여러 번 잡히면 (from 패키지 import 하위모듈) 처음 불러온 호출만 남긴다
+        with self._lock:
+            if name not in self.imports:
+                self.imports[name] = (cumulative, own, time.perf_counter() - self.t0 - cumulative)
+
+    def mark(self, name):
+        with self._lock:
+            self.marks.append((name, time.perf_counter() - self.t0))
+
+    @contextmanager
+    def phase(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            with self._lock:
+                self.phases.append((name, start - self.t0, time.perf_counter() - start))
+
+    def report(self, top=15):
+        """(출력용 줄 목록, 저장용 dict)."""
+        with self._lock:
+            imports = dict(self.imports)
+            marks = list(self.marks)
+            phases = list(self.phases)
+        packages = {}
+        for name, (_cum, own, _at) in imports.items():
+            root = name.split(".", 1)[0]
+            packages[root] = packages.get(root, 0.0) + max(0.0, own)
+        lines = ["⏱ 시작 단계 (main.py 시작 기준 ms)"]
+        for name, start, dur in phases:
+            lines.append(f"   {name:<40}{start * 1000:>9.1f} +{dur * 1000:.1f}")
+        for name, at in marks:
+            lines.append(f"   {name:<40}{at * 1000:>9.1f}")
+        lines.append("📦 패키지별 import 자체 시간 (ms)")
+        for root, own in sorted(packages.items(), key=lambda kv: kv[1], reverse=True)[:top]:
+            lines.append(f"   {root:<40}{own * 1000:>9.1f}")
+        lines.append("📦 모듈별 import 누적 시간 (ms)")
+        for name, (cum, own, _at) in sorted(imports.items(), key=lambda kv: kv[1][0], reverse=True)[:top]:
+            lines.append(f"   {name:<40}{cum * 1000:>9.1f} (자체 {own * 1000:.1f})")
+        payload = {
+            "phases": [{"name": n, "start_ms": s * 1000, "dur_ms": d * 1000} for n, s, d in phases],
+            "marks": [{"name": n, "at_ms": at * 1000} for n, at in marks],
+            "packages_ms": {root: own * 1000 for root, own in packages.items()},
+            "imports": {
+                name: {"cumulative_ms": cum * 1000, "self_ms": own * 1000, "at_ms": at * 1000}
+                for name, (cum, own, at) in imports.items()
+            },
+        }
+        return lines, payload
+
+    def finish(self, directory, log=print):
+        """import 감시를 끝내고 결과를 출력/저장. 저장한 파일 경로를 반환."""
+        self.uninstall()
+        lines, payload = self.report()
+        for line in lines:
+            try:
+                log(line)
+            except Exception:
+                pass
+        try:
+            os.makedirs(directory, exist_ok=True)
+            path = os.path.join(directory, f"startup-{time.strftime('%Y%m%d-%H%M%S')}.json")
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(payload, f, ensure_ascii=False, indent=1)
+            return path
+        except OSError:
+            return None
+
+
+def start(t0=None):
+    """프로파일 시작. 이후 import부터 기록된다."""
+    global _profiler
+    if _profiler is None:
+        _profiler = StartupProfiler(t0).install()
+    return _profiler
+
+
+def active():
+    return _profiler
+
+
+def mark(name):
+    if _profiler is not None:
+        _profiler.mark(name)
+
+
+def phase(name):
+    if _profiler is None:
+        return _NULL_PHASE
+    return _profiler.phase(name)
+
+
+class _NullPhase:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_PHASE = _NullPhase()